@@ -57,7 +57,7 @@ setup(
                 "argmagic>=2017.1",
                 "aspwrapper>=2018.1",
                 "insanity>=2017.1",
-                "networkx>=2.3",
+                "numpy>=1.13",
                 "reldata>=2017.1",
                 "streamtologger>=2017.1"
         ],
@@ -68,5 +68,5 @@ setup(
         packages=["ftdatagen"],
         python_requires=">=3",
         url="https://github.com/phohenecker/family-tree-data-gen",
-        version="2018.1"
+        version="2026.1"
 )
@@ -29,8 +29,8 @@ __copyright__ = (
         "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
 )
 __license__ = "BSD-2-Clause"
-__version__ = "2018.1"
-__date__ = "May 28, 2018"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
 __maintainer__ = "Patrick Hohenecker"
 __email__ = "mail@paho.at"
 __status__ = "Development"
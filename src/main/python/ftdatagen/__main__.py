@@ -100,7 +100,7 @@ def main(conf: config.Config):
     streamtologger.redirect(
             os.path.join(conf.output_dir, LOG_FILE_NAME),
             print_to_screen=not conf.quiet,
-            append=False,
+            append=conf.resume or conf.extend,  # -> if a previous run is continued, then so is its log file
             header_format=LOG_FILE_HEADER
     )
     
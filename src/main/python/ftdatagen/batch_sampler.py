@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from ftdatagen import candidate_index as ci
+from ftdatagen import config
+from ftdatagen import family_tree as ft
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class BatchSampler(object):
+    """Samples many family trees at once by means of vectorized array operations.
+    
+    All family trees of a batch are grown simultaneously as rows of NumPy arrays, which specify the gender, level,
+    mother, father, and spouse of every person, and only converted into instances of :class:`family_tree.FamilyTree`
+    once they are complete. In every step, each family tree is extended by adding either a child, together with a
+    spouse, if necessary, or parents to a person that is chosen uniformly at random from all persons that this is
+    possible for without violating the constraints specified in the configuration. These persons are kept track of by a
+    :class:`candidate_index.CandidateIndex`, which is updated for the touched persons only, such that every step takes
+    constant time per family tree, regardless of its size.
+    
+    Every family tree is sampled from a random stream of its own, which is determined by a 64-bit key that is provided
+    by the caller. The random numbers are computed from the key, the index of the step, and the purpose of the number by
+    means of a hash function, rather than drawn from an RNG with a state. Therefore, a family tree depends on its key
+    only, but not on the other family trees in the same batch, which means that any family tree can be recreated
+    individually.
+    """
+    
+    BATCH_CELLS = 2 ** 20
+    """int: The maximum number of persons that space is reserved for at once, which bounds the number of family trees
+    that are grown simultaneously.
+    """
+    
+    MAX_RESTARTS = 100
+    """int: The maximum number of times that growing a family tree to a sampled target is started over."""
+    
+    _ACTION = 1
+    """int: The purpose of random numbers that decide whether parents or a child are added to a chosen person."""
+    
+    _CHOICE = 0
+    """int: The purpose of random numbers that choose a person to extend."""
+    
+    _GENDER = 2
+    """int: The purpose of random numbers that determine the genders of new persons."""
+    
+    _NUM_PURPOSES = 4
+    """int: The number of random numbers that are computed per step."""
+    
+    _STOP = 3
+    """int: The purpose of random numbers that decide whether to stop growing a family tree."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _grow(
+            cls,
+            conf: config.Config,
+            keys: np.ndarray,
+            target_sizes: np.ndarray,
+            target_relations: np.ndarray
+    ) -> typing.List[ft.FamilyTree]:
+        """Grows a batch of family trees simultaneously.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+            keys (np.ndarray): The keys of the random streams to sample the family trees from.
+            target_sizes (np.ndarray): The target size of every family tree, or ``0``, if there is none.
+            target_relations (np.ndarray): The target number of parentOf relations of every family tree, or ``0``, if
+                there is none.
+        
+        Returns:
+            list[:class:`family_tree.FamilyTree`]: The created family trees in the same order as the keys.
+        
+        Raises:
+            ValueError: If a target cannot be reached in :attr:`MAX_RESTARTS` attempts.
+        """
+        num_trees = len(keys)
+        capacity = cls.max_size(conf)
+        
+        # if a target is specified, then a family tree is not allowed to exceed the same or the maximum size
+        targeted = (target_sizes > 0) | (target_relations > 0)
+        max_sizes = np.where(target_sizes > 0, target_sizes, np.where(targeted, conf.max_tree_size, capacity))
+        
+        # the persons of all family trees, where person p of the family tree in row r is stored in cell r * capacity + p
+        # of flat arrays, which are considerably faster to index than two-dimensional ones
+        grid = (num_trees, capacity)
+        female = np.zeros(num_trees * capacity, dtype=np.bool_)
+        level = np.zeros(num_trees * capacity, dtype=np.int32)
+        mother = np.full(num_trees * capacity, ft.FamilyTree.NO_PERSON, dtype=np.int32)
+        father = np.full(num_trees * capacity, ft.FamilyTree.NO_PERSON, dtype=np.int32)
+        spouse = np.full(num_trees * capacity, ft.FamilyTree.NO_PERSON, dtype=np.int32)
+        num_children = np.zeros(num_trees * capacity, dtype=np.int32)
+        
+        # bookkeeping variables of all family trees
+        size = np.zeros(num_trees, dtype=np.int64)
+        min_level = np.zeros(num_trees, dtype=np.int32)
+        max_level = np.zeros(num_trees, dtype=np.int32)
+        num_relations = np.zeros(num_trees, dtype=np.int64)
+        steps = np.zeros(num_trees, dtype=np.uint64)
+        restarts = np.zeros(num_trees, dtype=np.int64)
+        
+        # keep track of all persons that relatives may be added to
+        candidates = ci.CandidateIndex(num_trees, capacity, conf.max_tree_depth)
+        parent_kind = ci.CandidateIndex.ANY if conf.max_branching_factor > 1 else ci.CandidateIndex.PARENTS
+        
+        def reset(rows: np.ndarray) -> None:
+            """Discards the specified family trees, and replaces them with a single person each."""
+            for persons, value in [
+                    (female, False),
+                    (level, 0),
+                    (mother, ft.FamilyTree.NO_PERSON),
+                    (father, ft.FamilyTree.NO_PERSON),
+                    (spouse, ft.FamilyTree.NO_PERSON),
+                    (num_children, 0)
+            ]:
+                persons.reshape(grid)[rows] = value
+            size[rows] = 1
+            min_level[rows] = conf.max_tree_depth
+            max_level[rows] = conf.max_tree_depth
+            num_relations[rows] = 0
+            level[rows * capacity] = conf.max_tree_depth
+            female[rows * capacity] = cls._random(keys[rows], steps[rows], cls._GENDER) > 0.5
+            steps[rows] += np.uint64(1)
+            candidates.reset(rows, conf.max_tree_depth)
+            candidates.add(rows, np.zeros(len(rows), dtype=np.int64), min_level[rows], ci.CandidateIndex.ANY)
+        
+        reset(np.arange(num_trees))
+        active = np.arange(num_trees)  # the family trees that are still growing
+        family_trees = [None] * num_trees
+        
+        while len(active) > 0:
+        
+            # randomly choose a person in every active family tree that relatives may be added to
+            choice = cls._random(keys[active], steps[active], cls._CHOICE)
+            person, kind = candidates.sample(active, choice)
+            
+            # if a family tree is about to reach its maximum size, then only adding a child to a married person is
+            # possible, which is rare enough to check all persons of the few affected family trees
+            near_full = np.flatnonzero(targeted[active] & (size[active] + 2 > max_sizes[active]))
+            if len(near_full) > 0:
+                rows = active[near_full]
+                width = int(size[rows].max())
+                limited = (max_level[rows] - min_level[rows] >= conf.max_tree_depth)[:, np.newaxis]
+                eligible = (
+                        (np.arange(width) < size[rows][:, np.newaxis]) &
+                        (size[rows] < max_sizes[rows])[:, np.newaxis] &
+                        (spouse.reshape(grid)[rows, :width] != ft.FamilyTree.NO_PERSON) &
+                        (num_children.reshape(grid)[rows, :width] < conf.max_branching_factor) &
+                        ~(limited & (level.reshape(grid)[rows, :width] == max_level[rows][:, np.newaxis]))
+                )
+                num_eligible = eligible.sum(axis=1)
+                index = np.minimum((choice[near_full] * num_eligible).astype(np.int64), num_eligible - 1)
+                chosen = np.argmax(np.cumsum(eligible, axis=1, dtype=np.int32) > index[:, np.newaxis], axis=1)
+                person[near_full] = np.where(num_eligible > 0, chosen, ft.FamilyTree.NO_PERSON)
+                kind[near_full] = np.where(num_eligible > 0, ci.CandidateIndex.CHILDREN, ci.CandidateIndex.NONE)
+            
+            # if no relatives can be added to anyone, then a family tree is complete, unless its target has not been
+            # reached, in which case it is grown from scratch
+            stuck = kind == ci.CandidateIndex.NONE
+            failed = active[stuck & targeted[active]]
+            restarts[failed] += 1
+            if np.any(restarts[failed] >= cls.MAX_RESTARTS):
+                row = failed[np.argmax(restarts[failed])]
+                if target_sizes[row] > 0:
+                    raise ValueError("Unable to create a family tree of size {}!".format(target_sizes[row]))
+                raise ValueError(
+                        "Unable to create a family tree with {} parentOf relations!".format(target_relations[row])
+                )
+            reset(failed)
+            done = active[stuck & ~targeted[active]]
+            rows = active[~stuck]
+            person = person[~stuck]
+            kind = kind[~stuck]
+            
+            # decide what to do -> if both is possible, then we randomly add either a child or parents
+            add_parents = np.where(
+                    kind == ci.CandidateIndex.ANY,
+                    cls._random(keys[rows], steps[rows], cls._ACTION) > 0.5,
+                    kind == ci.CandidateIndex.PARENTS
+            )
+            
+            # add children
+            child_rows = rows[~add_parents]
+            base = child_rows * capacity
+            current = person[~add_parents]
+            current_cell = base + current
+            child_level = level[current_cell] + 1
+            current_female = female[current_cell]
+            partner = spouse[current_cell]
+            unmarried = partner == ft.FamilyTree.NO_PERSON
+            single_rows = child_rows[unmarried]
+            new_spouse = size[single_rows]
+            new_spouse_cell = base[unmarried] + new_spouse
+            female[new_spouse_cell] = ~current_female[unmarried]
+            level[new_spouse_cell] = child_level[unmarried]
+            spouse[new_spouse_cell] = current[unmarried]
+            spouse[current_cell[unmarried]] = new_spouse
+            partner[unmarried] = new_spouse
+            size[single_rows] = new_spouse + 1
+            child = size[child_rows]
+            child_cell = base + child
+            female[child_cell] = cls._random(keys[child_rows], steps[child_rows], cls._GENDER) > 0.5
+            level[child_cell] = child_level
+            mother[child_cell] = np.where(current_female, current, partner)
+            father[child_cell] = np.where(current_female, partner, current)
+            num_children[current_cell] += 1
+            num_children[base + partner] += 1
+            size[child_rows] = child + 1
+            max_level[child_rows] = np.maximum(max_level[child_rows], child_level)
+            
+            # update the persons that relatives may be added to -> spouses always have the same children
+            candidates.add(single_rows, new_spouse, child_level[unmarried], ci.CandidateIndex.ANY)
+            candidates.add(child_rows, child, child_level, ci.CandidateIndex.CHILDREN)
+            full = num_children[current_cell] >= conf.max_branching_factor
+            if np.any(full):
+                candidates.restrict(child_rows[full], current[full], ci.CandidateIndex.CHILDREN)
+                candidates.restrict(child_rows[full], partner[full], ci.CandidateIndex.CHILDREN)
+            
+            # add parents
+            parent_rows = rows[add_parents]
+            base = parent_rows * capacity
+            current = person[add_parents]
+            current_cell = base + current
+            parent_level = level[current_cell] - 1
+            mom = size[parent_rows]
+            dad = mom + 1
+            female[base + mom] = True
+            level[base + mom] = parent_level
+            level[base + dad] = parent_level
+            spouse[base + mom] = dad
+            spouse[base + dad] = mom
+            mother[current_cell] = mom
+            father[current_cell] = dad
+            num_children[base + mom] = 1
+            num_children[base + dad] = 1
+            size[parent_rows] = dad + 1
+            min_level[parent_rows] = np.minimum(min_level[parent_rows], parent_level)
+            
+            # update the persons that relatives may be added to
+            candidates.restrict(parent_rows, current, ci.CandidateIndex.PARENTS)
+            candidates.add(parent_rows, mom, parent_level, parent_kind)
+            candidates.add(parent_rows, dad, parent_level, parent_kind)
+            
+            # stop growing family trees that have reached their targets, the maximum size, or randomly
+            num_relations[rows] += 2
+            reached = np.where(
+                    targeted[rows],
+                    (size[rows] == target_sizes[rows]) | (num_relations[rows] == target_relations[rows]),
+                    size[rows] >= conf.max_tree_size
+            )
+            if conf.stop_prob > 0:
+                reached |= ~targeted[rows] & (cls._random(keys[rows], steps[rows], cls._STOP) < conf.stop_prob)
+            steps[rows] += np.uint64(1)
+            done = np.concatenate([done, rows[reached]])
+            
+            # convert the completed family trees, and stop growing them -> the persons of all of them are copied at
+            # once, and every family tree uses a slice of the copies
+            if len(done) > 0:
+                exists = np.arange(capacity) < size[done][:, np.newaxis]
+                done_female, done_level, done_mother, done_father, done_spouse, done_num_children = [
+                        persons.reshape(grid)[done][exists]
+                        for persons in [female, level, mother, father, spouse, num_children]
+                ]
+                end = np.cumsum(size[done]).tolist()
+                for row, start, stop in zip(done.tolist(), [0] + end[:-1], end):
+                    family_trees[row] = ft.FamilyTree.from_arrays(
+                            done_female[start:stop],
+                            done_level[start:stop],
+                            done_mother[start:stop],
+                            done_father[start:stop],
+                            done_spouse[start:stop],
+                            done_num_children[start:stop],
+                            copy=False
+                    )
+                active = np.setdiff1d(active, done, assume_unique=True)
+        
+        return family_trees
+    
+    @classmethod
+    def _random(cls, keys: np.ndarray, steps: np.ndarray, purpose: int) -> np.ndarray:
+        """Computes random numbers from the random streams of several family trees.
+        
+        The numbers are computed by means of the finalizer of the SplitMix64 generator, which maps the sum of a key and
+        a multiple of the golden ratio to a 64-bit value that is indistinguishable from a random one.
+        
+        Args:
+            keys (np.ndarray): The keys of the considered random streams.
+            steps (np.ndarray): The current steps of the random streams.
+            purpose (int): The purpose of the random numbers, which distinguishes several numbers per step.
+        
+        Returns:
+            np.ndarray: The computed random numbers, which are uniformly distributed in ``[0, 1)``.
+        """
+        counter = steps * np.uint64(cls._NUM_PURPOSES) + np.uint64(purpose + 1)
+        z = keys + counter * np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = z ^ (z >> np.uint64(31))
+        
+        return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+    
+    @classmethod
+    def max_size(cls, conf: config.Config) -> int:
+        """Computes the maximum number of persons that a family tree may contain.
+        
+        A family tree keeps growing as long as it contains less than ``max_tree_size`` persons, but the last step may
+        add two of them at once, i.e., a spouse together with a child or a couple of parents. Therefore, family trees
+        may contain up to ``max_tree_size + 1`` persons, unless they are grown to a target, which never exceeds
+        ``max_tree_size``.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+        
+        Returns:
+            int: The maximum size of a family tree.
+        """
+        return conf.max_tree_size + 1
+    
+    @classmethod
+    def sample(
+            cls,
+            conf: config.Config,
+            keys: typing.Sequence[int],
+            target_sizes: typing.Sequence[int]=None,
+            target_relations: typing.Sequence[int]=None
+    ) -> typing.List[ft.FamilyTree]:
+        """Samples one family tree per provided key.
+        
+        The names of all persons in the created family trees are empty, and have to be specified by the caller, if
+        these are needed.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+            keys (list[int]): The keys of the random streams to sample the family trees from, which are unsigned 64-bit
+                integers.
+            target_sizes (list[int], optional): If provided, then every family tree is grown until it has exactly the
+                according size.
+            target_relations (list[int], optional): If provided, then every family tree is grown until it contains
+                exactly the according number of parentOf relations.
+        
+        Returns:
+            list[:class:`family_tree.FamilyTree`]: The created family trees in the same order as the keys.
+        
+        Raises:
+            ValueError: If a target cannot be reached in :attr:`MAX_RESTARTS` attempts.
+        """
+        keys = np.array(keys, dtype=np.uint64)
+        no_targets = np.zeros(len(keys), dtype=np.int64)
+        target_sizes = no_targets if target_sizes is None else np.array(target_sizes, dtype=np.int64)
+        target_relations = no_targets if target_relations is None else np.array(target_relations, dtype=np.int64)
+        
+        # grow as many family trees at once as fit into the memory reserved for that
+        batch_size = max(1, cls.BATCH_CELLS // cls.max_size(conf))
+        family_trees = []
+        for start in range(0, len(keys), batch_size):
+            family_trees.extend(
+                    cls._grow(
+                            conf,
+                            keys[start:start + batch_size],
+                            target_sizes[start:start + batch_size],
+                            target_relations[start:start + batch_size]
+                    )
+            )
+        
+        return family_trees
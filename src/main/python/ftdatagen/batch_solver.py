@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+
+import atexit
+import itertools
+import os
+import re
+import tempfile
+import typing
+
+import aspwrapper
+
+from ftdatagen import native_solver
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class BatchSolver(object):
+    """Computes the answer sets of a single program for multiple independent sets of facts by means of one solver call.
+    
+    To that end, the ``BatchSolver`` creates a namespaced version of the program, in which every atom is extended by an
+    additional first argument that identifies the set of facts, i.e., the problem, that it belongs to. As every rule
+    propagates this argument from its body to its head, problems cannot interact, and the answer set of the namespaced
+    program is just the union of the answer sets of all problems.
+    """
+    
+    PROBLEM_ID_PATTERN = "p{}"
+    """str: The pattern that is used for creating the constants that identify the individual problems."""
+    
+    PROBLEM_VAR = "PROBLEM"
+    """str: The variable that represents problem identifiers in the namespaced program."""
+    
+    _ATOM_START = re.compile(r"\b([a-z][A-Za-z0-9_]*)\s*\(")
+    """Pattern: A regex that matches the predicate and the opening parenthesis of an atom."""
+    
+    _COMMENT = re.compile(r"%.*$", re.MULTILINE)
+    """Pattern: A regex that matches comments."""
+    
+    _namespaced_programs = {}
+    """dict: Maps the paths of programs to the paths of their namespaced versions."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, solver: aspwrapper.DlvSolver):
+        """Creates a new ``BatchSolver``.
+        
+        Args:
+            solver (aspwrapper.DlvSolver): The solver that is used for evaluating namespaced programs.
+        """
+        self._solver = solver
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _namespace_program(cls, path: str) -> str:
+        """Creates the namespaced version of a program, unless this has been done before.
+        
+        The namespaced program is written to a temporary file, which is deleted as soon as the interpreter exits.
+        
+        Args:
+            path (str): The path of the program to namespace.
+        
+        Returns:
+            str: The path of the namespaced program.
+        """
+        if path not in cls._namespaced_programs:
+        
+            # load the program, and add the problem variable as first argument to every atom
+            with open(path, "r") as f:
+                text = cls._COMMENT.sub("", f.read())
+            if re.search(r"\b{}\b".format(cls.PROBLEM_VAR), text):
+                raise ValueError("The variable '{}' is used in the program already!".format(cls.PROBLEM_VAR))
+            text = cls._ATOM_START.sub(r"\1({}, ".format(cls.PROBLEM_VAR), text)
+            
+            # write the namespaced program to a temporary file
+            fd, namespaced_path = tempfile.mkstemp(suffix=".asp")
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            atexit.register(os.remove, namespaced_path)
+            
+            cls._namespaced_programs[path] = namespaced_path
+        
+        return cls._namespaced_programs[path]
+    
+    def run(self, path: str, problems: typing.Sequence[typing.Sequence]) -> typing.List[native_solver.AnswerSet]:
+        """Computes the answer sets of the specified program for multiple sets of facts.
+        
+        Args:
+            path (str): The path of the program to evaluate.
+            problems (list[list]): The sets of facts to evaluate the program for, which have to be positive literals.
+                These may be any objects that provide the attributes ``predicate``, ``terms``, and ``positive``.
+        
+        Returns:
+            list[:class:`native_solver.AnswerSet`]: The answer sets for all of the problems, in the same order.
+        
+        Raises:
+            ValueError: If any of the provided facts is a negative literal, or if any of the problems does not have an
+                answer set.
+        """
+        # add the according problem identifiers to all facts
+        facts = []
+        for problem_idx, problem in enumerate(problems):
+            problem_id = self.PROBLEM_ID_PATTERN.format(problem_idx)
+            for f in problem:
+                if not f.positive:
+                    raise ValueError("The BatchSolver supports positive facts only: '{}'!".format(f))
+                facts.append(aspwrapper.Literal(f.predicate, [problem_id] + list(f.terms)))
+        
+        # solve all problems at once
+        answer_sets = self._solver.run(self._namespace_program(path), facts)
+        if not answer_sets:
+            raise ValueError("At least one of the provided problems does not have an answer set!")
+        
+        # split the computed answer set into the answer sets of the single problems
+        literals = [set() for _ in problems]
+        for lit in itertools.chain(answer_sets[0].facts, answer_sets[0].inferences):
+            problem_idx = int(lit.terms[0][len(self.PROBLEM_ID_PATTERN.format("")):])
+            literals[problem_idx].add(native_solver.Literal(lit.predicate, lit.terms[1:], lit.positive))
+        
+        results = []
+        for problem, problem_literals in zip(problems, literals):
+            problem_facts = {native_solver.Literal(f.predicate, f.terms, f.positive) for f in problem}
+            results.append(native_solver.AnswerSet(problem_facts, problem_literals - problem_facts))
+        
+        return results
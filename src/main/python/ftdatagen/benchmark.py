@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Benchmarks the stages of the generator for a grid of tree options."""
+
+
+import collections
+import contextlib
+import itertools
+import json
+import numbers
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+from concurrent import futures
+
+import argmagic
+import insanity
+
+from argmagic import decorators
+
+from ftdatagen import config
+from ftdatagen import generator
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+APP_NAME = "run-benchmark.sh"
+"""str: The name that is displayed in the synopsis of this application."""
+
+APP_DESCRIPTION = (
+        "This is a tool for benchmarking the family tree data generator. "
+        "It measures the time per sample of every stage of the generator as well as the throughput and peak memory "
+        "usage of complete runs for a grid of tree options, and compares the results with a baseline, if provided."
+)
+"""str: The description that is displayed in this application's help text."""
+
+
+# ==================================================================================================================== #
+#  CLASS  B E N C H M A R K  C O N F I G                                                                               #
+# ==================================================================================================================== #
+
+
+class BenchmarkConfig(object):
+    """Encapsulates the user-defined configuration of a benchmark."""
+    
+    DEFAULT_BRANCHING_FACTORS = "3,4"
+    """str: Default value of :attr:`branching_factors`."""
+    
+    DEFAULT_NUM_SAMPLES = 50
+    """int: Default value of :attr:`num_samples`."""
+    
+    DEFAULT_REASONER = "native"
+    """str: Default value of :attr:`reasoner`."""
+    
+    DEFAULT_REPETITIONS = 3
+    """int: Default value of :attr:`repetitions`."""
+    
+    DEFAULT_SEED = 0
+    """int: Default value of :attr:`seed`."""
+    
+    DEFAULT_TOLERANCE = 0.1
+    """float: Default value of :attr:`tolerance`."""
+    
+    DEFAULT_TREE_DEPTHS = "4,5"
+    """str: Default value of :attr:`tree_depths`."""
+    
+    DEFAULT_TREE_SIZES = "8,16,24"
+    """str: Default value of :attr:`tree_sizes`."""
+    
+    _VALUES = re.compile(r"^\d+(,\d+)*$")
+    """Pattern: A regex that matches comma-separated lists of values."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self):
+        """Creates a new ``BenchmarkConfig`` that contains the default values for all options."""
+        self._baseline = None
+        self._branching_factors = self.DEFAULT_BRANCHING_FACTORS
+        self._num_samples = self.DEFAULT_NUM_SAMPLES
+        self._output = None
+        self._reasoner = self.DEFAULT_REASONER
+        self._repetitions = self.DEFAULT_REPETITIONS
+        self._seed = self.DEFAULT_SEED
+        self._tolerance = self.DEFAULT_TOLERANCE
+        self._tree_depths = self.DEFAULT_TREE_DEPTHS
+        self._tree_sizes = self.DEFAULT_TREE_SIZES
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @decorators.optional
+    @property
+    def baseline(self) -> str:
+        """str: The path of the results of an earlier benchmark that the results are compared with."""
+        return self._baseline
+    
+    @baseline.setter
+    def baseline(self, baseline: str) -> None:
+        self._baseline = str(baseline)
+    
+    @property
+    def branching_factors(self) -> str:
+        """str: The values of ``max_branching_factor`` to benchmark, separated by commas, e.g., ``'3,4'``."""
+        return self._branching_factors
+    
+    @branching_factors.setter
+    def branching_factors(self, branching_factors: str) -> None:
+        self._branching_factors = self._sanitize_values("branching_factors", branching_factors)
+    
+    @property
+    def num_samples(self) -> int:
+        """int: The number of samples that are created for every combination of tree options."""
+        return self._num_samples
+    
+    @num_samples.setter
+    def num_samples(self, num_samples: int) -> None:
+        insanity.sanitize_type("num_samples", num_samples, int)
+        insanity.sanitize_range("num_samples", num_samples, minimum=1)
+        self._num_samples = num_samples
+    
+    @decorators.optional
+    @property
+    def output(self) -> str:
+        """str: The path of the file that the results are written to, which may serve as baseline later on."""
+        return self._output
+    
+    @output.setter
+    def output(self, output: str) -> None:
+        self._output = str(output)
+    
+    @property
+    def reasoner(self) -> str:
+        """str: The reasoner that is used for computing inferences, either ``'matrix'`` or ``'native'``.
+        
+        Both of these run in-process, i.e., the benchmark does not depend on DLV.
+        """
+        return self._reasoner
+    
+    @reasoner.setter
+    def reasoner(self, reasoner: str) -> None:
+        reasoner = str(reasoner)
+        if reasoner not in ("matrix", "native"):
+            raise ValueError("The provided <reasoner> is not supported: '{}'!".format(reasoner))
+        self._reasoner = reasoner
+    
+    @property
+    def repetitions(self) -> int:
+        """int: The number of times that every combination of tree options is benchmarked.
+        
+        The best result of all repetitions is reported for every measure, which reduces the noise caused by other
+        processes.
+        """
+        return self._repetitions
+    
+    @repetitions.setter
+    def repetitions(self, repetitions: int) -> None:
+        insanity.sanitize_type("repetitions", repetitions, int)
+        insanity.sanitize_range("repetitions", repetitions, minimum=1)
+        self._repetitions = repetitions
+    
+    @property
+    def seed(self) -> int:
+        """int: The seed that is used for creating all samples."""
+        return self._seed
+    
+    @seed.setter
+    def seed(self, seed: int) -> None:
+        insanity.sanitize_type("seed", seed, int)
+        self._seed = seed
+    
+    @property
+    def tolerance(self) -> float:
+        """float: The relative slowdown compared with the :attr:`baseline` that is reported as regression."""
+        return self._tolerance
+    
+    @tolerance.setter
+    def tolerance(self, tolerance: numbers.Real) -> None:
+        insanity.sanitize_type("tolerance", tolerance, numbers.Real)
+        insanity.sanitize_range("tolerance", tolerance, minimum=0)
+        self._tolerance = float(tolerance)
+    
+    @property
+    def tree_depths(self) -> str:
+        """str: The values of ``max_tree_depth`` to benchmark, separated by commas, e.g., ``'4,5'``."""
+        return self._tree_depths
+    
+    @tree_depths.setter
+    def tree_depths(self, tree_depths: str) -> None:
+        self._tree_depths = self._sanitize_values("tree_depths", tree_depths)
+    
+    @property
+    def tree_sizes(self) -> str:
+        """str: The values of ``max_tree_size`` to benchmark, separated by commas, e.g., ``'8,16,24'``."""
+        return self._tree_sizes
+    
+    @tree_sizes.setter
+    def tree_sizes(self, tree_sizes: str) -> None:
+        self._tree_sizes = self._sanitize_values("tree_sizes", tree_sizes)
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _sanitize_values(cls, name: str, values: str) -> str:
+        """Checks whether the provided value of an option is a valid comma-separated list of positive integers.
+        
+        Args:
+            name (str): The name of the option.
+            values (str): The value to check.
+        
+        Returns:
+            str: The value without any spaces.
+        
+        Raises:
+            ValueError: If ``values`` is invalid.
+        """
+        values = str(values).replace(" ", "")
+        if not cls._VALUES.match(values) or any(int(v) < 1 for v in values.split(",")):
+            raise ValueError("The provided <{}> are invalid: '{}'!".format(name, values))
+        return values
+
+
+# ==================================================================================================================== #
+#  CLASS  B E N C H M A R K                                                                                            #
+# ==================================================================================================================== #
+
+
+class Benchmark(object):
+    """Benchmarks the stages of the generator for a grid of tree options.
+    
+    For every combination of ``max_tree_size``, ``max_tree_depth``, ``max_branching_factor``, and ``negative_facts``,
+    the benchmark creates the same samples from a fixed seed, and measures the time per sample of each stage of the
+    generator on its own, i.e., ``sampling``, ``dedup``, ``inference``, and ``writing``, as well as the throughput of a
+    complete run. Every combination is benchmarked in a fresh process, which allows for reporting its peak memory usage
+    (resident set size).
+    """
+    
+    MEASURES = ["sampling", "dedup", "inference", "writing", "samples_per_sec", "peak_rss"]
+    """list[str]: The measures that are reported for every combination of tree options."""
+    
+    OPTIONS = ["max_tree_size", "max_tree_depth", "max_branching_factor", "negative_facts"]
+    """list[str]: The tree options that are benchmarked."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _create_config(cls, bench_conf: BenchmarkConfig, options: typing.Dict[str, typing.Any]) -> config.Config:
+        """Creates the configuration of the generator for a single combination of tree options.
+        
+        Args:
+            bench_conf (:class:`BenchmarkConfig`): The configuration of the benchmark.
+            options (dict): The values of the tree options.
+        
+        Returns:
+            :class:`config.Config`: The created configuration.
+        """
+        conf = config.Config()
+        conf.num_samples = bench_conf.num_samples
+        conf.quiet = True
+        conf.reasoner = bench_conf.reasoner
+        conf.seed = bench_conf.seed
+        for name, value in options.items():
+            setattr(conf, name, value)
+        
+        return conf
+    
+    @classmethod
+    def _get_commit(cls) -> typing.Optional[str]:
+        """Determines the git commit that the benchmarked code belongs to.
+        
+        Returns:
+            str: The hash of the commit, or ``None``, if this cannot be determined.
+        """
+        try:
+            return subprocess.check_output(
+                    ["git", "rev-parse", "HEAD"],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=subprocess.DEVNULL
+            ).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    
+    @classmethod
+    def _measure(cls, bench_conf: BenchmarkConfig, options: typing.Dict[str, typing.Any]) -> typing.Dict[str, float]:
+        """Benchmarks a single combination of tree options.
+        
+        Args:
+            bench_conf (:class:`BenchmarkConfig`): The configuration of the benchmark.
+            options (dict): The values of the tree options.
+        
+        Returns:
+            dict[str, float]: The measures listed in :attr:`MEASURES`, where all stages are timed in seconds per sample,
+                and the peak RSS is specified in bytes.
+        """
+        conf = cls._create_config(bench_conf, options)
+        gen = generator.Generator
+        candidates = [(sample_idx, 0) for sample_idx in range(conf.num_samples)]
+        results = collections.OrderedDict()
+        
+        # sample and name the family trees of all samples
+        start = time.perf_counter()
+        family_trees = gen._sample_family_trees(conf, candidates)
+        for (sample_idx, attempt), family_tree in zip(candidates, family_trees):
+            gen._name_family_tree(conf, family_tree, sample_idx, attempt)
+        results["sampling"] = (time.perf_counter() - start) / conf.num_samples
+        
+        # check all family trees for isomorphism
+        start = time.perf_counter()
+        sample_index = tree_index.TreeIndex()
+        for family_tree in family_trees:
+            sample_index.add_canonical_form(tree_index.TreeIndex.canonical_form(family_tree))
+        results["dedup"] = (time.perf_counter() - start) / conf.num_samples
+        
+        # compute the inferences for all family trees
+        start = time.perf_counter()
+        answer_sets = [gen._run_asp_solver(conf, gen._create_facts(family_tree)) for family_tree in family_trees]
+        results["inference"] = (time.perf_counter() - start) / conf.num_samples
+        
+        # write all samples to the disk
+        with tempfile.TemporaryDirectory() as output_dir:
+            conf.output_dir = output_dir
+            start = time.perf_counter()
+            for (sample_idx, _), family_tree, data in zip(candidates, family_trees, answer_sets):
+                facts, inferences = gen._split_data(conf, sample_idx, family_tree, data)
+                gen._write_sample(conf, family_tree, facts, inferences, gen._get_sample_name(conf, sample_idx))
+            results["writing"] = (time.perf_counter() - start) / conf.num_samples
+        
+        # create a complete dataset
+        with tempfile.TemporaryDirectory() as output_dir:
+            conf.output_dir = output_dir
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                start = time.perf_counter()
+                gen.generate(conf)
+                results["samples_per_sec"] = conf.num_samples / (time.perf_counter() - start)
+        
+        # ru_maxrss is specified in kilobytes on Linux, but in bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        results["peak_rss"] = peak_rss if sys.platform == "darwin" else peak_rss * 1024
+        
+        return results
+    
+    @classmethod
+    def print_results(
+            cls,
+            results: typing.List[typing.Dict[str, typing.Any]],
+            baseline: typing.List[typing.Dict[str, typing.Any]]=None,
+            tolerance: float=0.0
+    ) -> int:
+        """Prints the results of a benchmark as a table, and compares them with a baseline, if provided.
+        
+        Args:
+            results (list[dict]): The results of the benchmark (see :meth:`run`).
+            baseline (list[dict], optional): The results of an earlier benchmark.
+            tolerance (float, optional): The relative slowdown compared with ``baseline`` that is reported as
+                regression.
+        
+        Returns:
+            int: The number of measures that have regressed compared with the baseline.
+        """
+        # index the baseline by the tree options
+        baseline = {tuple(r[o] for o in cls.OPTIONS): r for r in (baseline or [])}
+        
+        row_format = "{:>4} {:>5} {:>3} {:>5} | {:>11} {:>11} {:>11} {:>11} | {:>11} | {:>11}"
+        print(row_format.format("size", "depth", "bf", "neg", *cls.MEASURES[:-2], "samples/s", "peak RSS"))
+        num_regressions = 0
+        for r in results:
+            print(
+                    row_format.format(
+                            *[str(r[o]) for o in cls.OPTIONS],
+                            *["{:.2f}ms".format(r[m] * 1000) for m in cls.MEASURES[:-2]],
+                            "{:.1f}".format(r["samples_per_sec"]),
+                            "{:.1f}MiB".format(r["peak_rss"] / 2 ** 20)
+                    )
+            )
+            
+            # compare the results with the baseline
+            base = baseline.get(tuple(r[o] for o in cls.OPTIONS))
+            if base is None:
+                continue
+            changes = []
+            for m in cls.MEASURES:
+                if m == "samples_per_sec":  # -> the only measure where larger values are better
+                    change = base[m] / r[m] - 1
+                else:
+                    change = r[m] / base[m] - 1 if base[m] > 0 else 0.0
+                regressed = change > tolerance
+                num_regressions += regressed
+                changes.append("{:+.1%}{}".format(change, " (!)" if regressed else ""))
+            print(row_format.format("", "", "", "", *changes))
+        
+        return num_regressions
+    
+    @classmethod
+    def save(cls, bench_conf: BenchmarkConfig, results: typing.List[typing.Dict[str, typing.Any]]) -> None:
+        """Writes the results of a benchmark to :attr:`BenchmarkConfig.output`, such that they can serve as baseline.
+        
+        Besides the results, the file specifies the git commit that has been benchmarked, the versions of Python and
+        the platform, as well as the configuration of the benchmark.
+        
+        Args:
+            bench_conf (:class:`BenchmarkConfig`): The configuration of the benchmark.
+            results (list[dict]): The results of the benchmark (see :meth:`run`).
+        """
+        with open(bench_conf.output, "w") as f:
+            json.dump(
+                    collections.OrderedDict(
+                            [
+                                    ("commit", cls._get_commit()),
+                                    ("python", platform.python_version()),
+                                    ("platform", platform.platform()),
+                                    ("options", argmagic.get_config(bench_conf)),
+                                    ("results", results)
+                            ]
+                    ),
+                    f,
+                    indent=4
+            )
+    
+    @classmethod
+    def run(cls, bench_conf: BenchmarkConfig) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Runs the benchmark.
+        
+        Args:
+            bench_conf (:class:`BenchmarkConfig`): The configuration of the benchmark.
+        
+        Returns:
+            list[dict]: One dictionary per combination of tree options, which specifies both the values of these and
+                the best result of all repetitions for each measure (see :meth:`_measure`).
+        """
+        grid = itertools.product(
+                [int(v) for v in bench_conf.tree_sizes.split(",")],
+                [int(v) for v in bench_conf.tree_depths.split(",")],
+                [int(v) for v in bench_conf.branching_factors.split(",")],
+                [False, True]
+        )
+        results = []
+        for values in grid:
+            options = collections.OrderedDict(zip(cls.OPTIONS, values))
+            
+            # every repetition runs in a fresh process, such that the peak RSS refers to it alone
+            repetitions = []
+            for _ in range(bench_conf.repetitions):
+                with futures.ProcessPoolExecutor(max_workers=1) as executor:
+                    repetitions.append(executor.submit(cls._measure, bench_conf, options).result())
+            
+            # report the best result of all repetitions for every measure
+            for m in cls.MEASURES:
+                options[m] = (max if m == "samples_per_sec" else min)(r[m] for r in repetitions)
+            results.append(options)
+        
+        return results
+
+
+def main(bench_conf: BenchmarkConfig):
+
+    # run the benchmark
+    results = Benchmark.run(bench_conf)
+    
+    # load the baseline, if any, and compare the results with it
+    baseline = None
+    if bench_conf.baseline is not None:
+        with open(bench_conf.baseline) as f:
+            baseline = json.load(f)
+        print("baseline: commit {}\n".format(baseline["commit"]))
+    num_regressions = Benchmark.print_results(
+            results,
+            baseline=baseline["results"] if baseline is not None else None,
+            tolerance=bench_conf.tolerance
+    )
+    if baseline is not None:
+        print("\n{} measures regressed by more than {:.0%}".format(num_regressions, bench_conf.tolerance))
+    
+    # store the results, such that they can serve as baseline later on
+    if bench_conf.output is not None:
+        Benchmark.save(bench_conf, results)
+
+
+if __name__ == "__main__":
+    main(argmagic.parse_args(BenchmarkConfig, app_name=APP_NAME, app_description=APP_DESCRIPTION))
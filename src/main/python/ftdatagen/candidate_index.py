@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from ftdatagen import family_tree as ft
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class CandidateIndex(object):
+    """Keeps track of the persons in a batch of family trees that relatives may still be added to.
+    
+    Every person is assigned the kinds of relatives, i.e., parents and/or children, that may be added to it, and the
+    persons of every family tree that any relatives may be added to are stored in a list, which allows for sampling one
+    of them uniformly at random in constant time. Once a family tree has reached its maximum depth, parents cannot be
+    added to persons on the lowest level, and children cannot be added to persons on the highest one anymore. As the
+    lowest and the highest level of a family tree cannot change after that, the kinds of all persons on these levels are
+    restricted accordingly at this point, and persons that cannot be extended at all are removed from the list.
+    
+    All methods update many family trees at once, which are specified by their rows in the batch, together with one
+    person each. Therefore, every row must not appear more than once in the same call. Internally, person ``p`` of the
+    family tree in row ``r`` is stored in cell ``r * capacity + p`` of flat arrays, which are considerably faster to
+    index than two-dimensional ones.
+    """
+    
+    CHILDREN = 2
+    """int: The flag that indicates that children may be added to a person."""
+    
+    NONE = 0
+    """int: The kind of persons that no relatives may be added to."""
+    
+    PARENTS = 1
+    """int: The flag that indicates that parents may be added to a person."""
+    
+    ANY = PARENTS | CHILDREN
+    """int: The kind of persons that both parents and children may be added to."""
+    
+    _NOT_LISTED = -1
+    """int: The position of persons that are not part of the list of their family tree."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, num_trees: int, capacity: int, max_depth: int):
+        """Creates a new ``CandidateIndex`` for family trees that do not contain any persons yet.
+        
+        Args:
+            num_trees (int): The number of family trees in the batch.
+            capacity (int): The maximum number of persons in a family tree.
+            max_depth (int): The maximum depth of the family trees, i.e., the maximum difference between the levels of
+                any two persons, which has to be positive.
+        """
+        self._capacity = capacity
+        self._kinds = np.zeros(num_trees * capacity, dtype=np.int8)
+        self._levels = np.zeros(num_trees * capacity, dtype=np.int32)
+        self._max_depth = max_depth
+        self._max_level = np.zeros(num_trees, dtype=np.int32)
+        self._min_level = np.zeros(num_trees, dtype=np.int32)
+        self._num_persons = np.zeros(num_trees, dtype=np.int64)  # the length of each list
+        self._persons = np.zeros(num_trees * capacity, dtype=np.int32)  # the list of persons of every family tree
+        self._positions = np.full(num_trees * capacity, self._NOT_LISTED, dtype=np.int32)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _insert(self, rows: np.ndarray, cells: np.ndarray, persons: np.ndarray) -> None:
+        """Appends persons to the lists of their family trees.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+            cells (np.ndarray): The cell of the person to insert for each of the ``rows``.
+            persons (np.ndarray): The person to insert for each of the ``rows``.
+        """
+        positions = self._num_persons[rows]
+        self._persons[rows * self._capacity + positions] = persons
+        self._positions[cells] = positions
+        self._num_persons[rows] = positions + 1
+    
+    def _is_limited(self, rows: np.ndarray) -> np.ndarray:
+        """Determines which family trees have reached the maximum depth."""
+        return self._max_level[rows] - self._min_level[rows] >= self._max_depth
+    
+    def _limit(self, rows: np.ndarray) -> None:
+        """Restricts the kinds of all persons in family trees that have just reached the maximum depth.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+        """
+        width = int(self._num_persons[rows].max())
+        base = (rows * self._capacity)[:, np.newaxis]
+        listed = np.arange(width) < self._num_persons[rows][:, np.newaxis]
+        persons = self._persons[base + np.arange(width)]
+        cells = base + persons
+        kinds = self._restrict_to_levels(
+                self._kinds[cells],
+                self._levels[cells],
+                self._min_level[rows][:, np.newaxis],
+                self._max_level[rows][:, np.newaxis]
+        )
+        self._kinds[cells[listed]] = kinds[listed]
+        
+        # remove all persons that cannot be extended anymore, and retain the order of the others
+        keep = listed & (kinds != self.NONE)
+        self._positions[cells[listed & ~keep]] = self._NOT_LISTED
+        row_idx, _ = np.nonzero(keep)
+        positions = (np.cumsum(keep, axis=1) - 1)[keep]
+        persons = persons[keep]
+        self._persons[base[row_idx, 0] + positions] = persons
+        self._positions[base[row_idx, 0] + persons] = positions
+        self._num_persons[rows] = keep.sum(axis=1)
+    
+    def _remove(self, rows: np.ndarray, cells: np.ndarray) -> None:
+        """Removes persons from the lists of their family trees, and fills the gaps with the last person of each.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+            cells (np.ndarray): The cell of the person to remove for each of the ``rows``, which has to be listed.
+        """
+        base = rows * self._capacity
+        positions = self._positions[cells]
+        last = self._num_persons[rows] - 1
+        moved = self._persons[base + last]
+        self._persons[base + positions] = moved
+        self._positions[base + moved] = positions
+        self._positions[cells] = self._NOT_LISTED
+        self._num_persons[rows] = last
+    
+    @classmethod
+    def _restrict_to_levels(
+            cls,
+            kinds: typing.Union[int, np.ndarray],
+            levels: np.ndarray,
+            min_level: np.ndarray,
+            max_level: np.ndarray
+    ) -> np.ndarray:
+        """Removes parents from the kinds of persons on the lowest level and children from those on the highest one.
+        
+        Args:
+            kinds (int or np.ndarray): The kinds of the considered persons.
+            levels (np.ndarray): The levels that the persons are located on.
+            min_level (np.ndarray): The lowest level of the family tree of every person.
+            max_level (np.ndarray): The highest level of the family tree of every person.
+        
+        Returns:
+            np.ndarray: The restricted kinds.
+        """
+        return kinds & ~(cls.PARENTS * (levels == min_level) | cls.CHILDREN * (levels == max_level)).astype(np.int8)
+    
+    def add(
+            self,
+            rows: np.ndarray,
+            persons: np.ndarray,
+            levels: np.ndarray,
+            kinds: typing.Union[int, np.ndarray]
+    ) -> None:
+        """Adds new persons to the index.
+        
+        Every person in a family tree has to be added to the index, as this is used for keeping track of the lowest and
+        the highest level in the same.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+            persons (np.ndarray): The person to add for each of the ``rows``.
+            levels (np.ndarray): The level that each of the ``persons`` is located on.
+            kinds (int or np.ndarray): The kinds of relatives that may be added to the ``persons``, as combinations of
+                :attr:`PARENTS` and :attr:`CHILDREN`, regardless of the depth of the family trees.
+        """
+        cells = rows * self._capacity + persons
+        limited = self._is_limited(rows)
+        self._min_level[rows] = np.minimum(self._min_level[rows], levels)
+        self._max_level[rows] = np.maximum(self._max_level[rows], levels)
+        self._levels[cells] = levels
+        if limited.any():
+            kinds = np.where(
+                    limited,
+                    self._restrict_to_levels(kinds, levels, self._min_level[rows], self._max_level[rows]),
+                    kinds
+            ).astype(np.int8)
+        self._kinds[cells] = kinds
+        if isinstance(kinds, np.ndarray):
+            extendable = kinds != self.NONE
+            self._insert(rows[extendable], cells[extendable], persons[extendable])
+        elif kinds != self.NONE:
+            self._insert(rows, cells, persons)
+        
+        # if a family tree has just reached its maximum depth, then the kinds of all of its persons are restricted
+        reached = ~limited & self._is_limited(rows)
+        if reached.any():
+            self._limit(rows[reached])
+    
+    def reset(self, rows: np.ndarray, level: int) -> None:
+        """Discards all persons of the specified family trees.
+        
+        Args:
+            rows (np.ndarray): The family trees to reset.
+            level (int): The level that the first person of every family tree is going to be located on.
+        """
+        self._positions.reshape(len(self._num_persons), self._capacity)[rows] = self._NOT_LISTED
+        self._num_persons[rows] = 0
+        self._min_level[rows] = level
+        self._max_level[rows] = level
+    
+    def restrict(self, rows: np.ndarray, persons: np.ndarray, kind: int) -> None:
+        """Specifies that relatives of a particular kind may not be added to some persons anymore.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+            persons (np.ndarray): The person to restrict for each of the ``rows``, which has to have been added to the
+                index before.
+            kind (int): The kinds of relatives that may not be added to the persons anymore.
+        """
+        cells = rows * self._capacity + persons
+        kinds = self._kinds[cells] & ~kind
+        self._kinds[cells] = kinds
+        
+        # persons that may still be extended keep their positions in the lists, and all others are removed
+        removed = (kinds == self.NONE) & (self._positions[cells] != self._NOT_LISTED)
+        if removed.any():
+            self._remove(rows[removed], cells[removed])
+    
+    def sample(self, rows: np.ndarray, values: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Chooses one of the persons that relatives may be added to in each of the specified family trees.
+        
+        Args:
+            rows (np.ndarray): The considered family trees.
+            values (np.ndarray): A random number in ``[0, 1)`` for each of the ``rows``, which determines the chosen
+                person.
+        
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The chosen persons together with the kinds of relatives that may be added to
+                them, or :attr:`family_tree.FamilyTree.NO_PERSON` and :attr:`NONE`, if there is no such person.
+        """
+        base = rows * self._capacity
+        counts = self._num_persons[rows]
+        persons = self._persons[base + np.minimum((values * counts).astype(np.int64), counts - 1)]
+        kinds = self._kinds[base + persons]
+        
+        empty = counts == 0
+        persons[empty] = ft.FamilyTree.NO_PERSON
+        kinds[empty] = self.NONE
+        
+        return persons, kinds
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+
+import json
+import os
+import typing
+
+from ftdatagen import config
+from ftdatagen import saturation_monitor
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class Checkpoint(object):
+    """The persisted state of a generation run, which allows for resuming the same after it has been interrupted.
+    
+    A checkpoint consists of two files in the output directory of the run. The first one is an append-only text file
+    that contains the canonical forms of all samples that have been created, one per line and in order, i.e., the state
+    of the :class:`tree_index.TreeIndex` that is used for deduplication. Every line furthermore lists the hexadecimal
+    fingerprints of the candidates that have been rejected before the sample was accepted, separated by spaces, which
+    is the state of the :class:`saturation_monitor.SaturationMonitor`. The second one is a small JSON file, which is
+    replaced atomically whenever a checkpoint is saved, and stores the options that define the created dataset, the
+    total number of samples to create, the index of the next one, and the statistics that have been accumulated so far.
+    
+    The checkpoint that is saved after the last sample of a run remains in the output directory, and allows for
+    extending the dataset with additional samples that are not isomorphic to any of the existing ones later on.
+    
+    As every sample is created from an RNG of its own, which is derived from the seed and the index of the sample, this
+    is all the state that is needed for continuing a run such that it creates exactly the same dataset as an
+    uninterrupted one.
+    """
+    
+    DATASET_OPTIONS = [
+            "exhaustive",
+            "max_branching_factor",
+            "max_tree_depth",
+            "max_tree_size",
+            "negative_facts",
+            "negatives",
+            "negatives_per_positive",
+            "output_format",
+            "relations_distribution",
+            "shard_size",
+            "shared_vocabulary",
+            "size_distribution",
+            "stop_prob"
+    ]
+    """list[str]: The options that, together with the seed, define the samples in a dataset and how they are stored."""
+    
+    INDEX_FILE_NAME = "checkpoint-index.txt"
+    """str: The name of the file that stores the canonical forms of all created samples."""
+    
+    STATE_FILE_NAME = "checkpoint.json"
+    """str: The name of the file that stores the remaining state of a run."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            conf: config.Config,
+            sample_index: tree_index.TreeIndex,
+            monitor: saturation_monitor.SaturationMonitor
+    ):
+        """Creates a new ``Checkpoint`` for a generation run.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration of the run.
+            sample_index (:class:`tree_index.TreeIndex`): The index that is used for deduplicating samples in the run.
+            monitor (:class:`saturation_monitor.SaturationMonitor`): The monitor that keeps track of rejected family
+                trees in the run, which has to keep a journal of them in order to save checkpoints.
+        """
+        self._conf = conf
+        self._monitor = monitor
+        self._sample_index = sample_index
+        self._num_saved_forms = 0  # the number of canonical forms that have been written to the index file already
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def exists(self) -> bool:
+        """bool: Indicates whether the output directory contains a checkpoint."""
+        return os.path.isfile(self._state_path)
+    
+    @property
+    def _index_path(self) -> str:
+        """str: The path of the file that stores the canonical forms of all created samples."""
+        return os.path.join(self._conf.output_dir, self.INDEX_FILE_NAME)
+    
+    @property
+    def _state_path(self) -> str:
+        """str: The path of the file that stores the remaining state of a run."""
+        return os.path.join(self._conf.output_dir, self.STATE_FILE_NAME)
+    
+    #  METHODS  ########################################################################################################
+    
+    def load(self, extend: bool=False) -> typing.Tuple[int, typing.Dict[str, typing.Any]]:
+        """Restores the state of a previous run from the checkpoint in the output directory.
+        
+        This adds the canonical forms of all samples that have been created before the checkpoint was saved to the
+        sample index, restores the monitor by replaying the candidates that have been sampled for them, and sets the
+        seed as well as the number of samples in the configuration to the ones that were used in the previous run.
+        Canonical forms that have been written to the index file after the checkpoint was saved are discarded.
+        
+        Args:
+            extend (bool, optional): Indicates whether a completed run is extended, rather than an interrupted one
+                resumed. In this case, the number of samples in the configuration is interpreted as the number of
+                additional samples to create.
+        
+        Returns:
+            tuple[int, dict]: The index of the next sample to create and the statistics that have been accumulated.
+        
+        Raises:
+            ValueError: If there is no checkpoint in the output directory, if the same has been created with different
+                options than the ones in the configuration, or if a run that has not been completed is extended.
+        """
+        if not self.exists:
+            raise ValueError("There is no checkpoint in <output_dir> '{}'!".format(self._conf.output_dir))
+        
+        with open(self._state_path, "r") as f:
+            state = json.load(f)
+        
+        # make sure that the checkpoint belongs to the same dataset
+        for option in self.DATASET_OPTIONS:
+            if state["options"][option] != getattr(self._conf, option):
+                raise ValueError(
+                        "The checkpoint has been created with <{}> {}, but {} was provided!".format(
+                                option, state["options"][option], getattr(self._conf, option)
+                        )
+                )
+        self._conf.seed = state["seed"]
+        if extend:
+            if state["next_sample"] < state["num_samples"]:
+                raise ValueError(
+                        "The run in <output_dir> '{}' has not been completed yet!".format(self._conf.output_dir)
+                )
+            self._conf.num_samples += state["num_samples"]
+        else:
+            self._conf.num_samples = state["num_samples"]
+        
+        # restore the sample index and the monitor, and drop any canonical forms saved after the checkpoint
+        next_sample = state["next_sample"]
+        with open(self._index_path, "r+") as f:
+            for _ in range(next_sample):
+                form, *rejections = f.readline().split()
+                self._sample_index.add_canonical_form(form)
+                if not self._conf.exhaustive:  # -> enumerated family trees are not monitored
+                    self._monitor.restore(form, [bytes.fromhex(r) for r in rejections])
+            f.truncate(f.tell())
+        self._num_saved_forms = next_sample
+        
+        return next_sample, state["stats"]
+    
+    def save(self, next_sample: int, stats: typing.Dict[str, typing.Any]) -> None:
+        """Saves a checkpoint after all samples before the specified one have been created.
+        
+        Args:
+            next_sample (int): The index of the next sample to create.
+            stats (dict): The statistics that have been accumulated so far, which have to be JSON-serializable.
+        """
+        # append the canonical forms that have not been saved yet, and the candidates rejected before, to the index file
+        forms = self._sample_index[self._num_saved_forms:next_sample]
+        if self._conf.exhaustive:  # -> enumerated family trees are not monitored
+            rejections = [[]] * len(forms)
+        else:
+            rejections = self._monitor.pop_rejections(len(forms))
+        with open(self._index_path, "a" if self._num_saved_forms > 0 else "w") as f:
+            for form, fingerprints in zip(forms, rejections):
+                f.write(" ".join([form] + [fp.hex() for fp in fingerprints]) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._num_saved_forms = next_sample
+        
+        # atomically replace the state file
+        state = {
+                "options": {option: getattr(self._conf, option) for option in self.DATASET_OPTIONS},
+                "seed": self._conf.seed,
+                "num_samples": self._conf.num_samples,
+                "next_sample": next_sample,
+                "stats": stats
+        }
+        tmp_path = self._state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._state_path)
@@ -4,6 +4,7 @@
 import numbers
 import os
 import random
+import re
 import typing
 
 import insanity
@@ -47,9 +48,27 @@ __status__ = "Development"
 class Config(object):
     """Encapsulates the user-defined configuration."""
     
+    DEFAULT_CHECKPOINT_INTERVAL = 100
+    """int: Default value of :attr:`checkpoint_interval`."""
+    
+    DEFAULT_DLV_BATCH_SIZE = 1
+    """int: Default value of :attr:`dlv_batch_size`."""
+    
+    DEFAULT_EXHAUSTIVE = False
+    """bool: Default value of :attr:`exhaustive`."""
+    
+    DEFAULT_EXTEND = False
+    """bool: Default value of :attr:`extend`."""
+    
+    DEFAULT_INFERENCE_CACHE_SIZE = 1024
+    """int: Default value of :attr:`inference_cache_size`."""
+    
     DEFAULT_MAX_BRANCHING_FACTOR = 5
     """int: Default value of :attr:`max_branching_factor`."""
     
+    DEFAULT_MAX_REJECTION_RATE = 0.99
+    """float: Default value of :attr:`max_rejection_rate`."""
+    
     DEFAULT_MAX_TREE_DEPTH = 5
     """int: Default value of :attr:`max_tree_depth`."""
     
@@ -59,41 +78,123 @@ class Config(object):
     DEFAULT_NEGATIVE_FACTS = False
     """bool: Default value of :attr:`negative_facts`."""
     
+    DEFAULT_NEGATIVES = "all"
+    """str: Default value of :attr:`negatives`."""
+    
+    DEFAULT_NEGATIVES_PER_POSITIVE = 1
+    """int: Default value of :attr:`negatives_per_positive`."""
+    
     DEFAULT_NUM_SAMPLES = 5000
     """int: Default value of :attr:`num_samples`."""
 
     DEFAULT_OUTPUT_DIR = "./out"
     """str: Default value for :attr:`output_dir`."""
 
+    DEFAULT_OUTPUT_FORMAT = "rel-data"
+    """str: Default value for :attr:`output_format`."""
+
+    DEFAULT_PIPELINE = False
+    """bool: Default value for :attr:`pipeline`."""
+
+    DEFAULT_PROFILE = False
+    """bool: Default value for :attr:`profile`."""
+
+    DEFAULT_PROFILE_SAMPLES = 100
+    """int: Default value for :attr:`profile_samples`."""
+
+    DEFAULT_PROFILE_START = 0
+    """int: Default value for :attr:`profile_start`."""
+
     DEFAULT_QUIET = False
     """bool: Default value for :attr:`quiet`."""
+
+    DEFAULT_REASONER = "native"
+    """str: Default value for :attr:`reasoner`, if :attr:`dlv` is not specified."""
     
+    DEFAULT_RESUME = False
+    """bool: Default value for :attr:`resume`."""
+
+    DEFAULT_SHARD_SIZE = 1000
+    """int: Default value for :attr:`shard_size`."""
+
+    DEFAULT_SHARED_VOCABULARY = False
+    """bool: Default value for :attr:`shared_vocabulary`."""
+
     DEFAULT_STOP_PROB = 0.0
     """float: Default value of :attr:`stop_prob`."""
+    
+    DEFAULT_WORKERS = 1
+    """int: Default value of :attr:`workers`."""
+    
+    NEGATIVES = ["all", "hard", "none", "random"]
+    """list[str]: The strategies that may be used for including negative relations in samples."""
+    
+    OUTPUT_FORMATS = ["rel-data", "shards", "tensors"]
+    """list[str]: The formats that datasets may be written in."""
+    
+    REASONERS = ["dlv", "matrix", "native"]
+    """list[str]: The names of all reasoners that may be used for computing inferences."""
+    
+    _DISTRIBUTION = re.compile(r"^\d+(:\d+(\.\d*)?)?(,\d+(:\d+(\.\d*)?)?)*$")
+    """Pattern: A regex that matches distributions, which are specified as comma-separated pairs of value and weight."""
 
     #  CONSTRUCTOR  ####################################################################################################
 
     def __init__(self):
         """Creates a new instance of ``Config``."""
+        self._checkpoint_interval = self.DEFAULT_CHECKPOINT_INTERVAL
         self._dlv = None
+        self._dlv_batch_size = self.DEFAULT_DLV_BATCH_SIZE
+        self._exhaustive = self.DEFAULT_EXHAUSTIVE
+        self._extend = self.DEFAULT_EXTEND
+        self._inference_cache = None
+        self._inference_cache_size = self.DEFAULT_INFERENCE_CACHE_SIZE
         self._max_branching_factor = self.DEFAULT_MAX_BRANCHING_FACTOR
+        self._max_rejection_rate = self.DEFAULT_MAX_REJECTION_RATE
         self._max_tree_depth = self.DEFAULT_MAX_TREE_DEPTH
         self._max_tree_size = self.DEFAULT_MAX_TREE_SIZE
         self._negative_facts = self.DEFAULT_NEGATIVE_FACTS
+        self._negatives = self.DEFAULT_NEGATIVES
+        self._negatives_per_positive = self.DEFAULT_NEGATIVES_PER_POSITIVE
         self._num_samples = self.DEFAULT_NUM_SAMPLES
         self._output_dir = self.DEFAULT_OUTPUT_DIR
+        self._output_format = self.DEFAULT_OUTPUT_FORMAT
+        self._pipeline = self.DEFAULT_PIPELINE
+        self._profile = self.DEFAULT_PROFILE
+        self._profile_samples = self.DEFAULT_PROFILE_SAMPLES
+        self._profile_start = self.DEFAULT_PROFILE_START
         self._quiet = self.DEFAULT_QUIET
+        self._reasoner = None
+        self._relations_distribution = None
+        self._resume = self.DEFAULT_RESUME
         self._seed = random.randrange(100000)  # -> we randomly generate a default seed to ensure reproducibility
+        self._shard_size = self.DEFAULT_SHARD_SIZE
+        self._shared_vocabulary = self.DEFAULT_SHARED_VOCABULARY
+        self._size_distribution = None
         self._stop_prob = self.DEFAULT_STOP_PROB
+        self._workers = self.DEFAULT_WORKERS
 
     #  PROPERTIES  #####################################################################################################
     
+    @property
+    def checkpoint_interval(self) -> int:
+        """int: The number of samples after which a checkpoint is saved to the :attr:`output_dir`."""
+        return self._checkpoint_interval
+    
+    @checkpoint_interval.setter
+    def checkpoint_interval(self, checkpoint_interval: int) -> None:
+        insanity.sanitize_type("checkpoint_interval", checkpoint_interval, int)
+        insanity.sanitize_range("checkpoint_interval", checkpoint_interval, minimum=1)
+        self._checkpoint_interval = checkpoint_interval
+    
+    @decorators.optional
     @property
     def dlv(self) -> str:
         """str: The path to the DLV executable.
 
         DLV is an answer-set reasoner that is used for generating some of the datasets
-        (`http://www.dlvsystem.com/dlv/`_).
+        (`http://www.dlvsystem.com/dlv/`_). This is required only if :attr:`reasoner` is ``'dlv'``, which is the
+        default whenever this is specified.
         """
         return self._dlv
 
@@ -104,6 +205,81 @@ class Config(object):
             raise ValueError("The provided path <dlv> does not exist: '{}'!".format(dlv))
         self._dlv = dlv
 
+    @property
+    def dlv_batch_size(self) -> int:
+        """int: The number of samples that inferences are computed for by means of a single invocation of DLV.
+
+        If this is greater than ``1``, then the individuals of the family trees in a batch are namespaced such that
+        they cannot interact, and the inferences for all of them are computed at once. This is used only if
+        :attr:`reasoner` is ``'dlv'``.
+        """
+        return self._dlv_batch_size
+
+    @dlv_batch_size.setter
+    def dlv_batch_size(self, dlv_batch_size: int) -> None:
+        insanity.sanitize_type("dlv_batch_size", dlv_batch_size, int)
+        insanity.sanitize_range("dlv_batch_size", dlv_batch_size, minimum=1)
+        self._dlv_batch_size = dlv_batch_size
+
+    @property
+    def exhaustive(self) -> bool:
+        """bool: Specifies whether to select samples from all family trees that comply with the constraints.
+        
+        In this case, all family trees that may be sampled and are not isomorphic to each other are enumerated
+        systematically, instead of sampling them at random, and :attr:`num_samples` of them are selected uniformly at
+        random. If there are fewer than that, then the dataset contains all of them. As samples never have to be
+        rejected in this mode, it is suited for small bounds, which admit only a few different family trees.
+        Notice that :attr:`stop_prob` is ignored if this option is set.
+        """
+        return self._exhaustive
+    
+    @exhaustive.setter
+    def exhaustive(self, exhaustive: bool) -> None:
+        self._exhaustive = bool(exhaustive)
+    
+    @property
+    def extend(self) -> bool:
+        """bool: Specifies whether to add :attr:`num_samples` samples to the dataset in the :attr:`output_dir`.
+        
+        The new samples are numbered after the existing ones, and are not isomorphic to any of them. This requires the
+        checkpoint of a completed run, and uses the same :attr:`seed`, such that the extended dataset contains the same
+        samples as one that has been created by a single run. However, the names of existing samples are not changed,
+        which means that they may be padded with fewer zeros than the new ones.
+        """
+        return self._extend
+    
+    @extend.setter
+    def extend(self, extend: bool) -> None:
+        self._extend = bool(extend)
+    
+    @decorators.optional
+    @property
+    def inference_cache(self) -> str:
+        """str: The path of a database that caches the inferences computed for family trees across runs.
+        
+        Inferences are cached for the structures of family trees, including the genders of all persons, and are reused
+        for any family tree that is isomorphic to one that has been seen before, even if it belongs to a different
+        dataset. The same cache may be used by multiple runs concurrently.
+        """
+        return self._inference_cache
+    
+    @inference_cache.setter
+    def inference_cache(self, inference_cache: str) -> None:
+        self._inference_cache = str(inference_cache)
+    
+    @property
+    def inference_cache_size(self) -> int:
+        """int: The maximum size of the :attr:`inference_cache` in MB, beyond which the least recently used entries are
+        evicted.
+        """
+        return self._inference_cache_size
+    
+    @inference_cache_size.setter
+    def inference_cache_size(self, inference_cache_size: int) -> None:
+        insanity.sanitize_type("inference_cache_size", inference_cache_size, int)
+        insanity.sanitize_range("inference_cache_size", inference_cache_size, minimum=1)
+        self._inference_cache_size = inference_cache_size
+    
     @property
     def max_branching_factor(self) -> int:
         """int: The maximum number of children that any person in a family tree may have."""
@@ -115,6 +291,22 @@ class Config(object):
         insanity.sanitize_range("max_branching_factor", max_branching_factor, minimum=1)
         self._max_branching_factor = max_branching_factor
     
+    @property
+    def max_rejection_rate(self) -> float:
+        """float: The maximum fraction of sampled family trees that may be rejected for being duplicates.
+        
+        The rejection rate is computed over a sliding window of the most recent candidates, and the generator stops
+        with an error, which reports an estimate of how many different family trees remain, once this is exceeded.
+        A value of ``1`` disables this check.
+        """
+        return self._max_rejection_rate
+    
+    @max_rejection_rate.setter
+    def max_rejection_rate(self, max_rejection_rate: numbers.Real) -> None:
+        insanity.sanitize_type("max_rejection_rate", max_rejection_rate, numbers.Real)
+        insanity.sanitize_range("max_rejection_rate", max_rejection_rate, minimum=0, maximum=1, min_inclusive=False)
+        self._max_rejection_rate = float(max_rejection_rate)
+    
     @property
     def max_tree_depth(self) -> int:
         """int: The maximum depth that a family tree may have."""
@@ -128,7 +320,11 @@ class Config(object):
     
     @property
     def max_tree_size(self) -> int:
-        """int: The maximum number of people that may appear in a family tree."""
+        """int: The number of people that a family tree is extended up to.
+        
+        As the last step may add two people at once, family trees may contain one more than this (see
+        :meth:`batch_sampler.BatchSampler.max_size`).
+        """
         return self._max_tree_size
     
     @max_tree_size.setter
@@ -139,12 +335,50 @@ class Config(object):
     
     @property
     def negative_facts(self) -> bool:
-        """bool: Specifies whether to include negative parentOf relations as facts."""
+        """bool: Specifies whether to include negative parentOf relations as facts.
+        
+        The negative parentOf relations are the ones that are included according to :attr:`negatives`, which means that
+        this cannot be combined with ``'none'``.
+        """
         return self._negative_facts
     
     @negative_facts.setter
     def negative_facts(self, negative_facts: bool) -> None:
         self._negative_facts = bool(negative_facts)
+    
+    @property
+    def negatives(self) -> str:
+        """str: Specifies which negative relations to include in the samples, either ``'all'``, ``'hard'``, ``'none'``,
+        or ``'random'``.
+        
+        By default, all negative relations that follow from the closed-world assumption of the ontology are included,
+        the number of which grows quadratically with the size of a family tree. With ``'none'``, negative relations are
+        implicit, i.e., only positive relations are stored, and everything else is supposed to be false. ``'random'``
+        and ``'hard'`` include :attr:`negatives_per_positive` sampled negative relations for every positive one, where
+        ``'hard'`` prefers negatives among persons that are related in some other way.
+        """
+        return self._negatives
+    
+    @negatives.setter
+    def negatives(self, negatives: str) -> None:
+        negatives = str(negatives)
+        if negatives not in self.NEGATIVES:
+            raise ValueError("The provided <negatives> are not supported: '{}'!".format(negatives))
+        self._negatives = negatives
+    
+    @property
+    def negatives_per_positive(self) -> int:
+        """int: The number of negative relations that are sampled for every positive one.
+        
+        This is considered only if :attr:`negatives` is ``'hard'`` or ``'random'``.
+        """
+        return self._negatives_per_positive
+    
+    @negatives_per_positive.setter
+    def negatives_per_positive(self, negatives_per_positive: int) -> None:
+        insanity.sanitize_type("negatives_per_positive", negatives_per_positive, int)
+        insanity.sanitize_range("negatives_per_positive", negatives_per_positive, minimum=1)
+        self._negatives_per_positive = negatives_per_positive
 
     @property
     def num_samples(self) -> typing.Union[int, None]:
@@ -166,6 +400,75 @@ class Config(object):
     def output_dir(self, output_dir: str) -> None:
         self._output_dir = str(output_dir)
 
+    @property
+    def output_format(self) -> str:
+        """str: The format that the dataset is written in, either ``'rel-data'``, ``'shards'``, or ``'tensors'``.
+
+        While ``'rel-data'`` writes every sample as a set of text files in the rel-data format, ``'shards'`` packs the
+        same files into tar archives of :attr:`shard_size` samples each (see :class:`shard_archive.ShardReader`), and
+        ``'tensors'`` writes the entire dataset as a few binary arrays, which can be memory-mapped by data loaders (see
+        :class:`tensor_export.TensorReader`).
+        """
+        return self._output_format
+
+    @output_format.setter
+    def output_format(self, output_format: str) -> None:
+        output_format = str(output_format)
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError("The provided <output_format> is not supported: '{}'!".format(output_format))
+        self._output_format = output_format
+
+    @property
+    def pipeline(self) -> bool:
+        """bool: Specifies whether to run sampling, inference, and writing concurrently as stages of a pipeline.
+
+        The stages run in threads of the same process, which means that they overlap only while one of them is waiting,
+        e.g., for DLV. Therefore, this speeds up runs that use the :attr:`reasoner` ``'dlv'`` only, whereas the
+        in-process reasoners are CPU-bound, and should be sped up by means of multiple :attr:`workers` instead. This is
+        ignored if more than one worker is used, and cannot be combined with :attr:`profile` otherwise.
+        """
+        return self._pipeline
+
+    @pipeline.setter
+    def pipeline(self, pipeline: bool) -> None:
+        self._pipeline = bool(pipeline)
+
+    @property
+    def profile(self) -> bool:
+        """bool: Specifies whether to profile the CPU time and memory usage of a window of samples.
+
+        The window consists of :attr:`profile_samples` samples, and starts after :attr:`profile_start` samples have
+        been created. The profiles are written to the :attr:`output_dir`. If more than one worker is used, then only
+        the main process, which samples and deduplicates family trees, is profiled.
+        """
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: bool) -> None:
+        self._profile = bool(profile)
+
+    @property
+    def profile_samples(self) -> int:
+        """int: The number of samples that are profiled, if :attr:`profile` is set."""
+        return self._profile_samples
+
+    @profile_samples.setter
+    def profile_samples(self, profile_samples: int) -> None:
+        insanity.sanitize_type("profile_samples", profile_samples, int)
+        insanity.sanitize_range("profile_samples", profile_samples, minimum=1)
+        self._profile_samples = profile_samples
+
+    @property
+    def profile_start(self) -> int:
+        """int: The number of samples that are created in a run before profiling starts, if :attr:`profile` is set."""
+        return self._profile_start
+
+    @profile_start.setter
+    def profile_start(self, profile_start: int) -> None:
+        insanity.sanitize_type("profile_start", profile_start, int)
+        insanity.sanitize_range("profile_start", profile_start, minimum=0)
+        self._profile_start = profile_start
+
     @property
     def quiet(self) -> bool:
         """bool: Tells the application to be 'quiet'."""
@@ -175,10 +478,69 @@ class Config(object):
     def quiet(self, quiet: bool) -> None:
         self._quiet = bool(quiet)
 
+    @property
+    def reasoner(self) -> str:
+        """str: The reasoner that is used for computing inferences, either ``'dlv'``, ``'matrix'``, or ``'native'``.
+
+        While ``'dlv'`` launches the external DLV system for every sample, ``'native'`` evaluates the ontology
+        in-process, and does not require DLV to be installed. ``'matrix'`` computes the same inferences by means of
+        vectorized boolean matrix operations, which is considerably faster for large family trees, but has the ontology
+        hard-coded rather than reading it from ``ontology.asp``.
+
+        By default, ``'dlv'`` is used if the path of the :attr:`dlv` executable is specified, and ``'native'``
+        otherwise.
+        """
+        if self._reasoner is None:
+            return "dlv" if self._dlv is not None else self.DEFAULT_REASONER
+        return self._reasoner
+
+    @reasoner.setter
+    def reasoner(self, reasoner: str) -> None:
+        reasoner = str(reasoner)
+        if reasoner not in self.REASONERS:
+            raise ValueError("The provided <reasoner> is not supported: '{}'!".format(reasoner))
+        self._reasoner = reasoner
+
+    @decorators.optional
+    @property
+    def relations_distribution(self) -> str:
+        """str: The distribution of the number of parentOf relations per sample, e.g., ``'4:1,8:2'``.
+        
+        The distribution is specified as comma-separated pairs of number of relations and weight, where weights may be
+        omitted, in which case they default to ``1``. If this is provided, then the number of relations is sampled for
+        every family tree first, and the family tree is grown until it contains exactly as many parentOf relations.
+        Since every child that is added (with both parents) adds two parentOf relations, all numbers have to be even.
+        """
+        return self._relations_distribution
+    
+    @relations_distribution.setter
+    def relations_distribution(self, relations_distribution: str) -> None:
+        relations_distribution = str(relations_distribution).replace(" ", "")
+        if not self._DISTRIBUTION.match(relations_distribution):
+            raise ValueError("The provided <relations_distribution> is invalid: '{}'!".format(relations_distribution))
+        self._relations_distribution = relations_distribution
+    
+    @property
+    def resume(self) -> bool:
+        """bool: Specifies whether to resume an interrupted run from the last checkpoint in the :attr:`output_dir`.
+
+        In this case, the :attr:`seed` and :attr:`num_samples` of the interrupted run are used, and the created dataset
+        is identical to the one that an uninterrupted run would have created.
+        """
+        return self._resume
+
+    @resume.setter
+    def resume(self, resume: bool) -> None:
+        self._resume = bool(resume)
+
     @decorators.optional
     @property
     def seed(self) -> int:
-        """int: The seed that is used to initialize the used RNG."""
+        """int: The seed that is used to initialize the used RNG.
+
+        Every sample is created by means of an RNG of its own, which is derived from this seed and the index of the
+        sample. Therefore, the created dataset only depends on the seed, and not on the number of :attr:`workers`.
+        """
         return self._seed
 
     @seed.setter
@@ -186,9 +548,56 @@ class Config(object):
         insanity.sanitize_type("seed", seed, int)
         self._seed = seed
     
+    @property
+    def shard_size(self) -> int:
+        """int: The number of samples per shard, if the :attr:`output_format` is ``'shards'``."""
+        return self._shard_size
+    
+    @shard_size.setter
+    def shard_size(self, shard_size: int) -> None:
+        insanity.sanitize_type("shard_size", shard_size, int)
+        insanity.sanitize_range("shard_size", shard_size, minimum=1)
+        self._shard_size = shard_size
+    
+    @property
+    def shared_vocabulary(self) -> bool:
+        """bool: Specifies whether to write the vocabulary once per dataset rather than once per sample.
+        
+        In this case, the classes and relations are written to a separate knowledge graph named ``'vocabulary'``, which
+        does not contain any individuals, and the samples reference these by their indices only. This is ignored if
+        the :attr:`output_format` is ``'tensors'``, which always stores the vocabulary once.
+        """
+        return self._shared_vocabulary
+    
+    @shared_vocabulary.setter
+    def shared_vocabulary(self, shared_vocabulary: bool) -> None:
+        self._shared_vocabulary = bool(shared_vocabulary)
+    
+    @decorators.optional
+    @property
+    def size_distribution(self) -> str:
+        """str: The distribution of the sizes of the family trees, e.g., ``'6:1,8:2'``.
+        
+        The distribution is specified as comma-separated pairs of tree size and weight, where weights may be omitted,
+        in which case they default to ``1``. If this is provided, then the size is sampled for every family tree first,
+        and the family tree is grown until it has exactly this size. Therefore, the sizes of the created family trees
+        follow this distribution, and :attr:`stop_prob` is ignored.
+        """
+        return self._size_distribution
+    
+    @size_distribution.setter
+    def size_distribution(self, size_distribution: str) -> None:
+        size_distribution = str(size_distribution).replace(" ", "")
+        if not self._DISTRIBUTION.match(size_distribution):
+            raise ValueError("The provided <size_distribution> is invalid: '{}'!".format(size_distribution))
+        self._size_distribution = size_distribution
+    
     @property
     def stop_prob(self) -> float:
-        """float: The probability of stopping to further extend a family tree after a person has been added."""
+        """float: The probability of stopping to further extend a family tree after a person has been added.
+        
+        This is ignored if either :attr:`size_distribution` or :attr:`relations_distribution` is specified.
+        """
         return self._stop_prob
     
     @stop_prob.setter
@@ -196,3 +605,14 @@ class Config(object):
         insanity.sanitize_type("stop_prob", stop_prob, numbers.Real)
         insanity.sanitize_range("stop_prob", stop_prob, minimum=0, maximum=1, max_inclusive=False)
         self._stop_prob = float(stop_prob)
+
+    @property
+    def workers(self) -> int:
+        """int: The number of worker processes that are used for creating samples in parallel."""
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int) -> None:
+        insanity.sanitize_type("workers", workers, int)
+        insanity.sanitize_range("workers", workers, minimum=1)
+        self._workers = workers
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+import numpy as np
+
+from ftdatagen import person
+from ftdatagen import person_factory as pf
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class FamilyTree(object):
+    """A family tree that is stored as a struct of arrays.
+    
+    Every person in a ``FamilyTree`` is identified by its position, i.e., an index in ``[0, len(tree))``, and the
+    persons' relations are stored in NumPy arrays, which specify the mother, father, and spouse of each person as well
+    as the levels in the tree that they are located on, with :attr:`NO_PERSON` indicating that there is no such
+    relative. The genders of all persons are stored in a boolean array. Persons may be accessed by means of lightweight
+    views (see :class:`PersonView`), but, in contrast to instances of :class:`person.Person`, a ``FamilyTree`` does not
+    depend on a data context, and can thus be created and passed around freely. The according individuals are only
+    created, by means of :meth:`to_persons`, when a sample is written.
+    """
+    
+    DEFAULT_CAPACITY = 32
+    """int: The default number of persons that space is reserved for when a ``FamilyTree`` is created."""
+    
+    NO_PERSON = -1
+    """int: The value that indicates missing relatives in the arrays of a ``FamilyTree``."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, capacity: int=DEFAULT_CAPACITY):
+        """Creates a new empty ``FamilyTree``.
+        
+        Args:
+            capacity (int, optional): The number of persons to reserve space for. If more persons are added, then the
+                arrays are enlarged automatically.
+        """
+        self._father = np.full(capacity, self.NO_PERSON, dtype=np.int32)
+        self._female = np.zeros(capacity, dtype=np.bool_)
+        self._level = np.zeros(capacity, dtype=np.int32)
+        self._mother = np.full(capacity, self.NO_PERSON, dtype=np.int32)
+        self._names = []
+        self._num_children = np.zeros(capacity, dtype=np.int32)
+        self._size = 0
+        self._spouse = np.full(capacity, self.NO_PERSON, dtype=np.int32)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index: int) -> "PersonView":
+        if not 0 <= index < self._size:
+            raise IndexError("There is no person with index {} in the family tree!".format(index))
+        return PersonView(self, index)
+    
+    def __iter__(self) -> typing.Iterator["PersonView"]:
+        return (PersonView(self, i) for i in range(self._size))
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def father(self) -> np.ndarray:
+        """np.ndarray: The index of the father of every person, or :attr:`NO_PERSON`."""
+        return self._father[:self._size]
+    
+    @property
+    def female(self) -> np.ndarray:
+        """np.ndarray: A boolean array that indicates which persons are female."""
+        return self._female[:self._size]
+    
+    @property
+    def level(self) -> np.ndarray:
+        """np.ndarray: The level in the family tree that every person is located on."""
+        return self._level[:self._size]
+    
+    @property
+    def mother(self) -> np.ndarray:
+        """np.ndarray: The index of the mother of every person, or :attr:`NO_PERSON`."""
+        return self._mother[:self._size]
+    
+    @property
+    def names(self) -> typing.List[str]:
+        """list[str]: The names of all persons in the family tree."""
+        return self._names
+    
+    @names.setter
+    def names(self, names: typing.List[str]) -> None:
+        if len(names) != self._size:
+            raise ValueError("There have to be exactly {} names, but {} were provided!".format(self._size, len(names)))
+        self._names = list(names)
+    
+    @property
+    def num_children(self) -> np.ndarray:
+        """np.ndarray: The number of children of every person."""
+        return self._num_children[:self._size]
+    
+    @property
+    def spouse(self) -> np.ndarray:
+        """np.ndarray: The index of the spouse of every person, or :attr:`NO_PERSON`."""
+        return self._spouse[:self._size]
+    
+    #  METHODS  ########################################################################################################
+    
+    def _grow(self) -> None:
+        """Doubles the capacity of all arrays."""
+        capacity = max(2 * len(self._female), 1)
+        for name in ["_father", "_mother", "_spouse"]:
+            values = np.full(capacity, self.NO_PERSON, dtype=np.int32)
+            values[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, values)
+        for name in ["_female", "_level", "_num_children"]:
+            values = np.zeros(capacity, dtype=getattr(self, name).dtype)
+            values[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, values)
+    
+    def add_child(self, child: int, mother: int, father: int) -> None:
+        """Specifies the parents of a person.
+        
+        Args:
+            child (int): The index of the person to specify the parents of.
+            mother (int): The index of the child's mother.
+            father (int): The index of the child's father.
+        """
+        self._mother[child] = mother
+        self._father[child] = father
+        self._num_children[mother] += 1
+        self._num_children[father] += 1
+    
+    def add_person(self, name: str, female: bool, level: int) -> int:
+        """Adds a new person without any relatives to the family tree.
+        
+        Args:
+            name (str): The name of the person.
+            female (bool): Indicates whether the person is female.
+            level (int): The level in the family tree that the person is located on.
+        
+        Returns:
+            int: The index of the added person.
+        """
+        if self._size == len(self._female):
+            self._grow()
+        
+        index = self._size
+        self._female[index] = female
+        self._level[index] = level
+        self._names.append(name)
+        self._size += 1
+        
+        return index
+    
+    def children(self, index: int) -> np.ndarray:
+        """Determines the children of a person.
+        
+        Args:
+            index (int): The index of the considered person.
+        
+        Returns:
+            np.ndarray: The indices of the person's children in ascending order.
+        """
+        return np.flatnonzero((self.mother == index) | (self.father == index))
+    
+    def copy(self) -> "FamilyTree":
+        """Creates a copy of the family tree, which can be modified independently of the same.
+        
+        Returns:
+            :class:`FamilyTree`: The created copy.
+        """
+        tree = FamilyTree(capacity=0)
+        for name in ["_father", "_female", "_level", "_mother", "_num_children", "_spouse"]:
+            setattr(tree, name, getattr(self, name).copy())
+        tree._names = self._names[:]
+        tree._size = self._size
+        
+        return tree
+    
+    @classmethod
+    def from_arrays(
+            cls,
+            female: np.ndarray,
+            level: np.ndarray,
+            mother: np.ndarray,
+            father: np.ndarray,
+            spouse: np.ndarray,
+            num_children: np.ndarray,
+            copy: bool=True
+    ) -> "FamilyTree":
+        """Creates a family tree from arrays that specify all persons and their relatives.
+        
+        By default, the provided arrays are copied, and the names of the persons in the created family tree are empty,
+        which means that they have to be specified by means of :attr:`names`, if these are needed.
+        
+        Args:
+            female (np.ndarray): A boolean array that indicates which persons are female.
+            level (np.ndarray): The level in the family tree that every person is located on.
+            mother (np.ndarray): The index of the mother of every person, or :attr:`NO_PERSON`.
+            father (np.ndarray): The index of the father of every person, or :attr:`NO_PERSON`.
+            spouse (np.ndarray): The index of the spouse of every person, or :attr:`NO_PERSON`.
+            num_children (np.ndarray): The number of children of every person.
+            copy (bool, optional): If ``False``, then the arrays are used as they are, which requires them to be of the
+                right types already, and means that they must not be used by the caller anymore.
+        
+        Returns:
+            :class:`FamilyTree`: The created family tree.
+        """
+        tree = cls.__new__(cls)  # -> the arrays are not allocated by the constructor
+        tree._father = father.astype(np.int32, copy=copy)
+        tree._female = female.astype(np.bool_, copy=copy)
+        tree._level = level.astype(np.int32, copy=copy)
+        tree._mother = mother.astype(np.int32, copy=copy)
+        tree._names = [""] * len(female)
+        tree._num_children = num_children.astype(np.int32, copy=copy)
+        tree._size = len(female)
+        tree._spouse = spouse.astype(np.int32, copy=copy)
+        
+        return tree
+    
+    def marry(self, first: int, second: int) -> None:
+        """Specifies two persons to be married.
+        
+        Args:
+            first (int): The index of the first spouse.
+            second (int): The index of the second spouse.
+        """
+        self._spouse[first] = second
+        self._spouse[second] = first
+    
+    def to_persons(self) -> typing.List[person.Person]:
+        """Creates the instances of :class:`person.Person` that represent the persons in the family tree.
+        
+        The created persons are individuals of the current data context, and are linked in the same way as the persons
+        in the family tree.
+        
+        Returns:
+            list[:class:`person.Person`]: The created persons in the same order as they appear in the family tree.
+        """
+        persons = [
+                pf.PersonFactory.create_person(int(level), female=bool(female), name=name)
+                for name, female, level in zip(self._names, self.female, self.level)
+        ]
+        for p, spouse, mother, father in zip(persons, self.spouse, self.mother, self.father):
+            if spouse != self.NO_PERSON:
+                p.married_to = persons[spouse]
+            if mother != self.NO_PERSON:
+                for parent in (persons[mother], persons[father]):
+                    p.parents.append(parent)
+                    parent.children.append(p)
+        
+        return persons
+
+
+class PersonView(object):
+    """A lightweight view of a single person in a :class:`FamilyTree`."""
+    
+    __slots__ = ("_index", "_tree")
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, tree: FamilyTree, index: int):
+        """Creates a new ``PersonView``.
+        
+        Args:
+            tree (:class:`FamilyTree`): The family tree that the viewed person belongs to.
+            index (int): The index of the viewed person.
+        """
+        self._index = index
+        self._tree = tree
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PersonView) and self._tree is other._tree and self._index == other._index
+    
+    def __hash__(self) -> int:
+        return hash((id(self._tree), self._index))
+    
+    def __str__(self) -> str:
+        return "PersonView(index = {:d}, name = '{}')".format(self._index, self.name)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def children(self) -> typing.List["PersonView"]:
+        """list[:class:`PersonView`]: All children of the person."""
+        return [PersonView(self._tree, int(i)) for i in self._tree.children(self._index)]
+    
+    @property
+    def female(self) -> bool:
+        """bool: Indicates whether the person is female."""
+        return bool(self._tree.female[self._index])
+    
+    @property
+    def index(self) -> int:
+        """int: The index of the person in the family tree."""
+        return self._index
+    
+    @property
+    def married_to(self) -> typing.Optional["PersonView"]:
+        """:class:`PersonView`: The spouse of the person, if there is one."""
+        spouse = int(self._tree.spouse[self._index])
+        return None if spouse == FamilyTree.NO_PERSON else PersonView(self._tree, spouse)
+    
+    @property
+    def name(self) -> str:
+        """str: The name of the person."""
+        return self._tree.names[self._index]
+    
+    @property
+    def parents(self) -> typing.List["PersonView"]:
+        """list[:class:`PersonView`]: The parents of the person, i.e., mother and father, if these are known."""
+        mother = int(self._tree.mother[self._index])
+        if mother == FamilyTree.NO_PERSON:
+            return []
+        return [PersonView(self._tree, mother), PersonView(self._tree, int(self._tree.father[self._index]))]
+    
+    @property
+    def tree_level(self) -> int:
+        """int: The level in the family tree that the person is located on."""
+        return int(self._tree.level[self._index])
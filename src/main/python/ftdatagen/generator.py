@@ -1,13 +1,19 @@
 # -*- coding: utf-8 -*-
 
 
+import collections
+import hashlib
 import math
+import operator
+import os
 import random
+import tempfile
 import time
 import typing
 
+from concurrent import futures
+
 import aspwrapper
-import networkx as nx
 
 from reldata import data_context as dc
 from reldata.data import class_membership
@@ -17,9 +23,26 @@ from reldata.io import kg_writer
 from reldata.vocab import class_type_factory as ctf
 from reldata.vocab import relation_type_factory as rtf
 
+from ftdatagen import batch_sampler
+from ftdatagen import batch_solver
+from ftdatagen import checkpoint
 from ftdatagen import config
-from ftdatagen import person
+from ftdatagen import family_tree as ft
+from ftdatagen import inference_cache
+from ftdatagen import matrix_solver
+from ftdatagen import native_solver
+from ftdatagen import negative_sampler
 from ftdatagen import person_factory as pf
+from ftdatagen import pipeline
+from ftdatagen import run_profiler
+from ftdatagen import run_report
+from ftdatagen import run_stats as rs
+from ftdatagen import sample
+from ftdatagen import saturation_monitor
+from ftdatagen import shard_archive
+from ftdatagen import tensor_export
+from ftdatagen import tree_enumerator
+from ftdatagen import tree_index
 
 
 __author__ = "Patrick Hohenecker"
@@ -104,6 +127,32 @@ class Generator(object):
     ONTOLOGY_PATH = "src/main/asp/ontology.asp"
     """str: The path of the answer set program that specifies the used ontology."""
     
+    PIPELINE_QUEUE_SIZE = 8
+    """int: The maximum number of samples (or batches of samples) that are waiting for any stage of the pipeline."""
+    
+    SAMPLING_BATCH_SIZE = 256
+    """int: The maximum number of candidates that are sampled at once."""
+    
+    SAMPLES_PER_WORKER = 4
+    """int: The number of samples per worker process that are processed concurrently when generating in parallel."""
+    
+    VOCABULARY_NAME = "vocabulary"
+    """str: The base name of the files that store the vocabulary of a dataset, if this is shared by all samples."""
+    
+    _inference_cache = None
+    """tuple: The process ID, the path, and the :class:`inference_cache.InferenceCache` that is used by this process."""
+    
+    _ontology_digest = None
+    """str: A digest of the file :attr:`ONTOLOGY_PATH`, which is computed once per process."""
+    
+    _sample_file_suffixes = None
+    """dict[bool, list[str]]: The suffixes of the names of the files that are written for every sample, depending on
+    whether a shared vocabulary is used, which are determined once per process (see :meth:`_get_sample_files`).
+    """
+    
+    _vocabulary = None
+    """tuple[dict, dict]: The class and relation types of the vocabulary, which are created once per process."""
+    
     #  CONSTRUCTOR  ####################################################################################################
     
     def __init__(self):
@@ -111,6 +160,730 @@ class Generator(object):
     
     #  METHODS  ########################################################################################################
     
+    @classmethod
+    def _build_sample(
+            cls,
+            conf: config.Config,
+            sample_idx: int,
+            family_tree: ft.FamilyTree,
+            timings: typing.Dict[str, float],
+            data: aspwrapper.AnswerSet=None
+    ) -> sample.Sample:
+        """Computes all inferences for the provided family tree, and assembles the according sample in memory.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample to build.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to build the sample for.
+            timings (dict[str, float]): The timings of all stages that have been completed already, which is updated
+                by this method.
+            data (aspwrapper.AnswerSet, optional): The inferences for the family tree, if these have been computed
+                already.
+        
+        Returns:
+            :class:`sample.Sample`: The created sample.
+        """
+        # run ASP solver to compute all inferences, unless this has been done already
+        if data is None:
+            start = time.time()
+            data = cls._run_asp_solver(conf, cls._create_facts(family_tree))
+            timings["inference"] = time.time() - start
+        
+        # assemble the sample
+        facts, inferences = cls._split_data(conf, sample_idx, family_tree, data)
+        with dc.DataContext():
+            return sample.Sample(
+                    sample_idx,
+                    cls._get_sample_name(conf, sample_idx),
+                    family_tree,
+                    facts,
+                    inferences,
+                    cls._create_knowledge_graph(family_tree, facts, inferences)
+            )
+    
+    @classmethod
+    def _check_config(cls, conf: config.Config) -> None:
+        """Checks whether the provided configuration can be used for creating a dataset.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration to check.
+        
+        Raises:
+            ValueError: If the DLV system is supposed to be used, but its path has not been specified, or vice versa,
+                if a run is supposed to be both resumed and extended, if a pipeline is supposed to be profiled, if
+                negative facts are requested without any negatives, or if a target distribution contains values that
+                cannot be reached.
+        """
+        if conf.reasoner == "dlv" and conf.dlv is None:
+            raise ValueError("The path of the DLV executable has to be specified in order to use <reasoner> 'dlv'!")
+        if conf.reasoner != "dlv" and conf.dlv is not None:
+            raise ValueError(
+                    "The path of the DLV executable is specified, but <reasoner> is '{}'!".format(conf.reasoner)
+            )
+        if conf.resume and conf.extend:
+            raise ValueError("The options <resume> and <extend> cannot be used together!")
+        if conf.profile and conf.pipeline and conf.workers == 1:
+            # cProfile only records the thread that it is enabled in, which would miss most stages of the pipeline
+            raise ValueError("The options <profile> and <pipeline> cannot be used together!")
+        if conf.negative_facts and conf.negatives == "none":
+            raise ValueError("The option <negative_facts> cannot be used with <negatives> 'none'!")
+        if conf.size_distribution is not None and conf.relations_distribution is not None:
+            raise ValueError("The options <size_distribution> and <relations_distribution> cannot be used together!")
+        if conf.size_distribution is not None:
+            for size in cls._parse_distribution(conf.size_distribution)[0]:
+                if not 3 <= size <= conf.max_tree_size:
+                    raise ValueError("The <size_distribution> contains the invalid tree size {}!".format(size))
+        if conf.relations_distribution is not None:
+            for num_relations in cls._parse_distribution(conf.relations_distribution)[0]:
+                if num_relations % 2 != 0 or not 2 <= num_relations <= 2 * (conf.max_tree_size - 2):
+                    raise ValueError(
+                            "The <relations_distribution> contains the invalid number of relations {}!".format(
+                                    num_relations
+                            )
+                    )
+    
+    @classmethod
+    def _check_saturation(
+            cls,
+            conf: config.Config,
+            monitor: saturation_monitor.SaturationMonitor,
+            sample_idx: int
+    ) -> None:
+        """Checks whether the rate of rejected candidates is acceptable.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            monitor (:class:`saturation_monitor.SaturationMonitor`): The monitor that all sampled candidates have been
+                recorded by.
+            sample_idx (int): The index of the sample that is currently being created.
+        
+        Raises:
+            RuntimeError: If the rate of rejected candidates exceeds :attr:`config.Config.max_rejection_rate`.
+        """
+        if monitor.is_saturated(conf.max_rejection_rate):
+            raise RuntimeError(
+                    "Sampling is saturated after {} of {} samples: {:.1%} of the most recent candidates were "
+                    "isomorphic to samples created before, which exceeds <max_rejection_rate> {}! An estimated {} or "
+                    "more further family trees can be sampled -> consider <exhaustive> or less strict bounds.".format(
+                            sample_idx,
+                            conf.num_samples,
+                            monitor.rejection_rate,
+                            conf.max_rejection_rate,
+                            round(monitor.estimate_num_trees() - monitor.num_trees)
+                    )
+            )
+    
+    @classmethod
+    def _create_batch(
+            cls,
+            conf: config.Config,
+            batch: typing.List[typing.Tuple[int, typing.Union[int, str]]],
+            process: typing.Callable,
+            dedup: typing.List[float]=None
+    ) -> typing.List[typing.Tuple[int, typing.Any]]:
+        """Creates the specified candidates of a batch of samples, and computes all inferences for them.
+        
+        This method is executed by worker processes, and the candidates to create have to be known to not be
+        isomorphic to any other samples.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            batch (list[tuple[int, int or str]]): The samples to create as pairs of sample index and index of the
+                candidate, or, if :attr:`config.Config.exhaustive` is set, the canonical form of the family tree.
+            process (callable): The method that is used for processing every sample, i.e., either
+                :meth:`_process_sample` or :meth:`_build_sample`.
+            dedup (list[float], optional): The time that has been spent on checking the candidates of each sample for
+                isomorphism.
+        
+        Returns:
+            list[tuple[int, object]]: The index of each sample together with the result of ``process``.
+        """
+        if dedup is None:
+            dedup = [0.0] * len(batch)
+        
+        # recreate the family trees of all samples
+        start = time.time()
+        if conf.exhaustive:
+            family_trees = [
+                    tree_enumerator.TreeEnumerator.create_family_tree(candidate, cls._create_rng(conf, sample_idx, 0))
+                    for sample_idx, candidate in batch
+            ]
+        else:
+            family_trees = cls._sample_family_trees(conf, batch)
+            for (sample_idx, candidate), family_tree in zip(batch, family_trees):
+                cls._name_family_tree(conf, family_tree, sample_idx, candidate)
+        duration = (time.time() - start) / len(batch)
+        items = [
+                (sample_idx, family_tree, collections.OrderedDict([("sampling", duration), ("dedup", d)]))
+                for (sample_idx, _), family_tree, d in zip(batch, family_trees, dedup)
+        ]
+        
+        return cls._process_batch(conf, cls._infer_batch(conf, items), process)
+    
+    @classmethod
+    def _create_cache_key(cls, conf: config.Config, family_tree: ft.FamilyTree) -> typing.Tuple[str, typing.List[str]]:
+        """Creates the key that the inferences for a family tree are stored under in the inference cache.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to create the key for.
+        
+        Returns:
+            tuple[str, list[str]]: The key, which consists of the ontology used, the reasoner's options, and the
+                canonical form of the family tree including genders, as well as the names of all persons in canonical
+                order.
+        """
+        # the matrix reasoner has the ontology built in
+        if conf.reasoner == "matrix":
+            ontology = "matrix"
+        else:
+            if cls._ontology_digest is None:
+                with open(cls.ONTOLOGY_PATH, "rb") as f:
+                    cls._ontology_digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            ontology = cls._ontology_digest
+        
+        canonical_form, order = tree_index.TreeIndex.canonical_labeling(family_tree, genders=True)
+        key = "{}:{}:{}".format(ontology, "neg" if conf.negatives == "all" else "pos", canonical_form)
+        
+        return key, [family_tree.names[person] for person in order]
+    
+    @classmethod
+    def _create_facts(cls, family_tree: ft.FamilyTree) -> typing.List[aspwrapper.Literal]:
+        """Creates all facts that describe the provided family tree.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to describe.
+        
+        Returns:
+            list[aspwrapper.Literal]: The created facts.
+        """
+        names = family_tree.names
+        
+        # add a fact specifying the gender of every person in the family tree
+        facts = [
+                aspwrapper.Literal("female" if female else "male", [name])
+                for name, female in zip(names, family_tree.female.tolist())
+        ]
+        
+        # add a fact for specifying a parent-of relation for each of the parents of every person
+        for child, (mother, father) in enumerate(zip(family_tree.mother.tolist(), family_tree.father.tolist())):
+            if mother != ft.FamilyTree.NO_PERSON:
+                facts.append(aspwrapper.Literal("parentOf", [names[mother], names[child]]))
+                facts.append(aspwrapper.Literal("parentOf", [names[father], names[child]]))
+        
+        return facts
+    
+    @classmethod
+    def _create_key(cls, conf: config.Config, sample_idx: int, attempt: int) -> int:
+        """Creates the key of the random stream that a particular candidate of a single sample is sampled from.
+        
+        Like the RNG created by :meth:`_create_rng`, the key is derived deterministically from the user-defined seed,
+        the index of the sample, and the index of the attempt (see :class:`batch_sampler.BatchSampler`).
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample to create.
+            attempt (int): The index of the candidate of the sample to create.
+        
+        Returns:
+            int: The created key, which is an unsigned 64-bit integer.
+        """
+        seed = "{}:{}:{}".format(conf.seed, sample_idx, attempt).encode()
+        return int.from_bytes(hashlib.blake2b(seed, digest_size=8).digest(), "little")
+    
+    @classmethod
+    def _create_knowledge_graph(
+            cls,
+            family_tree: ft.FamilyTree,
+            facts: typing.List[aspwrapper.Literal],
+            inferences: typing.List[aspwrapper.Literal],
+            vocabulary: bool=True
+    ) -> knowledge_graph.KnowledgeGraph:
+        """Creates a knowledge graph that describes the provided sample.
+        
+        This creates the individuals that represent the persons in the family tree, and thus has to be invoked within a
+        fresh data context.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the sample is created from.
+            facts (list[aspwrapper.Literal]): All facts included in the sample.
+            inferences (list[aspwrapper.Literal]): All inferences included in the sample.
+            vocabulary (bool, optional): Indicates whether to add the vocabulary to the knowledge graph. If not, then
+                classes and relations are still referenced by the same indices, which are given by the shared
+                vocabulary of the dataset (see :meth:`_get_vocabulary`).
+        
+        Returns:
+            knowledge_graph.KnowledgeGraph: The created knowledge graph.
+        """
+        # create the individuals that represent the persons in the family tree
+        persons = family_tree.to_persons()
+        
+        # fetch class and relation types
+        classes, relations = cls._get_vocabulary()
+    
+        # create knowledge graph
+        kg = knowledge_graph.KnowledgeGraph()
+        
+        # specify vocabulary
+        if vocabulary:
+            kg.classes.add_all(classes.values())
+            kg.relations.add_all(relations.values())
+        
+        # add individuals to knowledge graph
+        kg.individuals.add_all(persons)
+        
+        # add all facts and inferences to the knowledge graph, which refer to the persons by their indices
+        for literals, inferred in [(facts, False), (inferences, True)]:
+            codes = cls._encode_literals(family_tree, literals)
+            for pred, subj, obj, pos in codes:
+                if obj == -1 and pred in classes:
+                    persons[subj].classes.add(class_membership.ClassMembership(classes[pred], pos, inferred=inferred))
+            kg.triples.add_all(
+                    [
+                            triple.Triple(persons[subj], relations[pred], persons[obj], pos, inferred=inferred)
+                            for pred, subj, obj, pos in codes
+                            if obj != -1 and pred in relations
+                    ]
+            )
+        
+        return kg
+    
+    @classmethod
+    def _create_rng(cls, conf: config.Config, sample_idx: int, attempt: int) -> random.Random:
+        """Creates the RNG for sampling a particular candidate of a single sample.
+        
+        Every candidate is sampled from an RNG of its own, which is seeded deterministically based on the user-defined
+        seed, the index of the sample, and the index of the attempt, i.e., the number of candidates that have been
+        rejected for the same sample before. This ensures that the created dataset does not depend on the order in
+        which samples are created.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample to create.
+            attempt (int): The index of the candidate of the sample to create.
+        
+        Returns:
+            random.Random: The created RNG.
+        """
+        return random.Random("{}:{}:{}".format(conf.seed, sample_idx, attempt))
+    
+    @classmethod
+    def _create_samples(
+            cls,
+            conf: config.Config,
+            process: typing.Callable,
+            sample_index: tree_index.TreeIndex,
+            first_sample: int,
+            enumerated: typing.List[str]=None,
+            monitor: saturation_monitor.SaturationMonitor=None
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """Creates all samples of the dataset one after another.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            process (callable): The method that is used for processing every sample, i.e., either
+                :meth:`_process_sample` or :meth:`_build_sample`.
+            sample_index (:class:`tree_index.TreeIndex`): The index of the structures of all samples created before
+                ``first_sample`` (for checking isomorphism).
+            first_sample (int): The index of the first sample to create.
+            enumerated (list[str], optional): The canonical forms of the family trees of all samples, if these have
+                been selected by :meth:`_enumerate_samples`.
+            monitor (:class:`saturation_monitor.SaturationMonitor`, optional): The monitor that keeps track of
+                rejected family trees.
+        
+        Yields:
+            tuple[int, object]: The index of each sample together with the result of ``process``.
+        """
+        for batch in cls._sample_batches(conf, sample_index, first_sample, enumerated, monitor):
+            yield from cls._process_batch(conf, cls._infer_batch(conf, batch), process)
+    
+    @classmethod
+    def _create_samples_in_parallel(
+            cls,
+            conf: config.Config,
+            process: typing.Callable,
+            sample_index: tree_index.TreeIndex,
+            first_sample: int,
+            enumerated: typing.List[str]=None,
+            monitor: saturation_monitor.SaturationMonitor=None
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """Creates all samples of the dataset by means of a pool of worker processes.
+        
+        Worker processes speculatively sample candidates for upcoming samples, which are checked for isomorphism in
+        this process, in the order of the sample indices. Accepted candidates are then recreated, from the same RNG
+        stream, by a worker process, which computes all inferences and processes the sample. Therefore, the created
+        dataset is identical to the one created by :meth:`_create_samples`.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            process (callable): The method that is used for processing every sample in the worker processes, which has
+                to be a method of this class such that it can be passed to other processes.
+            sample_index (:class:`tree_index.TreeIndex`): The index of the structures of all samples created before
+                ``first_sample`` (for checking isomorphism).
+            first_sample (int): The index of the first sample to create.
+            enumerated (list[str], optional): The canonical forms of the family trees of all samples, if these have
+                been selected by :meth:`_enumerate_samples`.
+            monitor (:class:`saturation_monitor.SaturationMonitor`, optional): The monitor that keeps track of
+                rejected family trees.
+        
+        Yields:
+            tuple[int, object]: The index of each sample together with the result of ``process``.
+        """
+        # the maximum number of samples that are processed concurrently
+        batch_size = cls._get_batch_size(conf)
+        window = max(conf.workers * cls.SAMPLES_PER_WORKER, batch_size)
+        if monitor is None:
+            monitor = saturation_monitor.SaturationMonitor()
+        
+        with futures.ProcessPoolExecutor(max_workers=conf.workers) as executor:
+            
+            candidates = {}  # maps sample indices to the (future) chunks of first candidates and their positions
+            batch = []  # the accepted samples that have not been submitted for processing yet
+            dedup = []  # the time spent on checking the candidates of the samples in the batch for isomorphism
+            pending = collections.deque()  # the (future) results of batches being created
+            next_candidate = first_sample  # the index of the next sample to submit a first candidate for
+            
+            for sample_idx in range(first_sample, conf.num_samples):
+                
+                # enumerated family trees are known to be pairwise not isomorphic already
+                if enumerated is not None:
+                    start = time.time()
+                    sample_index.add_canonical_form(enumerated[sample_idx])
+                    batch.append((sample_idx, enumerated[sample_idx]))
+                    dedup.append(time.time() - start)
+                else:
+                    
+                    # speculatively sample first candidates for upcoming samples, in chunks
+                    while next_candidate < min(conf.num_samples, sample_idx + window):
+                        upcoming = range(
+                                next_candidate,
+                                min(next_candidate + cls.SAMPLING_BATCH_SIZE, conf.num_samples)
+                        )
+                        chunk = executor.submit(cls._sample_candidates, conf, [(i, 0) for i in upcoming])
+                        for position, i in enumerate(upcoming):
+                            candidates[i] = (chunk, position)
+                        next_candidate = upcoming[-1] + 1
+                    
+                    # find the first candidate that is not isomorphic to any sample created earlier
+                    attempt = 0
+                    chunk, position = candidates.pop(sample_idx)
+                    forms = collections.deque([chunk.result()[position]])
+                    duration = 0.0
+                    start = time.time()
+                    while not sample_index.add_canonical_form(forms[0]):
+                        monitor.record(forms.popleft(), False)
+                        cls._check_saturation(conf, monitor, sample_idx)
+                        attempt += 1
+                        if not forms:  # -> as rejections become more likely, more candidates are sampled at once
+                            num_candidates = min(attempt, cls.SAMPLING_BATCH_SIZE)
+                            duration += time.time() - start
+                            forms.extend(
+                                    executor.submit(
+                                            cls._sample_candidates,
+                                            conf,
+                                            [(sample_idx, attempt + i) for i in range(num_candidates)]
+                                    ).result()
+                            )
+                            start = time.time()
+                    monitor.record(forms[0], True)
+                    batch.append((sample_idx, attempt))
+                    dedup.append(duration + time.time() - start)
+                
+                # create the accepted candidates, if the current batch is complete
+                if len(batch) == batch_size or sample_idx == conf.num_samples - 1:
+                    pending.append(executor.submit(cls._create_batch, conf, batch, process, dedup))
+                    batch = []
+                    dedup = []
+                
+                # report all samples that have been created, in order
+                while pending and (pending[0].done() or len(pending) * batch_size >= window):
+                    yield from pending.popleft().result()
+            
+            # report all remaining samples
+            while pending:
+                yield from pending.popleft().result()
+    
+    @classmethod
+    def _create_samples_in_pipeline(
+            cls,
+            conf: config.Config,
+            process: typing.Callable,
+            sample_index: tree_index.TreeIndex,
+            first_sample: int,
+            enumerated: typing.List[str]=None,
+            monitor: saturation_monitor.SaturationMonitor=None
+    ) -> pipeline.Pipeline:
+        """Creates all samples of the dataset by means of a pipeline of stages that run concurrently.
+        
+        The pipeline consists of the stages sampling, inference, and writing, each of which runs in a thread of its
+        own, such that waiting for DLV as well as the actual disk I/O run concurrently with sampling. Notice, however,
+        that the in-process reasoners hold the global interpreter lock while they compute inferences, and thus do not
+        run concurrently with the other stages.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            process (callable): The method that is used for processing every sample, i.e., either
+                :meth:`_process_sample` or :meth:`_build_sample`.
+            sample_index (:class:`tree_index.TreeIndex`): The index of the structures of all samples created before
+                ``first_sample`` (for checking isomorphism).
+            first_sample (int): The index of the first sample to create.
+            enumerated (list[str], optional): The canonical forms of the family trees of all samples, if these have
+                been selected by :meth:`_enumerate_samples`.
+            monitor (:class:`saturation_monitor.SaturationMonitor`, optional): The monitor that keeps track of
+                rejected family trees.
+        
+        Returns:
+            :class:`pipeline.Pipeline`: The pipeline, which yields the index of each sample together with the result of
+                ``process``, in order.
+        """
+        return pipeline.Pipeline(
+                cls._sample_batches(conf, sample_index, first_sample, enumerated, monitor),
+                [
+                        ("inference", lambda batch: [cls._infer_batch(conf, batch)]),
+                        ("writing", lambda batch: cls._process_batch(conf, batch, process))
+                ],
+                cls.PIPELINE_QUEUE_SIZE
+        )
+    
+    @classmethod
+    def _encode_literals(
+            cls,
+            family_tree: ft.FamilyTree,
+            literals: typing.List[aspwrapper.Literal]
+    ) -> typing.List[typing.Tuple[str, int, int, bool]]:
+        """Encodes facts or inferences of a sample as tuples of predicate, subject, object, and polarity.
+        
+        Subjects and objects are given as the indices of the persons in the family tree, and the object of a literal
+        with a single term is ``-1``.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the literals refer to.
+            literals (list[aspwrapper.Literal]): The literals to encode.
+        
+        Returns:
+            list[tuple[str, int, int, bool]]: The encodings of the ``literals``, in the same order.
+        """
+        index = {name: i for i, name in enumerate(family_tree.names)}
+        return [
+                (pred, index[terms[0]], index[terms[1]] if len(terms) > 1 else -1, pos)
+                for pred, terms, pos in map(operator.attrgetter("predicate", "terms", "positive"), literals)
+        ]
+    
+    @classmethod
+    def _enumerate_samples(cls, conf: config.Config) -> typing.Optional[typing.List[str]]:
+        """Selects the family trees of all samples from an enumeration of all possible ones, if this is requested.
+        
+        If there are fewer family trees than :attr:`config.Config.num_samples`, then the number of samples is reduced
+        accordingly.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        
+        Returns:
+            list[str]: The canonical forms of the family trees of all samples, or ``None``, if
+                :attr:`config.Config.exhaustive` is not set.
+        """
+        if not conf.exhaustive:
+            return None
+        
+        enumerated = tree_enumerator.TreeEnumerator.select(conf, conf.num_samples)
+        if len(enumerated) < conf.num_samples:
+            print(
+                    "there are only {} different family trees that comply with the constraints -> creating {} "
+                    "instead of {} samples".format(len(enumerated), len(enumerated), conf.num_samples)
+            )
+            conf.num_samples = len(enumerated)
+        
+        return enumerated
+    
+    @classmethod
+    def _get_batch_size(cls, conf: config.Config) -> int:
+        """Determines the number of samples that inferences are computed for by means of a single invocation of DLV.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        
+        Returns:
+            int: The batch size, which is always ``1``, unless DLV is used.
+        """
+        return conf.dlv_batch_size if conf.reasoner == "dlv" else 1
+    
+    @classmethod
+    def _get_inference_cache(cls, conf: config.Config) -> typing.Optional[inference_cache.InferenceCache]:
+        """Retrieves the inference cache that is used by this process, and opens it, if necessary.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        
+        Returns:
+            :class:`inference_cache.InferenceCache`: The inference cache, or ``None``, if none is used.
+        """
+        if conf.inference_cache is None:
+            return None
+        
+        # every process opens a connection to the cache of its own
+        if cls._inference_cache is None or cls._inference_cache[:2] != (os.getpid(), conf.inference_cache):
+            if cls._inference_cache is not None and cls._inference_cache[0] == os.getpid():
+                cls._inference_cache[2].close()
+            cls._inference_cache = (
+                    os.getpid(),
+                    conf.inference_cache,
+                    inference_cache.InferenceCache(conf.inference_cache, conf.inference_cache_size * 2 ** 20)
+            )
+        
+        return cls._inference_cache[2]
+    
+    @classmethod
+    def _get_sample_files(cls, conf: config.Config, base_name: str) -> typing.List[str]:
+        """Determines the paths of all files that have been written to the output directory for a single sample.
+        
+        The names of these files consist of the name of the sample and a fixed set of suffixes, which are looked up in
+        the output directory only once per process, i.e., for the first sample that is written by it.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            base_name (str): The name of the sample, which has to have been written already.
+        
+        Returns:
+            list[str]: The paths of all files of the sample.
+        """
+        if cls._sample_file_suffixes is None:
+            cls._sample_file_suffixes = {}
+        suffixes = cls._sample_file_suffixes.get(conf.shared_vocabulary)
+        if suffixes is None:
+            suffixes = sorted(
+                    file_name[len(base_name):]
+                    for file_name in os.listdir(conf.output_dir)
+                    if file_name.startswith(base_name) and not file_name[len(base_name):][:1].isdigit()
+            )
+            cls._sample_file_suffixes[conf.shared_vocabulary] = suffixes
+        
+        return [os.path.join(conf.output_dir, base_name + suffix) for suffix in suffixes]
+    
+    @classmethod
+    def _get_sample_name(cls, conf: config.Config, sample_idx: int) -> str:
+        """Determines the name of a sample, which is used as base name for the files created for it.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample.
+        
+        Returns:
+            str: The name of the sample.
+        """
+        return ("{:0" + str(len(str(conf.num_samples - 1))) + "d}").format(sample_idx)
+    
+    @classmethod
+    def _get_vocabulary(
+            cls
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, typing.Any]]:
+        """Retrieves the class and relation types that all knowledge graphs are composed of.
+        
+        These are created only once per process, in a data context of their own, and are shared by all samples, such
+        that their indices coincide with the positions in :attr:`CLASSES` and :attr:`RELATIONS`, respectively.
+        
+        Returns:
+            tuple[OrderedDict, OrderedDict]: Two dictionaries that map the names of all classes and relations,
+                respectively, to the according types.
+        """
+        if cls._vocabulary is None:
+            with dc.DataContext():
+                cls._vocabulary = (
+                        collections.OrderedDict((c, ctf.ClassTypeFactory.create_class(c)) for c in cls.CLASSES),
+                        collections.OrderedDict((r, rtf.RelationTypeFactory.create_relation(r)) for r in cls.RELATIONS)
+                )
+        
+        return cls._vocabulary
+    
+    @classmethod
+    def _infer_batch(
+            cls,
+            conf: config.Config,
+            batch: typing.List[typing.Tuple[int, ft.FamilyTree, typing.Dict[str, float]]]
+    ) -> typing.List[typing.Tuple[int, ft.FamilyTree, aspwrapper.AnswerSet, typing.Dict[str, float]]]:
+        """Computes the inferences for a batch of samples.
+        
+        If the batch contains more than one sample, then the inferences for all of them are computed by means of a
+        single invocation of DLV (see :meth:`_run_asp_solver_batch`). If an :attr:`config.Config.inference_cache` is
+        used, then inferences are only computed for samples that are not cached already.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            batch (list[tuple]): The samples to compute inferences for as tuples of sample index, family tree, and
+                timings.
+        
+        Returns:
+            list[tuple]: The samples as tuples of sample index, family tree, answer set, and timings.
+        """
+        start = time.time()
+        facts = [cls._create_facts(family_tree) for _, family_tree, _ in batch]
+        answer_sets = [None] * len(batch)
+        
+        # retrieve the inferences for all samples that are cached already
+        cache = cls._get_inference_cache(conf)
+        if cache is not None:
+            keys = [cls._create_cache_key(conf, family_tree) for _, family_tree, _ in batch]
+            for idx, (key, names) in enumerate(keys):
+                inferences = cache.get(key, names)
+                if inferences is not None:
+                    answer_sets[idx] = native_solver.AnswerSet(facts[idx], inferences)
+        
+        # compute the inferences for all remaining samples
+        missing = [idx for idx, data in enumerate(answer_sets) if data is None]
+        if len(missing) > 1:
+            computed = cls._run_asp_solver_batch(conf, [facts[idx] for idx in missing])
+        else:
+            computed = [cls._run_asp_solver(conf, facts[idx]) for idx in missing]
+        for idx, data in zip(missing, computed):
+            answer_sets[idx] = data
+            if cache is not None:
+                cache.put(*keys[idx], data.inferences)
+        
+        inference_time = (time.time() - start) / len(batch)
+        
+        results = []
+        for (sample_idx, family_tree, timings), data in zip(batch, answer_sets):
+            timings["inference"] = inference_time
+            results.append((sample_idx, family_tree, data, timings))
+        
+        return results
+    
+    @classmethod
+    def _name_family_tree(cls, conf: config.Config, family_tree: ft.FamilyTree, sample_idx: int, attempt: int) -> None:
+        """Assigns randomly sampled names to all persons in a family tree.
+        
+        As names are needed for writing samples only, they are assigned to accepted candidates only.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to name all persons in.
+            sample_idx (int): The index of the sample that the family tree has been created for.
+            attempt (int): The index of the candidate that the family tree is.
+        """
+        rng = cls._create_rng(conf, sample_idx, attempt)
+        name_pool = pf.PersonFactory.create_name_pool()
+        family_tree.names = [pf.PersonFactory.sample_name(name_pool, f, rng) for f in family_tree.female.tolist()]
+    
+    @classmethod
+    def _parse_distribution(cls, distribution: str) -> typing.Tuple[typing.List[int], typing.List[float]]:
+        """Parses a distribution that is specified as comma-separated pairs of value and weight.
+        
+        Args:
+            distribution (str): The distribution to parse, e.g., ``'6:1,8:2'``. Weights may be omitted, in which case
+                they default to ``1``.
+        
+        Returns:
+            tuple[list[int], list[float]]: The values and their weights.
+        """
+        values = []
+        weights = []
+        for entry in distribution.split(","):
+            value, _, weight = entry.partition(":")
+            values.append(int(value))
+            weights.append(float(weight) if weight else 1.0)
+        
+        return values, weights
+    
     @classmethod
     def _print_distribution(cls, counts: typing.Dict[str, int]):
         """Prints a visualization of the distribution of the given counts to the screen."""
@@ -194,183 +967,413 @@ class Generator(object):
             )
     
     @classmethod
-    def _run_asp_solver(cls, conf: config.Config, family_tree: typing.List[person.Person]) -> aspwrapper.AnswerSet:
-        """Runs the used ASP solver to compute all inferences resulting from the provided family tree.
+    def _process_batch(
+            cls,
+            conf: config.Config,
+            batch: typing.List[typing.Tuple[int, ft.FamilyTree, aspwrapper.AnswerSet, typing.Dict[str, float]]],
+            process: typing.Callable
+    ) -> typing.List[typing.Tuple[int, typing.Any]]:
+        """Processes a batch of samples, whose inferences have been computed already.
         
         Args:
             conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
-            family_tree (list[:class:`person.Person`): A family tree specified as list of persons.
+            batch (list[tuple]): The samples to process as tuples of sample index, family tree, answer set, and timings
+                (see :meth:`_infer_batch`).
+            process (callable): The method that is used for processing every sample, i.e., either
+                :meth:`_process_sample` or :meth:`_build_sample`.
         
         Returns:
-            aspwrapper.AnswerSet: The resulting answer set.
+            list[tuple[int, object]]: The index of each sample together with the result of ``process``.
         """
-        facts = []  # used to store all of the created facts
+        return [
+                (sample_idx, process(conf, sample_idx, family_tree, timings, data=data))
+                for sample_idx, family_tree, data, timings in batch
+        ]
+    
+    @classmethod
+    def _process_sample(
+            cls,
+            conf: config.Config,
+            sample_idx: int,
+            family_tree: ft.FamilyTree,
+            timings: typing.Dict[str, float],
+            data: aspwrapper.AnswerSet=None
+    ) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, float], typing.Dict[str, typing.Any]]:
+        """Computes all inferences for the provided family tree, and writes the according sample to the disk.
         
-        # iterate over all persons in the provided family tree, and create all facts necessary to describe the same
-        for p in family_tree:
+        If the dataset is written as shards or tensors, then the sample is only encoded, and has to be appended to the
+        dataset by the calling process, as all samples are written to the same files.
         
-            # add a fact specifying the person's gender
-            if p.female:
-                facts.append(aspwrapper.Literal("female", [p.name]))
-            else:
-                facts.append(aspwrapper.Literal("male", [p.name]))
-            
-            # add a fact for specifying a parent-of relation for each of the person's children
-            for c in p.children:
-                facts.append(aspwrapper.Literal("parentOf", [p.name, c.name]))
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample to process.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to process.
+            timings (dict[str, float]): The timings of all stages that have been completed already, which is updated
+                by this method.
+            data (aspwrapper.AnswerSet, optional): The inferences for the family tree, if these have been computed
+                already.
         
-        # run the ASP solver to compute all inferences
-        return aspwrapper.DlvSolver(conf.dlv).run(cls.ONTOLOGY_PATH, facts)[0]
+        Returns:
+            tuple[dict, dict, dict]: The statistics of the sample, i.e., its ``tree_size``, its ``num_relations``, the
+                ``num_bytes`` that have been written for it, and its ``pos_relation_counts`` as well as
+                ``neg_relation_counts``, the timings of the stages ``sampling``, ``dedup``, ``inference``, and
+                ``writing`` in seconds, and the encoded sample, if the dataset is written as shards or tensors (see
+                :meth:`shard_archive.ShardWriter.encode` and :meth:`tensor_export.TensorWriter.encode`), or ``None``,
+                otherwise.
+        """
+        # run ASP solver to compute all inferences, unless this has been done already
+        if data is None:
+            start = time.time()
+            data = cls._run_asp_solver(conf, cls._create_facts(family_tree))
+            timings["inference"] = time.time() - start
+        
+        # write sample to disk
+        start = time.time()
+        counts = {}
+        facts, inferences = cls._split_data(conf, sample_idx, family_tree, data, counts=counts)
+        base_name = cls._get_sample_name(conf, sample_idx)
+        if conf.output_format == "shards":
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                cls._write_sample(conf, family_tree, facts, inferences, base_name, target_dir=tmp_dir)
+                encoded = shard_archive.ShardWriter.encode(tmp_dir, base_name)
+            num_bytes = sum(len(content) for content in encoded[1].values())
+        elif conf.output_format == "tensors":
+            encoded = tensor_export.TensorWriter.encode(family_tree, facts, inferences, cls.CLASSES, cls.RELATIONS)
+            num_bytes = sum(array.nbytes for array in encoded.values())
+        else:
+            encoded = None
+            cls._write_sample(conf, family_tree, facts, inferences, base_name)
+            num_bytes = sum(os.path.getsize(path) for path in cls._get_sample_files(conf, base_name))
+        timings["writing"] = time.time() - start
+        
+        # compute statistics from the counts that have been determined while sorting facts and inferences
+        stats = {
+                "tree_size": len(family_tree),
+                "num_relations": int(family_tree.num_children.sum()),
+                "num_bytes": num_bytes,
+                "pos_relation_counts": {r: counts["inferences"].get((r, True), 0) for r in cls.RELATIONS},
+                "neg_relation_counts": {r: 0 for r in cls.RELATIONS}
+        }
+        if conf.negatives in ("all", "none"):
+            # under the closed-world assumption, every pair of persons that is not in a relation gives rise to a
+            # negative inference, no matter whether these are materialized or implicit
+            num_pairs = len(family_tree) ** 2
+            for r in cls.RELATIONS:
+                stats["neg_relation_counts"][r] = num_pairs - stats["pos_relation_counts"][r]
+            stats["neg_relation_counts"]["parentOf"] -= stats["num_relations"]
+        else:
+            for r in cls.RELATIONS:
+                stats["neg_relation_counts"][r] = (
+                        counts["facts"].get((r, False), 0) + counts["inferences"].get((r, False), 0)
+                )
+        
+        return stats, timings, encoded
     
     @classmethod
-    def _sample_family_tree(cls, conf: config.Config) -> typing.List[person.Person]:
-        """Creates a single family tree.
+    def _run_asp_solver(cls, conf: config.Config, facts: typing.List[aspwrapper.Literal]) -> aspwrapper.AnswerSet:
+        """Runs the used ASP solver to compute all inferences resulting from a family tree.
         
         Args:
             conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            facts (list[aspwrapper.Literal]): The facts that describe the family tree (see :meth:`_create_facts`).
         
         Returns:
-            list[:class:`person.Person`]: The created family tree specified as a list of persons appearing in the same.
-                All of the according parent-of relations are specified in terms of the provided instances.
+            aspwrapper.AnswerSet: The resulting answer set. If the native or the matrix reasoner is used, then this is
+                an instance of :class:`native_solver.AnswerSet`, which provides the same interface.
         """
-        # add first person to the family tree
-        fam_tree = [pf.PersonFactory.create_person(conf.max_tree_depth)]
-
-        min_level = fam_tree[0].tree_level
-        max_level = fam_tree[0].tree_level
-        tree_depth = max_level - min_level
-        p = 1
-        total_attempts = 0  # the total number of attempts to add a person to the family tree
-        while True:
+        # the matrix reasoner has the ontology built in
+        if conf.reasoner == "matrix":
+            return matrix_solver.MatrixSolver().run(facts, negative_relations=conf.negatives == "all")[0]
+        
+        # run the ASP solver to compute all inferences
+        if conf.reasoner == "dlv":
+            return aspwrapper.DlvSolver(conf.dlv).run(cls.ONTOLOGY_PATH, facts)[0]
+        return native_solver.NativeSolver().run(cls.ONTOLOGY_PATH, facts, negative_relations=conf.negatives == "all")[0]
     
-            # randomly choose a person from the tree
-            current_person = random.choice(fam_tree)
-            
-            # determine whether it is possible to ad parents and children of the sampled person
-            can_add_parents = (
-                    not current_person.parents and
-                    (current_person.tree_level > min_level or tree_depth < conf.max_tree_depth)
-            )
-            can_add_children = (
-                    len(current_person.children) < conf.max_branching_factor and
-                    (current_person.tree_level < max_level or tree_depth < conf.max_tree_depth)
-            )
-            
-            # decide what to do
-            add_parents = False
-            add_child = False
-            if can_add_parents and can_add_children:  # -> randomly add either a child or parents
-                if random.random() > 0.5:
-                    add_parents = True
-                else:
-                    add_child = True
-            elif can_add_parents:
-                add_parents = True
-            elif can_add_children:
-                add_child = True
+    @classmethod
+    def _run_asp_solver_batch(
+            cls,
+            conf: config.Config,
+            facts: typing.List[typing.List[aspwrapper.Literal]]
+    ) -> typing.List[native_solver.AnswerSet]:
+        """Computes all inferences resulting from multiple family trees by means of a single invocation of DLV.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            facts (list[list[aspwrapper.Literal]]): The facts that describe each of the family trees (see
+                :meth:`_create_facts`).
+        
+        Returns:
+            list[:class:`native_solver.AnswerSet`]: The answer sets for all of the family trees, in the same order.
+        """
+        return batch_solver.BatchSolver(aspwrapper.DlvSolver(conf.dlv)).run(cls.ONTOLOGY_PATH, facts)
     
-            if add_child:
+    @classmethod
+    def _sample_batches(
+            cls,
+            conf: config.Config,
+            sample_index: tree_index.TreeIndex,
+            first_sample: int,
+            enumerated: typing.List[str]=None,
+            monitor: saturation_monitor.SaturationMonitor=None
+    ) -> typing.Iterator[typing.List[typing.Tuple[int, ft.FamilyTree, typing.Dict[str, float]]]]:
+        """Samples all family trees of the dataset, and groups them into batches for computing inferences.
         
-                # check whether the chosen person is married, if not -> add a partner
-                if current_person.married_to:
-                    spouse = current_person.married_to
-                else:
-                    spouse = pf.PersonFactory.create_person(
-                            current_person.tree_level + 1,
-                            female=not current_person.female
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_index (:class:`tree_index.TreeIndex`): The index of the structures of all samples created before
+                ``first_sample`` (for checking isomorphism).
+            first_sample (int): The index of the first sample to create.
+            enumerated (list[str], optional): The canonical forms of the family trees of all samples, if these have
+                been selected by :meth:`_enumerate_samples`.
+            monitor (:class:`saturation_monitor.SaturationMonitor`, optional): The monitor that keeps track of
+                rejected family trees.
+        
+        Yields:
+            list[tuple]: The batches of samples as tuples of sample index, family tree, and timings (see
+                :meth:`_infer_batch`).
+        """
+        batch_size = cls._get_batch_size(conf)
+        batch = []
+        if monitor is None:
+            monitor = saturation_monitor.SaturationMonitor()
+        first_candidates = {}  # maps the indices of upcoming samples to their first candidates
+        for sample_idx in range(first_sample, conf.num_samples):
+            
+            timings = collections.OrderedDict([("sampling", 0.0), ("dedup", 0.0)])
+            start = time.time()
+            if enumerated is not None:
+                sample_index.add_canonical_form(enumerated[sample_idx])
+                timings["dedup"] = time.time() - start
+                start = time.time()
+                family_tree = tree_enumerator.TreeEnumerator.create_family_tree(
+                        enumerated[sample_idx],
+                        cls._create_rng(conf, sample_idx, 0)
+                )
+                timings["sampling"] = time.time() - start
+            else:
+                
+                # sample the first candidates of the upcoming samples, and share the time among them
+                if sample_idx not in first_candidates:
+                    upcoming = range(sample_idx, min(sample_idx + cls.SAMPLING_BATCH_SIZE, conf.num_samples))
+                    first_candidates = dict(
+                            zip(upcoming, cls._sample_family_trees(conf, [(i, 0) for i in upcoming]))
                     )
-                    spouse.married_to = current_person
-                    current_person.married_to = spouse
-                    fam_tree.append(spouse)
-                    p += 1
-        
-                # create child
-                child = pf.PersonFactory.create_person(current_person.tree_level + 1)
-                child.parents.append(current_person)
-                child.parents.append(spouse)
-                fam_tree.append(child)
-                p += 1
-        
-                # add child to current person and spouse
-                current_person.children.append(child)
-                spouse.children.append(child)
-    
-            elif add_parents:
-        
-                # create mother
-                mom = pf.PersonFactory.create_person(current_person.tree_level - 1, female=True)
-                mom.children.append(current_person)
-                fam_tree.append(mom)
-                p += 1
-        
-                # create father
-                dad = pf.PersonFactory.create_person(current_person.tree_level - 1, female=False)
-                dad.children.append(current_person)
-                fam_tree.append(dad)
-                p += 1
-        
-                # specify parents to be married
-                mom.married_to = dad
-                dad.married_to = mom
-        
-                # specify parents of chosen person
-                current_person.parents.append(mom)
-                current_person.parents.append(dad)
+                    share = (time.time() - start) / len(upcoming)
+                    start = time.time()
+                
+                family_tree = cls._sample_unique_family_tree(
+                        conf, sample_index, sample_idx, monitor, first_candidates.pop(sample_idx), timings
+                )
+                timings["sampling"] = time.time() - start + share - timings["dedup"]
+            batch.append((sample_idx, family_tree, timings))
             
-            # update bookkeeping variables
-            total_attempts += 1
-            if add_parents:
-                min_level = min(min_level, current_person.tree_level - 1)
-            elif add_child:
-                max_level = max(max_level, current_person.tree_level + 1)
-            tree_depth = max_level - min_level
-    
-            # stop adding people of maximum number has been reached
-            if (
-                    p >= conf.max_tree_size or
-                    total_attempts >= conf.max_tree_size * 10 or
-                    (conf.stop_prob > 0 and random.random() < conf.stop_prob)
-            ):
-                break
-
-        return fam_tree
-
+            if len(batch) == batch_size or sample_idx == conf.num_samples - 1:
+                yield batch
+                batch = []
+    
     @classmethod
-    def _write_sample(
+    def _sample_candidates(
             cls,
             conf: config.Config,
-            family_tree: typing.List[person.Person],
-            data: aspwrapper.AnswerSet,
-            base_name: str
-    ) -> None:
-        """Writes the provided sample as as knowledge graph to the disk.
+            candidates: typing.List[typing.Tuple[int, int]]
+    ) -> typing.List[str]:
+        """Samples the specified candidates, and computes their canonical forms.
         
         Args:
             conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
-            family_tree (list[:class:`person.Person`]): The specification of the family tree as list of persons.
-            data (aspwrapper.AnswerSet): All facts and inferences included in the sample.
-            base_name (str): The base name for the files created on the disk.
+            candidates (list[tuple[int, int]]): The candidates to sample as pairs of sample index and index of the
+                candidate.
+        
+        Returns:
+            list[str]: The canonical forms of the sampled family trees (see :meth:`tree_index.TreeIndex.canonical_form`)
+                in the same order as the candidates.
         """
-        # create class and relation types
-        classes = {c: ctf.ClassTypeFactory.create_class(c) for c in cls.CLASSES}
-        relations = {r: rtf.RelationTypeFactory.create_relation(r) for r in cls.RELATIONS}
+        return [tree_index.TreeIndex.canonical_form(t) for t in cls._sample_family_trees(conf, candidates)]
     
-        # create dictionary that maps names to individual objects
-        individuals = {i.name: i for i in family_tree}
+    @classmethod
+    def _sample_family_trees(
+            cls,
+            conf: config.Config,
+            candidates: typing.List[typing.Tuple[int, int]]
+    ) -> typing.List[ft.FamilyTree]:
+        """Samples the family trees of the specified candidates at once.
+        
+        Every candidate is sampled from a random stream of its own, which is determined by the seed, the index of the
+        sample, and the index of the candidate (see :meth:`_create_key`). Therefore, a candidate does not depend on the
+        other candidates that it is sampled together with. The persons in the sampled family trees do not have names
+        (see :meth:`_name_family_tree`).
+        
+        If a :attr:`config.Config.size_distribution` or :attr:`config.Config.relations_distribution` is specified,
+        then the size or the number of parentOf relations, respectively, of every family tree is sampled from the same
+        first, and the family tree is grown until it is reached. If this fails, because no more persons can be added
+        without violating the constraints, then the family tree is discarded, and grown from scratch. The target is
+        sampled once per sample, such that it is retained if a candidate is rejected for being a duplicate. Therefore,
+        duplicates do not skew the distribution of the created family trees towards larger ones.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            candidates (list[tuple[int, int]]): The candidates to sample as pairs of sample index and index of the
+                candidate.
+        
+        Returns:
+            list[:class:`family_tree.FamilyTree`]: The sampled family trees in the same order as the candidates.
+        
+        Raises:
+            ValueError: If a sampled target cannot be reached in :attr:`batch_sampler.BatchSampler.MAX_RESTARTS`
+                attempts.
+        """
+        keys = [cls._create_key(conf, sample_idx, attempt) for sample_idx, attempt in candidates]
+        target_sizes = None
+        target_relations = None
+        if conf.size_distribution is not None:
+            target_sizes = [cls._sample_target(conf, conf.size_distribution, i) for i, _ in candidates]
+        elif conf.relations_distribution is not None:
+            target_relations = [cls._sample_target(conf, conf.relations_distribution, i) for i, _ in candidates]
+        
+        return batch_sampler.BatchSampler.sample(
+                conf, keys, target_sizes=target_sizes, target_relations=target_relations
+        )
     
-        # create knowledge graph
-        kg = knowledge_graph.KnowledgeGraph()
+    @classmethod
+    def _sample_target(cls, conf: config.Config, distribution: str, sample_idx: int) -> int:
+        """Samples the target size or number of relations of a single sample.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            distribution (str): The distribution to sample from, which is specified as comma-separated pairs of value
+                and weight, e.g., ``'6:1,8:2'`` (see :attr:`config.Config.size_distribution`).
+            sample_idx (int): The index of the sample.
+        
+        Returns:
+            int: The sampled value.
+        """
+        values, weights = cls._parse_distribution(distribution)
+        return random.Random("{}:{}:target".format(conf.seed, sample_idx)).choices(values, weights)[0]
     
-        # specify vocabulary
-        kg.classes.add_all(classes.values())
-        kg.relations.add_all(relations.values())
+    @classmethod
+    def _sample_unique_family_tree(
+            cls,
+            conf: config.Config,
+            sample_index: tree_index.TreeIndex,
+            sample_idx: int,
+            monitor: saturation_monitor.SaturationMonitor,
+            first_candidate: ft.FamilyTree,
+            timings: typing.Dict[str, float]
+    ) -> ft.FamilyTree:
+        """Samples family trees for a sample until it finds one that is not isomorphic to any sample created earlier.
+        
+        As rejections become more likely the more candidates have been rejected for the same sample already, the number
+        of candidates that are sampled at once is doubled every time, up to :attr:`SAMPLING_BATCH_SIZE`. The candidates
+        are still checked in order, though, which means that the accepted one does not depend on this.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_index (:class:`tree_index.TreeIndex`): The index of all samples created so far, which the accepted
+                family tree is added to.
+            sample_idx (int): The index of the sample to create.
+            monitor (:class:`saturation_monitor.SaturationMonitor`): The monitor that all sampled candidates are
+                recorded by.
+            first_candidate (:class:`family_tree.FamilyTree`): The first candidate of the sample, which has been sampled
+                already.
+            timings (dict[str, float]): The timings of the sample, whose ``dedup`` entry is increased by the time spent
+                on checking candidates for isomorphism.
+        
+        Returns:
+            :class:`family_tree.FamilyTree`: The accepted family tree.
+        
+        Raises:
+            RuntimeError: If the rate of rejected candidates exceeds :attr:`config.Config.max_rejection_rate`.
+        """
+        attempt = 0
+        candidates = [first_candidate]
+        while True:
+            for family_tree in candidates:
+                start = time.time()
+                canonical_form = tree_index.TreeIndex.canonical_form(family_tree)
+                accepted = sample_index.add_canonical_form(canonical_form)
+                monitor.record(canonical_form, accepted)
+                timings["dedup"] += time.time() - start
+                if accepted:
+                    cls._name_family_tree(conf, family_tree, sample_idx, attempt)
+                    return family_tree
+                cls._check_saturation(conf, monitor, sample_idx)
+                attempt += 1
+            num_candidates = min(attempt, cls.SAMPLING_BATCH_SIZE)
+            candidates = cls._sample_family_trees(conf, [(sample_idx, attempt + i) for i in range(num_candidates)])
     
-        # add individuals to knowledge graph
-        kg.individuals.add_all(family_tree)
+    @classmethod
+    def _sort_literals(
+            cls,
+            family_tree: ft.FamilyTree,
+            literals: typing.List[aspwrapper.Literal],
+            counts: typing.Dict[typing.Tuple[str, bool], int]=None
+    ) -> typing.List[aspwrapper.Literal]:
+        """Sorts facts or inferences of a sample by predicate, subject, object, and polarity.
+        
+        Instead of rendering every literal as a string, this compares their encodings (see :meth:`_encode_literals`),
+        which means that subjects and objects are ordered by the positions of the persons in the family tree rather than
+        their names.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the literals refer to.
+            literals (list[aspwrapper.Literal]): The literals to sort.
+            counts (dict[tuple[str, bool], int], optional): If provided, then this is updated with the number of
+                literals for every pair of predicate and polarity that occurs.
+        
+        Returns:
+            list[aspwrapper.Literal]: The sorted literals.
+        """
+        # sort the literals by their encodings, which consist of numbers and predicates only
+        codes = cls._encode_literals(family_tree, literals)
+        order = sorted(range(len(literals)), key=codes.__getitem__)
+        
+        # count the literals of every pair of predicate and polarity
+        if counts is not None:
+            for key, count in collections.Counter((pred, pos) for pred, _, _, pos in codes).items():
+                counts[key] = counts.get(key, 0) + count
+        
+        return [literals[i] for i in order]
     
+    @classmethod
+    def _split_data(
+            cls,
+            conf: config.Config,
+            sample_idx: int,
+            family_tree: ft.FamilyTree,
+            data: aspwrapper.AnswerSet,
+            counts: typing.Dict[str, typing.Dict[typing.Tuple[str, bool], int]]=None
+    ) -> typing.Tuple[typing.List[aspwrapper.Literal], typing.List[aspwrapper.Literal]]:
+        """Determines the facts and inferences to include in a sample.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            sample_idx (int): The index of the sample.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the sample is created from.
+            data (aspwrapper.AnswerSet): The answer set that has been computed for the sample.
+            counts (dict, optional): If provided, then the numbers of facts and inferences for every pair of predicate
+                and polarity, which are determined while sorting them (see :meth:`_sort_literals`), are stored in this
+                dictionary under the keys ``'facts'`` and ``'inferences'``, respectively.
+        
+        Returns:
+            tuple[list, list]: The facts and the inferences of the sample, each of which is sorted.
+        """
         # fetch facts and inferences
         facts = list(data.facts)
         inferences = list(data.inferences)
+        
+        # unless all negative relations shall be included, drop them, and sample the requested ones instead
+        if conf.negatives != "all":
+            inferences = [i for i in inferences if i.positive or len(i.terms) != 2]
+            if conf.negatives != "none":
+                inferences += negative_sampler.NegativeSampler.sample_negatives(
+                        [i.terms[0] for i in inferences if i.predicate == "person"],
+                        facts + inferences,
+                        cls.RELATIONS,
+                        conf.negatives_per_positive,
+                        random.Random("{}:{}:negatives".format(conf.seed, sample_idx)),
+                        hard=conf.negatives == "hard"
+                )
     
         # if negative facts shall be used, then move inferred ~parentOf predicates from inferences to facts
         if conf.negative_facts:
@@ -378,53 +1381,58 @@ class Generator(object):
             inferences = [i for i in inferences if i.predicate != "parentOf"]
     
         # sort all facts and inferences (this ensures exact reproducibility)
-        facts = sorted(facts, key=lambda x: str(x))
-        inferences = sorted(inferences, key=lambda x: str(x))
-    
-        # add all facts to the knowledge graph
-        for f in facts:
-            if len(f.terms) == 1:
-                if f.predicate in cls.CLASSES:
-                    individuals[f.terms[0]].classes.add(
-                            class_membership.ClassMembership(
-                                    classes[f.predicate],
-                                    f.positive
-                            )
-                    )
-            elif f.predicate in cls.RELATIONS:
-                kg.triples.add(
-                        triple.Triple(
-                                individuals[f.terms[0]],
-                                relations[f.predicate],
-                                individuals[f.terms[1]],
-                                f.positive
-                        )
-                )
+        fact_counts = None
+        inference_counts = None
+        if counts is not None:
+            fact_counts = counts["facts"] = {}
+            inference_counts = counts["inferences"] = {}
+        facts = cls._sort_literals(family_tree, facts, counts=fact_counts)
+        inferences = cls._sort_literals(family_tree, inferences, counts=inference_counts)
+        
+        return facts, inferences
     
-        # add all inferences to the knowledge graph
-        for i in inferences:
-            if len(i.terms) == 1:
-                if i.predicate in cls.CLASSES:
-                    individuals[i.terms[0]].classes.add(
-                            class_membership.ClassMembership(
-                                    classes[i.predicate],
-                                    i.positive,
-                                    inferred=True
-                            )
-                    )
-            elif i.predicate in cls.RELATIONS:
-                kg.triples.add(
-                        triple.Triple(
-                                individuals[i.terms[0]],
-                                relations[i.predicate],
-                                individuals[i.terms[1]],
-                                i.positive,
-                                inferred=True
-                        )
-                )
+    @classmethod
+    def _write_sample(
+            cls,
+            conf: config.Config,
+            family_tree: ft.FamilyTree,
+            facts: typing.List[aspwrapper.Literal],
+            inferences: typing.List[aspwrapper.Literal],
+            base_name: str,
+            target_dir: str=None
+    ) -> None:
+        """Writes the provided sample as as knowledge graph to the disk.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the sample is created from.
+            facts (list[aspwrapper.Literal]): The facts included in the sample (see :meth:`_split_data`).
+            inferences (list[aspwrapper.Literal]): The inferences included in the sample (see :meth:`_split_data`).
+            base_name (str): The base name for the files created on the disk.
+            target_dir (str, optional): The directory to write the sample to, which defaults to the output directory.
+        """
+        # create knowledge graph in a fresh data context
+        with dc.DataContext():
+            kg = cls._create_knowledge_graph(family_tree, facts, inferences, vocabulary=not conf.shared_vocabulary)
     
-        # write created knowledge graph to disk
-        kg_writer.KgWriter.write(kg, conf.output_dir, base_name)
+            # write created knowledge graph to disk
+            kg_writer.KgWriter.write(kg, target_dir or conf.output_dir, base_name)
+    
+    @classmethod
+    def _write_vocabulary(cls, conf: config.Config) -> None:
+        """Writes the vocabulary that is shared by all samples of a dataset to the disk.
+        
+        The vocabulary is written as a knowledge graph without any individuals, named :attr:`VOCABULARY_NAME`.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        """
+        classes, relations = cls._get_vocabulary()
+        with dc.DataContext():
+            kg = knowledge_graph.KnowledgeGraph()
+            kg.classes.add_all(classes.values())
+            kg.relations.add_all(relations.values())
+            kg_writer.KgWriter.write(kg, conf.output_dir, cls.VOCABULARY_NAME)
     
     @classmethod
     def generate(cls, conf: config.Config) -> None:
@@ -432,101 +1440,150 @@ class Generator(object):
         
         Args:
             conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        
+        Raises:
+            ValueError: If the DLV system is supposed to be used, but its path has not been specified, or if a run is
+                supposed to be resumed or extended, but there is no matching checkpoint in the output directory.
+            RuntimeError: If the rate of sampled family trees that are rejected as duplicates exceeds
+                :attr:`config.Config.max_rejection_rate`.
         """
-        # a pattern that describes the base names of the created samples
-        sample_name_pattern = "{:0" + str(len(str(conf.num_samples - 1))) + "d}"
+        cls._check_config(conf)
         
-        # numerous counters for computing data statistics
-        tree_size_counts = [0] * (conf.max_tree_size + 2)  # +2 rather than +1 -> adding of spouses
-        total_relations_counts = [0] * (conf.max_branching_factor ** conf.max_tree_depth)
-        inferences_pos_relation_counts = {r: 0 for r in cls.RELATIONS}
-        inferences_neg_relation_counts = {r: 0 for r in cls.RELATIONS}
+        # create an index of the structures of all created samples (for checking isomorphism)
+        sample_index = tree_index.TreeIndex()
         
-        # create list for storing graph representations of all created samples (for checking isomorphism)
-        sample_graphs = []
+        # keep track of how many sampled family trees are rejected for being isomorphic to samples created before -> the
+        # rejected ones are journaled until they are saved with the next checkpoint
+        monitor = saturation_monitor.SaturationMonitor(journal=True)
+        ckpt = checkpoint.Checkpoint(conf, sample_index, monitor)
         
-        for sample_idx in range(conf.num_samples):
-            
-            print("creating sample #{}: ".format(sample_idx), end="")
+        # sparse counters for computing data statistics
+        run_stats = rs.RunStats(cls.RELATIONS)
+        
+        # if an interrupted run is resumed or a completed one extended, then we restore its state from the checkpoint
+        first_sample = 0
+        if conf.resume or conf.extend:
+            first_sample, state = ckpt.load(extend=conf.extend)
+            run_stats = rs.RunStats.from_dict(cls.RELATIONS, state)
+            print(
+                    "{} from checkpoint with seed {} at sample #{}".format(
+                            "extending" if conf.extend else "resuming",
+                            conf.seed,
+                            first_sample
+                    )
+            )
+        
+        # if requested, then the family trees of all samples are selected from an enumeration of all possible ones
+        enumerated = cls._enumerate_samples(conf)
+        
+        # collect performance metrics of the run, which are written to the output directory together with checkpoints
+        report = run_report.RunReport(conf.output_dir, first_sample, monitor)
+        
+        # if requested, then a window of samples is profiled
+        profiler = None
+        if conf.profile:
+            profiler = run_profiler.RunProfiler(conf.output_dir, conf.profile_start, conf.profile_samples)
+        
+        # if the dataset is written as shards or tensors, then this process appends all samples to the same files
+        dataset_writer = None
+        if conf.output_format == "shards":
+            dataset_writer = shard_archive.ShardWriter(conf.output_dir, conf.shard_size, first_sample)
+        elif conf.output_format == "tensors":
+            dataset_writer = tensor_export.TensorWriter(conf.output_dir, cls.CLASSES, cls.RELATIONS, first_sample)
+        
+        # if the vocabulary is shared by all samples, then it is written only once
+        if conf.shared_vocabulary and conf.output_format != "tensors":
+            cls._write_vocabulary(conf)
+        
+        # create all samples, either in this process or by means of a pool of worker processes
+        if conf.workers > 1:
+            samples = cls._create_samples_in_parallel(
+                    conf, cls._process_sample, sample_index, first_sample, enumerated, monitor
+            )
+        elif conf.pipeline:
+            samples = cls._create_samples_in_pipeline(
+                    conf, cls._process_sample, sample_index, first_sample, enumerated, monitor
+            )
+        else:
+            samples = cls._create_samples(conf, cls._process_sample, sample_index, first_sample, enumerated, monitor)
+        
+        for sample_idx, (stats, timings, encoded) in samples:
             
-            # use a fresh data context
-            with dc.DataContext() as data_ctx:
-                
-                # reset person factory
-                pf.PersonFactory.reset()
-
-                total_start = time.time()
-                    
-                # sample family tree
-                print("sampling family tree", end="")
+            # append the sample to the dataset, if it is written as shards or tensors
+            if dataset_writer is not None:
                 start = time.time()
-                done = False
-                while not done:
-                    
-                    # randomly sample a tree
-                    family_tree = cls._sample_family_tree(conf)
-                    
-                    # create a graph that represents the structure of the created sample for checking isomorphism
-                    current_graph = nx.DiGraph()
-                    for p in family_tree:
-                        for parent in p.parents:
-                            current_graph.add_edge(p.index, parent.index)
-                        if p.married_to is not None:
-                            current_graph.add_edge(p.index, p.married_to.index)
-                    
-                    # check whether the new sample is isomorphic to any sample created earlier
-                    for existing_sample in sample_graphs:
-                        if nx.is_isomorphic(existing_sample, current_graph):
-                            data_ctx.clear()
-                            pf.PersonFactory.reset()
-                            break
-                    else:
-                        sample_graphs.append(current_graph)
-                        done = True
-                    
-                print(" OK ({:.3f}s)".format(time.time() - start), end="")
+                dataset_writer.write(encoded)
+                timings["writing"] += time.time() - start
+            
+            # print progress
+            progress = (
+                    "creating sample #{}: "
+                    "sampling family tree OK ({:.3f}s) | "
+                    "computing inferences OK ({:.3f}s) | "
+                    "writing to disk OK ({:.3f}s) | "
+                    "finished in {:.3f}s | "
+                    "rejection rate: {:.1%}".format(
+                            sample_idx,
+                            timings["sampling"] + timings["dedup"],
+                            timings["inference"],
+                            timings["writing"],
+                            sum(timings.values()),
+                            monitor.rejection_rate
+                    )
+            )
+            if isinstance(samples, pipeline.Pipeline):
+                progress += " | queues: " + " ".join(
+                        "{}={}".format(name, depth) for name, depth in samples.queue_depths.items()
+                )
+            print(progress)
+            
+            # update statistics
+            report.record(timings, stats["num_bytes"])
+            if profiler is not None:
+                profiler.record(timings)
+            run_stats.add(stats)
+            
+            # save a checkpoint at regular intervals as well as after the last sample
+            if (sample_idx + 1) % conf.checkpoint_interval == 0 or sample_idx + 1 == conf.num_samples:
+                if dataset_writer is not None:
+                    dataset_writer.flush()
+                ckpt.save(sample_idx + 1, run_stats.to_dict())
+                report.save()
         
-                # run ASP solver to compute all inferences
-                print(" | computing inferences", end="")
-                start = time.time()
-                data = cls._run_asp_solver(conf, family_tree)
-                print(" OK ({:.3f}s)".format(time.time() - start), end="")
-    
-                # write sample to disk
-                print(" | writing to disk", end="")
-                start = time.time()
-                cls._write_sample(conf, family_tree, data, sample_name_pattern.format(sample_idx))
-                print(" OK ({:.3f}s) | ".format(time.time() - start), end="")
-                
-                # update statistics
-                tree_size_counts[len(family_tree)] += 1
-                total_relations_counts[sum((len(p.children) for p in family_tree))] += 1
-                for i in data.inferences:
-                    if len(i.terms) == 2 and i.predicate in cls.RELATIONS:
-                        if i.positive:
-                            inferences_pos_relation_counts[i.predicate] += 1
-                        else:
-                            inferences_neg_relation_counts[i.predicate] += 1
-                
-                print("finished in {:.3f}s".format(time.time() - total_start))
+        if dataset_writer is not None:
+            dataset_writer.close()
+        if profiler is not None:
+            profiler.close()
+        report.save(finished=True)
         
         print()  # add an empty line to the output
         
+        # report how many candidates have been rejected, unless all family trees have been enumerated
+        if monitor.num_attempts > 0:
+            print(
+                    "sampled {} family trees, {} ({:.1%}) of which have been rejected as duplicates -> an estimated {} "
+                    "or more further family trees can be sampled\n".format(
+                            monitor.num_attempts,
+                            monitor.num_rejections,
+                            monitor.num_rejections / monitor.num_attempts,
+                            round(monitor.estimate_num_trees() - monitor.num_trees)
+                    )
+            )
+        
         # prepare tree-size-statistics for printing
-        title_format = "size={{:0{}d}}".format(len(str(conf.max_tree_size + 1)))
+        max_size = max(batch_sampler.BatchSampler.max_size(conf), max(run_stats.tree_size_counts, default=0))
+        title_format = "size={{:0{}d}}".format(len(str(max_size)))
         tree_size_counts = {
-                title_format.format(size): counts
-                for size, counts in enumerate(tree_size_counts)
-                if size > 1
+                title_format.format(size): run_stats.tree_size_counts.get(size, 0)
+                for size in range(2, max_size + 1)
         }
 
         # prepare total-number-of-relations-statistics for printing
-        max_relations = max((size for size, counts in enumerate(total_relations_counts) if counts > 0))
+        max_relations = max(run_stats.total_relations_counts, default=0)
         title_format = "#relations={{:0{}d}}".format(len(str(max_relations)))
         total_relations_counts = {
-                title_format.format(size): counts
-                for size, counts in enumerate(total_relations_counts)
-                if size <= max_relations
+                title_format.format(size): run_stats.total_relations_counts.get(size, 0)
+                for size in range(max_relations + 1)
         }
         
         # print statistics
@@ -535,8 +1592,34 @@ class Generator(object):
         print("\nDISTRIBUTION OF TOTAL NUMBER OF RELATIONS PER SAMPLE\n")
         cls._print_distribution(total_relations_counts)
         print("\nINFERABLE RELATIONS\n")
-        cls._print_stats(inferences_pos_relation_counts, inferences_neg_relation_counts)
+        cls._print_stats(run_stats.pos_relation_counts, run_stats.neg_relation_counts)
         print("\nDISTRIBUTION OF POSITIVE RELATION INFERENCES\n")
-        cls._print_distribution(inferences_pos_relation_counts)
+        cls._print_distribution(run_stats.pos_relation_counts)
         print("\nDISTRIBUTION OF NEGATIVE RELATION INFERENCES\n")
-        cls._print_distribution(inferences_neg_relation_counts)
+        cls._print_distribution(run_stats.neg_relation_counts)
+    
+    @classmethod
+    def iter_samples(cls, conf: config.Config) -> typing.Iterator[sample.Sample]:
+        """Lazily creates the samples of a family tree dataset based on the provided configuration.
+        
+        In contrast to :meth:`generate`, samples are not written to the disk, but yielded as soon as they have been
+        created, which allows for consuming fresh samples on the fly. Apart from the sample that is yielded, only the
+        canonical forms of the samples created so far are kept in memory. Notice that samples are always created in the
+        calling process, i.e., :attr:`config.Config.workers` is ignored.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies how to create the dataset.
+        
+        Yields:
+            :class:`sample.Sample`: The created samples in the same order as they are written by :meth:`generate`.
+        
+        Raises:
+            ValueError: If the DLV system is supposed to be used, but its path has not been specified.
+            RuntimeError: If the rate of sampled family trees that are rejected as duplicates exceeds
+                :attr:`config.Config.max_rejection_rate`.
+        """
+        cls._check_config(conf)
+        
+        enumerated = cls._enumerate_samples(conf)
+        for _, s in cls._create_samples(conf, cls._build_sample, tree_index.TreeIndex(), 0, enumerated):
+            yield s
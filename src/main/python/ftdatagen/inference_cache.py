@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+
+import json
+import sqlite3
+import time
+import typing
+import zlib
+
+from ftdatagen import native_solver
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class InferenceCache(object):
+    """A persistent cache of the inferences that have been computed for family trees.
+    
+    Inferences only depend on the structure of a family tree, including the genders of all persons, but not on their
+    names. Therefore, the cache stores inferences in terms of the positions of the persons in a canonical order (see
+    :meth:`tree_index.TreeIndex.canonical_labeling`), and maps these to the actual names when they are retrieved.
+    This allows for reusing inferences across samples, runs, and datasets, whenever isomorphic family trees are created.
+    
+    The cache is stored as an SQLite database, which may be shared by multiple processes. Once the total size of all
+    cached entries exceeds the specified maximum, the least recently used entries are evicted.
+    """
+    
+    EVICTION_BATCH_SIZE = 100
+    """int: The maximum number of entries that are evicted at once."""
+    
+    TIMEOUT = 60
+    """int: The number of seconds to wait for a lock on the database, if it is accessed by another process."""
+    
+    _SCHEMA = """
+            CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+            CREATE TABLE IF NOT EXISTS total (size INTEGER NOT NULL);
+            INSERT INTO total SELECT 0 WHERE NOT EXISTS (SELECT * FROM total);
+            CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+                    BEGIN UPDATE total SET size = size + new.size; END;
+            CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+                    BEGIN UPDATE total SET size = size - old.size; END;
+    """
+    """str: The SQL statements that create the database, which keeps track of the total size of all entries."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, path: str, max_size: int):
+        """Creates a new ``InferenceCache``.
+        
+        Args:
+            path (str): The path of the database file, which is created if it does not exist.
+            max_size (int): The maximum total size of all cached entries in bytes.
+        """
+        self._max_size = max_size
+        self._conn = sqlite3.connect(path, timeout=self.TIMEOUT, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(self._SCHEMA)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _evict(self) -> None:
+        """Evicts the least recently used entries until the total size of the cache does not exceed the maximum."""
+        while self._conn.execute("SELECT size FROM total").fetchone()[0] > self._max_size:
+            with self._conn:
+                self._conn.execute(
+                        "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                        (self.EVICTION_BATCH_SIZE,)
+                )
+    
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._conn.close()
+    
+    def get(self, key: str, names: typing.Sequence[str]) -> typing.Optional[typing.List[native_solver.Literal]]:
+        """Retrieves the inferences for a family tree from the cache.
+        
+        Args:
+            key (str): The key of the family tree, which includes its canonical form.
+            names (sequence[str]): The names of all persons in the family tree in canonical order.
+        
+        Returns:
+            list[:class:`native_solver.Literal`]: The cached inferences, or ``None``, if there are none.
+        """
+        row = self._conn.execute("SELECT data FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        
+        return [
+                native_solver.Literal(predicate, [names[t] for t in terms], positive)
+                for predicate, terms, positive in json.loads(zlib.decompress(row[0]).decode())
+        ]
+    
+    def put(self, key: str, names: typing.Sequence[str], inferences: typing.Iterable[native_solver.Literal]) -> None:
+        """Adds the inferences for a family tree to the cache.
+        
+        Inferences that refer to anything but the persons in the family tree cannot be cached, and are ignored.
+        
+        Args:
+            key (str): The key of the family tree, which includes its canonical form.
+            names (sequence[str]): The names of all persons in the family tree in canonical order.
+            inferences (iterable[:class:`native_solver.Literal`]): The inferences that have been computed for the
+                family tree.
+        """
+        positions = {name: pos for pos, name in enumerate(names)}
+        try:
+            encoded = sorted([i.predicate, [positions[t] for t in i.terms], i.positive] for i in inferences)
+        except KeyError:  # -> some term is not the name of a person
+            return
+        data = zlib.compress(json.dumps(encoded, separators=(",", ":")).encode())
+        
+        with self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.execute(
+                    "INSERT INTO entries (key, data, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, data, len(key) + len(data), time.time())
+            )
+        self._evict()
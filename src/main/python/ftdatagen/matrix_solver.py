@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import typing
+
+import numpy as np
+
+from ftdatagen import native_solver
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class MatrixSolver(object):
+    """A reasoner that computes all inferences of the family tree ontology by means of boolean matrix operations.
+    
+    Every binary relation of the ontology (see ``src/main/asp/ontology.asp``) is a composition of ``parentOf``, its
+    inverse, and ``siblingOf``, possibly restricted to persons of one gender. Therefore, the ``MatrixSolver`` represents
+    each relation as a boolean ``person x person`` matrix, and evaluates the rules of the ontology as boolean matrix
+    products. As every person has at most two parents, a product with the ``parentOf`` matrix reduces to combining two
+    rows or columns of the other factor, which means that all relations are computed in time that is quadratic in the
+    number of persons. The negative literals of a relation are just the complement of its matrix.
+    
+    Notice that the ontology is hard-coded into the ``MatrixSolver``, which produces exactly the same answer sets as
+    DLV or the :class:`native_solver.NativeSolver`, as long as ``ontology.asp`` is not changed.
+    """
+    
+    FEMALE = "female"
+    """str: The predicate that specifies female persons."""
+    
+    GENDERED_RELATIONS = collections.OrderedDict(
+            [
+                    ("sisterOf", ("siblingOf", True)),
+                    ("brotherOf", ("siblingOf", False)),
+                    ("motherOf", ("parentOf", True)),
+                    ("fatherOf", ("parentOf", False)),
+                    ("grandmotherOf", ("grandparentOf", True)),
+                    ("grandfatherOf", ("grandparentOf", False)),
+                    ("greatGrandmotherOf", ("greatGrandparentOf", True)),
+                    ("greatGrandfatherOf", ("greatGrandparentOf", False)),
+                    ("auntOf", ("auntUncleOf", True)),
+                    ("uncleOf", ("auntUncleOf", False)),
+                    ("greatAuntOf", ("greatAuntUncleOf", True)),
+                    ("greatUncleOf", ("greatAuntUncleOf", False)),
+                    ("secondAuntOf", ("secondAuntUncleOf", True)),
+                    ("secondUncleOf", ("secondAuntUncleOf", False)),
+                    ("girlCousinOf", ("cousinOf", True)),
+                    ("boyCousinOf", ("cousinOf", False)),
+                    ("girlSecondCousinOf", ("secondCousinOf", True)),
+                    ("boySecondCousinOf", ("secondCousinOf", False)),
+                    ("girlFirstCousinOnceRemovedOf", ("firstCousinOnceRemovedOf", True)),
+                    ("boyFirstCousinOnceRemovedOf", ("firstCousinOnceRemovedOf", False)),
+                    ("daughterOf", ("childOf", True)),
+                    ("sonOf", ("childOf", False)),
+                    ("granddaughterOf", ("grandchildOf", True)),
+                    ("grandsonOf", ("grandchildOf", False)),
+                    ("greatGranddaughterOf", ("greatGrandchildOf", True)),
+                    ("greatGrandsonOf", ("greatGrandchildOf", False)),
+                    ("nieceOf", ("nieceNephewOf", True)),
+                    ("nephewOf", ("nieceNephewOf", False))
+            ]
+    )
+    """OrderedDict: Maps every gendered relation to the relation that it restricts and the gender that it requires."""
+    
+    MALE = "male"
+    """str: The predicate that specifies male persons."""
+    
+    PARENT_OF = "parentOf"
+    """str: The predicate that specifies parent-child relations."""
+    
+    PERSON = "person"
+    """str: The predicate that specifies persons."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _compose_child_of(cls, rel: np.ndarray, parents: np.ndarray) -> np.ndarray:
+        """Computes the composition of the inverse of ``parentOf`` with another relation, i.e., the matrix product
+        ``P^T R``.
+        
+        Args:
+            rel (np.ndarray): The matrix ``R`` of the relation to compose with.
+            parents (np.ndarray): A ``2 x n`` matrix that contains the indices of both parents of every person, with
+                ``n`` indicating an unknown parent.
+        
+        Returns:
+            np.ndarray: The matrix of the resulting relation.
+        """
+        padded = np.zeros((rel.shape[0] + 1, rel.shape[1]), dtype=np.bool_)
+        padded[:-1] = rel
+        return padded[parents[0]] | padded[parents[1]]
+    
+    @classmethod
+    def _compose_parent_of(cls, rel: np.ndarray, parents: np.ndarray) -> np.ndarray:
+        """Computes the composition of a relation with ``parentOf``, i.e., the matrix product ``R P``.
+        
+        Args:
+            rel (np.ndarray): The matrix ``R`` of the relation to compose with.
+            parents (np.ndarray): A ``2 x n`` matrix that contains the indices of both parents of every person, with
+                ``n`` indicating an unknown parent.
+        
+        Returns:
+            np.ndarray: The matrix of the resulting relation.
+        """
+        padded = np.zeros((rel.shape[0], rel.shape[1] + 1), dtype=np.bool_)
+        padded[:, :-1] = rel
+        return padded[:, parents[0]] | padded[:, parents[1]]
+    
+    @classmethod
+    def compute_relations(
+            cls,
+            parents: np.ndarray,
+            female: np.ndarray,
+            male: np.ndarray
+    ) -> typing.Dict[str, np.ndarray]:
+        """Computes the matrices of all binary relations in the ontology.
+        
+        Args:
+            parents (np.ndarray): A ``2 x n`` matrix that contains the indices of both parents of every person, with
+                ``n`` indicating an unknown parent.
+            female (np.ndarray): A boolean vector that indicates which persons are known to be female.
+            male (np.ndarray): A boolean vector that indicates which persons are known to be male.
+        
+        Returns:
+            OrderedDict[str, np.ndarray]: Maps the names of all binary relations to their matrices, where the entry
+                ``[x, y]`` indicates whether ``x`` is in the according relation with ``y``.
+        """
+        num_persons = len(female)
+        rel = collections.OrderedDict()
+        
+        # parentOf is given, and siblingOf(X, Y) :- parentOf(Z, X), parentOf(Z, Y), X<>Y
+        rel["parentOf"] = cls._compose_parent_of(np.eye(num_persons, dtype=np.bool_), parents)
+        rel["siblingOf"] = cls._compose_child_of(rel["parentOf"], parents) & ~np.eye(num_persons, dtype=np.bool_)
+        
+        # top-down relationships
+        rel["grandparentOf"] = cls._compose_parent_of(rel["parentOf"], parents)
+        rel["greatGrandparentOf"] = cls._compose_parent_of(rel["grandparentOf"], parents)
+        rel["auntUncleOf"] = cls._compose_parent_of(rel["siblingOf"], parents)
+        rel["greatAuntUncleOf"] = cls._compose_parent_of(rel["auntUncleOf"], parents)
+        rel["secondAuntUncleOf"] = cls._compose_child_of(rel["greatAuntUncleOf"], parents)
+        
+        # bottom-up relationships
+        rel["childOf"] = rel["parentOf"].T
+        rel["grandchildOf"] = rel["grandparentOf"].T
+        rel["greatGrandchildOf"] = rel["greatGrandparentOf"].T
+        rel["nieceNephewOf"] = rel["auntUncleOf"].T
+        
+        # sideways relationships -> cousinOf and secondCousinOf are symmetric
+        cousin_of = cls._compose_child_of(rel["auntUncleOf"], parents)
+        rel["cousinOf"] = cousin_of | cousin_of.T
+        second_cousin_of = cls._compose_child_of(rel["secondAuntUncleOf"], parents)
+        rel["secondCousinOf"] = second_cousin_of | second_cousin_of.T
+        rel["firstCousinOnceRemovedOf"] = cls._compose_parent_of(rel["cousinOf"], parents).T
+        
+        # gendered relationships
+        for name, (base, is_female) in cls.GENDERED_RELATIONS.items():
+            rel[name] = rel[base] & (female if is_female else male)[:, np.newaxis]
+        
+        return rel
+    
+    def run(self, facts: typing.Iterable, negative_relations: bool=True) -> typing.List[native_solver.AnswerSet]:
+        """Computes the answer set of the family tree ontology for the given facts.
+        
+        Args:
+            facts (iterable): The facts to compute the answer set for, which have to be positive literals of the
+                predicates ``female``, ``male``, and ``parentOf``. These may be any objects that provide the attributes
+                ``predicate``, ``terms``, and ``positive``, e.g., instances of ``aspwrapper.Literal``.
+            negative_relations (bool, optional): If ``False``, then the negative literals of binary relations, which
+                are by far the largest part of the answer set, are not created.
+        
+        Returns:
+            list[:class:`native_solver.AnswerSet`]: A list that contains the answer set, or an empty list, if there is
+                none.
+        
+        Raises:
+            ValueError: If any of the facts is not supported, or if any person has more than two parents.
+        """
+        facts = [native_solver.Literal(f.predicate, f.terms, f.positive) for f in facts]
+        
+        # assign an index to every person
+        names = []
+        index = {}
+        for f in facts:
+            if not f.positive or f.predicate not in (self.FEMALE, self.MALE, self.PARENT_OF):
+                raise ValueError("The MatrixSolver does not support the fact '{}'!".format(f))
+            for t in f.terms:
+                if t not in index:
+                    index[t] = len(names)
+                    names.append(t)
+        num_persons = len(names)
+        
+        # collect genders and parents of all persons -> a missing parent is represented by num_persons
+        female = np.zeros(num_persons, dtype=np.bool_)
+        male = np.zeros(num_persons, dtype=np.bool_)
+        parents = np.full((2, num_persons), num_persons, dtype=np.int64)
+        for f in facts:
+            if f.predicate == self.FEMALE:
+                female[index[f.terms[0]]] = True
+            elif f.predicate == self.MALE:
+                male[index[f.terms[0]]] = True
+            else:
+                parent, child = index[f.terms[0]], index[f.terms[1]]
+                if parents[0, child] in (num_persons, parent):
+                    parents[0, child] = parent
+                elif parents[1, child] in (num_persons, parent):
+                    parents[1, child] = parent
+                else:
+                    raise ValueError("The MatrixSolver does not support persons with more than two parents!")
+        
+        # compute all relations, and check the safety rules of the ontology
+        rel = self.compute_relations(parents, female, male)
+        if (female & male).any() or (rel["parentOf"] & rel["parentOf"].T).any():
+            return []
+        
+        # assemble the answer set
+        model = [native_solver.Literal(self.PERSON, [n]) for n in names]
+        model.extend(native_solver.Literal(self.FEMALE, [n], False) for n, m in zip(names, male) if m)
+        model.extend(native_solver.Literal(self.MALE, [n], False) for n, f in zip(names, female) if f)
+        for name, matrix in rel.items():
+            model.extend(native_solver.Literal(name, [names[x], names[y]]) for x, y in np.argwhere(matrix).tolist())
+            if negative_relations:
+                model.extend(
+                        native_solver.Literal(name, [names[x], names[y]], False)
+                        for x, y in np.argwhere(~matrix).tolist()
+                )
+        
+        return [native_solver.AnswerSet(facts, set(model) - set(facts))]
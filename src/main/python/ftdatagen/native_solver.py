@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import re
+import typing
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  L I T E R A L                                                                                                #
+# ==================================================================================================================== #
+
+
+class Literal(object):
+    """A ground literal, which mirrors the interface of ``aspwrapper.Literal``."""
+    
+    def __init__(self, predicate: str, terms: typing.Sequence[str], positive: bool=True):
+        """Creates a new ``Literal``.
+        
+        Args:
+            predicate (str): The name of the literal's predicate.
+            terms (list[str]): The (constant) terms of the literal.
+            positive (bool, optional): Indicates whether the literal is positive or strongly negated.
+        """
+        self._predicate = predicate
+        self._terms = tuple(terms)
+        self._positive = bool(positive)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __eq__(self, other) -> bool:
+        return (
+                isinstance(other, Literal) and
+                self._predicate == other._predicate and
+                self._terms == other._terms and
+                self._positive == other._positive
+        )
+    
+    def __hash__(self) -> int:
+        return hash((self._predicate, self._terms, self._positive))
+    
+    def __str__(self) -> str:
+        return "{}{}({})".format("" if self._positive else "-", self._predicate, ",".join(self._terms))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def positive(self) -> bool:
+        """bool: Indicates whether the literal is positive or strongly negated."""
+        return self._positive
+    
+    @property
+    def predicate(self) -> str:
+        """str: The name of the literal's predicate."""
+        return self._predicate
+    
+    @property
+    def terms(self) -> typing.Tuple[str, ...]:
+        """tuple[str]: The terms of the literal."""
+        return self._terms
+
+
+# ==================================================================================================================== #
+#  CLASS  A N S W E R  S E T                                                                                           #
+# ==================================================================================================================== #
+
+
+class AnswerSet(object):
+    """An answer set, which mirrors the interface of ``aspwrapper.AnswerSet``."""
+    
+    def __init__(self, facts: typing.Iterable[Literal], inferences: typing.Iterable[Literal]):
+        """Creates a new ``AnswerSet``.
+        
+        Args:
+            facts (iterable[:class:`Literal`]): The facts that the answer set has been computed for.
+            inferences (iterable[:class:`Literal`]): All literals in the answer set that are no facts.
+        """
+        self._facts = set(facts)
+        self._inferences = set(inferences)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def facts(self) -> typing.Set[Literal]:
+        """set[:class:`Literal`]: The facts that the answer set has been computed for."""
+        return self._facts
+    
+    @property
+    def inferences(self) -> typing.Set[Literal]:
+        """set[:class:`Literal`]: All literals in the answer set that are no facts."""
+        return self._inferences
+
+
+# ==================================================================================================================== #
+#  CLASS  N O  A N S W E R  S E T  E R R O R                                                                           #
+# ==================================================================================================================== #
+
+
+class NoAnswerSetError(ValueError):
+    """Indicates that a program does not have an answer set for the provided facts."""
+
+
+# ==================================================================================================================== #
+#  CLASS  R U L E                                                                                                      #
+# ==================================================================================================================== #
+
+
+class Rule(object):
+    """A single rule or constraint of a normal logic program.
+    
+    Predicates are represented as pairs ``(name, positive)``, which means that strongly negated predicates are treated
+    as predicates of their own. An atom is a pair ``(predicate, args)``, and terms are considered as variables if they
+    start with an uppercase letter.
+    """
+    
+    BUILTINS = {
+            "<>": lambda x, y: x != y,
+            "!=": lambda x, y: x != y,
+            "=": lambda x, y: x == y,
+            "==": lambda x, y: x == y
+    }
+    """dict: Maps the supported builtin operators to the functions that implement them."""
+    
+    def __init__(
+            self,
+            head: typing.Optional[tuple],
+            positive_body: typing.List[tuple],
+            negative_body: typing.List[tuple],
+            builtins: typing.List[tuple]
+    ):
+        """Creates a new ``Rule``.
+        
+        Args:
+            head (tuple): The head atom of the rule, or ``None`` for constraints.
+            positive_body (list[tuple]): The atoms that appear positively in the body of the rule.
+            negative_body (list[tuple]): The atoms that appear default-negated in the body of the rule.
+            builtins (list[tuple]): Triples ``(operator, left, right)`` that describe the builtin literals in the body.
+        """
+        self._builtins = builtins
+        self._head = head
+        self._negative_body = negative_body
+        self._positive_body = positive_body
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def head(self) -> typing.Optional[tuple]:
+        """tuple: The head atom of the rule, or ``None`` for constraints."""
+        return self._head
+    
+    @property
+    def negative_body(self) -> typing.List[tuple]:
+        """list[tuple]: The atoms that appear default-negated in the body of the rule."""
+        return self._negative_body
+    
+    @property
+    def positive_body(self) -> typing.List[tuple]:
+        """list[tuple]: The atoms that appear positively in the body of the rule."""
+        return self._positive_body
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _is_var(term: str) -> bool:
+        """Indicates whether the given term is a variable."""
+        return term[0].isupper() or term[0] == "_"
+    
+    @classmethod
+    def _match(cls, args: tuple, values: tuple, binding: dict) -> typing.Optional[dict]:
+        """Extends the provided variable binding such that the given atom arguments match the provided values.
+        
+        Returns:
+            dict: The extended binding, or ``None``, if the arguments cannot be matched.
+        """
+        new_binding = None
+        for arg, value in zip(args, values):
+            if cls._is_var(arg):
+                bound = binding.get(arg) if new_binding is None else new_binding.get(arg)
+                if bound is None:
+                    if new_binding is None:
+                        new_binding = dict(binding)
+                    new_binding[arg] = value
+                elif bound != value:
+                    return None
+            elif arg != value:
+                return None
+        
+        return binding if new_binding is None else new_binding
+    
+    def evaluate(self, model: typing.Dict[tuple, set], delta: typing.Tuple[int, set]=None) -> typing.Iterator[dict]:
+        """Computes all variable bindings that satisfy the body of the rule w.r.t. the given model.
+        
+        Args:
+            model (dict): Maps predicates to the sets of tuples that are true for them.
+            delta (tuple, optional): A pair ``(index, tuples)``, which specifies that the positive body atom with the
+                given index should be matched against the provided tuples only (as done in semi-naive evaluation).
+        
+        Yields:
+            dict: The bindings that satisfy the body.
+        """
+        # determine the source of tuples for each of the positive body atoms
+        sources = [model.get(pred, set()) for pred, _ in self._positive_body]
+        order = list(range(len(self._positive_body)))
+        if delta is not None:
+            sources[delta[0]] = delta[1]
+            order.remove(delta[0])
+            order.insert(0, delta[0])
+        
+        # join all positive body atoms
+        bindings = [{}]
+        for atom_idx in order:
+            args = self._positive_body[atom_idx][1]
+            bound_positions = [i for i, a in enumerate(args) if not self._is_var(a) or a in bindings[0]]
+            
+            # index the source by the positions that are bound already
+            index = collections.defaultdict(list)
+            for values in sources[atom_idx]:
+                index[tuple(values[i] for i in bound_positions)].append(values)
+            
+            new_bindings = []
+            for binding in bindings:
+                key = tuple(args[i] if not self._is_var(args[i]) else binding[args[i]] for i in bound_positions)
+                for values in index.get(key, []):
+                    new_binding = self._match(args, values, binding)
+                    if new_binding is not None:
+                        new_bindings.append(new_binding)
+            bindings = new_bindings
+            if not bindings:
+                return
+        
+        # filter bindings by builtins and default negation
+        for binding in bindings:
+            if not all(
+                    self.BUILTINS[op](binding.get(left, left), binding.get(right, right))
+                    for op, left, right in self._builtins
+            ):
+                continue
+            if any(
+                    tuple(binding.get(a, a) for a in args) in model.get(pred, ())
+                    for pred, args in self._negative_body
+            ):
+                continue
+            yield binding
+    
+    @staticmethod
+    def ground(atom: tuple, binding: dict) -> tuple:
+        """Grounds the given atom w.r.t. the provided variable binding.
+        
+        Returns:
+            tuple: The ground arguments of the atom.
+        """
+        return tuple(binding.get(a, a) for a in atom[1])
+
+
+# ==================================================================================================================== #
+#  CLASS  P R O G R A M                                                                                                #
+# ==================================================================================================================== #
+
+
+class Program(object):
+    """A stratified, non-disjunctive answer set program, which can be evaluated bottom-up.
+    
+    Programs of this kind have exactly one answer set (unless some constraint is violated), which is computed stratum by
+    stratum by means of semi-naive evaluation.
+    """
+    
+    _ATOM = re.compile(r"^\s*([~-]?)\s*([a-z][A-Za-z0-9_]*)\s*(?:\((.*)\))?\s*$")
+    """Pattern: A regex that matches (possibly strongly negated) atoms."""
+    
+    _BUILTIN = re.compile(r"^\s*([A-Za-z0-9_]+)\s*(<>|!=|==|=)\s*([A-Za-z0-9_]+)\s*$")
+    """Pattern: A regex that matches builtin literals."""
+    
+    _COMMENT = re.compile(r"%.*$", re.MULTILINE)
+    """Pattern: A regex that matches comments."""
+    
+    _programs = {}
+    """dict: A cache of all programs that have been loaded from the disk, indexed by their paths and whether they
+    derive negative relations."""
+    
+    def __init__(self, rules: typing.List[Rule]):
+        """Creates a new ``Program``.
+        
+        Args:
+            rules (list[:class:`Rule`]): The rules (and constraints) that the program consists of.
+        
+        Raises:
+            ValueError: If the program is not stratified.
+        """
+        self._constraints = [r for r in rules if r.head is None]
+        self._strata = self._stratify([r for r in rules if r.head is not None])
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _parse_atom(cls, text: str) -> tuple:
+        """Parses a single atom of the form ``[~]pred(t_1, ..., t_n)``."""
+        match = cls._ATOM.match(text)
+        if match is None:
+            raise ValueError("Unable to parse atom: '{}'!".format(text.strip()))
+        negation, name, args = match.groups()
+        args = tuple(a.strip() for a in args.split(",")) if args else ()
+        
+        return (name, not negation), args
+    
+    @classmethod
+    def _parse_rule(cls, text: str) -> Rule:
+        """Parses a single rule or constraint (without the terminating dot)."""
+        head, _, body = text.partition(":-")
+        if "|" in head or re.search(r"\sv\s", head):
+            raise ValueError("Disjunctive rules are not supported: '{}'!".format(text.strip()))
+        
+        # split the body at all commas that are not enclosed in parentheses
+        body_literals = []
+        depth = 0
+        current = ""
+        for char in body:
+            if char == "," and depth == 0:
+                body_literals.append(current)
+                current = ""
+                continue
+            depth += (char == "(") - (char == ")")
+            current += char
+        if current.strip():
+            body_literals.append(current)
+        
+        # parse the body literals
+        positive_body = []
+        negative_body = []
+        builtins = []
+        for lit in body_literals:
+            lit = lit.strip()
+            builtin = cls._BUILTIN.match(lit)
+            if builtin is not None:
+                builtins.append((builtin.group(2), builtin.group(1), builtin.group(3)))
+            elif lit.startswith("not "):
+                negative_body.append(cls._parse_atom(lit[4:]))
+            else:
+                positive_body.append(cls._parse_atom(lit))
+        
+        return Rule(cls._parse_atom(head) if head.strip() else None, positive_body, negative_body, builtins)
+    
+    @staticmethod
+    def _stratify(rules: typing.List[Rule]) -> typing.List[typing.List[Rule]]:
+        """Partitions the provided rules into strata.
+        
+        Raises:
+            ValueError: If the rules are not stratified, i.e., if there is recursion through default negation.
+        """
+        # compute the stratum of each predicate as the longest number of negative dependencies that it relies on
+        strata = {}
+        for r in rules:
+            strata[r.head[0]] = 0
+        changed = True
+        while changed:
+            changed = False
+            for r in rules:
+                level = max(
+                        [strata.get(pred, 0) for pred, _ in r.positive_body] +
+                        [strata.get(pred, 0) + 1 for pred, _ in r.negative_body]
+                )
+                if level > strata[r.head[0]]:
+                    if level > len(strata):
+                        raise ValueError("The provided program is not stratified!")
+                    strata[r.head[0]] = level
+                    changed = True
+        
+        # group the rules by the strata of their heads
+        grouped = collections.defaultdict(list)
+        for r in rules:
+            grouped[strata[r.head[0]]].append(r)
+        
+        return [grouped[level] for level in sorted(grouped)]
+    
+    def evaluate(self, facts: typing.Iterable[tuple]) -> typing.Dict[tuple, set]:
+        """Computes the unique answer set of the program for the provided facts.
+        
+        Args:
+            facts (iterable[tuple]): The facts as atoms ``(predicate, args)``.
+        
+        Returns:
+            dict: Maps predicates to the sets of tuples that are true for them.
+        
+        Raises:
+            NoAnswerSetError: If the answer set violates a constraint or is inconsistent, i.e., if there is no answer
+                set.
+        """
+        model = collections.defaultdict(set)
+        for pred, args in facts:
+            model[pred].add(tuple(args))
+        
+        for stratum in self._strata:
+            recursive = {r.head[0] for r in stratum}
+            
+            # the first round considers all rules w.r.t. the full model
+            delta = collections.defaultdict(set)
+            for r in stratum:
+                for binding in r.evaluate(model):
+                    ground = Rule.ground(r.head, binding)
+                    if ground not in model[r.head[0]]:
+                        delta[r.head[0]].add(ground)
+            
+            # all subsequent rounds only consider derivations that involve at least one new atom
+            while delta:
+                for pred, tuples in delta.items():
+                    model[pred] |= tuples
+                new_delta = collections.defaultdict(set)
+                for r in stratum:
+                    for idx, (pred, _) in enumerate(r.positive_body):
+                        if pred in recursive and delta.get(pred):
+                            for binding in r.evaluate(model, delta=(idx, delta[pred])):
+                                ground = Rule.ground(r.head, binding)
+                                if ground not in model[r.head[0]]:
+                                    new_delta[r.head[0]].add(ground)
+                delta = new_delta
+        
+        # check consistency as well as all constraints
+        for (name, positive), tuples in model.items():
+            if positive and tuples & model.get((name, False), set()):
+                raise NoAnswerSetError("There is no answer set, as the model is inconsistent w.r.t. '{}'!".format(name))
+        for c in self._constraints:
+            for _ in c.evaluate(model):
+                raise NoAnswerSetError("There is no answer set, as some constraint is violated!")
+        
+        return model
+    
+    @classmethod
+    def load(cls, path: str, negative_relations: bool=True) -> "Program":
+        """Loads the program that is stored in the specified file.
+        
+        Programs are cached, i.e., every file is parsed at most once.
+        
+        Args:
+            path (str): The path of the file to load.
+            negative_relations (bool, optional): If ``False``, then all rules that derive strongly negated binary atoms
+                are dropped from the program, which is sound as long as no other rule depends on these.
+        
+        Returns:
+            :class:`Program`: The loaded program.
+        """
+        if (path, negative_relations) not in cls._programs:
+            with open(path, "r") as f:
+                text = cls._COMMENT.sub("", f.read())
+            rules = [cls._parse_rule(s) for s in text.split(".") if s.strip()]
+            if not negative_relations:
+                rules = [r for r in rules if r.head is None or r.head[0][1] or len(r.head[1]) != 2]
+            cls._programs[path, negative_relations] = cls(rules)
+        
+        return cls._programs[path, negative_relations]
+
+
+# ==================================================================================================================== #
+#  CLASS  N A T I V E  S O L V E R                                                                                     #
+# ==================================================================================================================== #
+
+
+class NativeSolver(object):
+    """An in-process solver for stratified, non-disjunctive answer set programs.
+    
+    The ``NativeSolver`` provides the same interface as ``aspwrapper.DlvSolver``, but computes answer sets without
+    launching an external process.
+    """
+    
+    def run(self, path: str, facts: typing.Iterable, negative_relations: bool=True) -> typing.List[AnswerSet]:
+        """Computes the answer set of the specified program for the given facts.
+        
+        Args:
+            path (str): The path of the answer set program to evaluate.
+            facts (iterable): The facts to evaluate the program for. These may be any objects that provide the
+                attributes ``predicate``, ``terms``, and ``positive``, e.g., instances of ``aspwrapper.Literal``.
+            negative_relations (bool, optional): If ``False``, then strongly negated binary atoms are not derived (see
+                :meth:`Program.load`).
+        
+        Returns:
+            list[:class:`AnswerSet`]: A list that contains the answer set, or an empty list, if there is none.
+        """
+        facts = [Literal(f.predicate, f.terms, f.positive) for f in facts]
+        try:
+            model = Program.load(path, negative_relations=negative_relations).evaluate(
+                    ((f.predicate, f.positive), f.terms) for f in facts
+            )
+        except NoAnswerSetError:
+            return []
+        
+        inferences = {
+                Literal(name, args, positive)
+                for (name, positive), tuples in model.items()
+                for args in tuples
+        }
+        
+        return [AnswerSet(facts, inferences - set(facts))]
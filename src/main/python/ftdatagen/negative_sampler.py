@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import random
+import typing
+
+from ftdatagen import native_solver
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class NegativeSampler(object):
+    """Creates negative relation literals for family tree samples.
+    
+    Under the closed-world assumption of the ontology, every pair of persons that is not known to be in some relation
+    gives rise to a negative literal of the same, which means that the number of negative literals in a sample grows
+    quadratically with the number of persons. Instead of materializing all of these, a sample may store its positive
+    literals only, and the negative ones may be derived whenever the sample is read (see :meth:`derive_negatives`).
+    Alternatively, a fixed number of negatives per positive literal may be sampled (see :meth:`sample_negatives`).
+    """
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _collect_positives(
+            cls,
+            literals: typing.Iterable,
+            relations: typing.Sequence[str]
+    ) -> typing.Dict[str, typing.Set[typing.Tuple[str, str]]]:
+        """Collects the pairs of persons that are in each of the given relations.
+        
+        Args:
+            literals (iterable): The literals to collect the positive ones from.
+            relations (list[str]): The relations to consider.
+        
+        Returns:
+            dict[str, set[tuple[str, str]]]: Maps every relation to the pairs of persons that are in the same.
+        """
+        positives = collections.OrderedDict((r, set()) for r in relations)
+        for lit in literals:
+            if lit.positive and lit.predicate in positives:
+                positives[lit.predicate].add(tuple(lit.terms))
+        
+        return positives
+    
+    @classmethod
+    def _sample_random_pairs(
+            cls,
+            persons: typing.List[str],
+            excluded: typing.Set[typing.Tuple[str, str]],
+            num: int,
+            rng: random.Random
+    ) -> typing.List[typing.Tuple[str, str]]:
+        """Samples pairs of persons uniformly at random without replacement.
+        
+        Args:
+            persons (list[str]): The persons to create pairs of.
+            excluded (set[tuple[str, str]]): Pairs that must not be sampled.
+            num (int): The number of pairs to sample. If there are less pairs available, then all of them are sampled.
+            rng (random.Random): The RNG to use.
+        
+        Returns:
+            list[tuple[str, str]]: The sampled pairs.
+        """
+        num_available = len(persons) ** 2 - len(excluded)
+        num = min(num, num_available)
+        if num <= 0:
+            return []
+        
+        # if a large share of the available pairs is requested, then we enumerate them, and use rejection sampling
+        # otherwise in order to avoid materializing all pairs
+        if 2 * num >= num_available:
+            return rng.sample([(x, y) for x in persons for y in persons if (x, y) not in excluded], num)
+        
+        excluded = set(excluded)
+        pairs = []
+        while len(pairs) < num:
+            pair = (persons[rng.randrange(len(persons))], persons[rng.randrange(len(persons))])
+            if pair not in excluded:
+                excluded.add(pair)
+                pairs.append(pair)
+        
+        return pairs
+    
+    @classmethod
+    def derive_negatives(
+            cls,
+            persons: typing.Iterable[str],
+            literals: typing.Iterable,
+            relations: typing.Sequence[str]
+    ) -> typing.List[native_solver.Literal]:
+        """Derives all negative literals of the given relations under the closed-world assumption.
+        
+        This allows for restoring the negative literals of a sample that has been created with implicit negatives.
+        
+        Args:
+            persons (iterable[str]): The names of all persons in the sample.
+            literals (iterable): The positive facts and inferences of the sample, which have to provide the attributes
+                ``predicate``, ``terms``, and ``positive``. Negative literals are ignored.
+            relations (list[str]): The relations to derive negative literals for.
+        
+        Returns:
+            list[:class:`native_solver.Literal`]: The derived negative literals.
+        """
+        persons = sorted(persons)
+        return [
+                native_solver.Literal(r, (x, y), positive=False)
+                for r, pairs in cls._collect_positives(literals, relations).items()
+                for x in persons
+                for y in persons
+                if (x, y) not in pairs
+        ]
+    
+    @classmethod
+    def sample_negatives(
+            cls,
+            persons: typing.Iterable[str],
+            literals: typing.Iterable,
+            relations: typing.Sequence[str],
+            num_per_positive: int,
+            rng: random.Random,
+            hard: bool=False
+    ) -> typing.List[native_solver.Literal]:
+        """Samples negative literals of the given relations under the closed-world assumption.
+        
+        For every relation, ``num_per_positive`` negative literals are sampled for each positive one, i.e., relations
+        that do not hold for any pair of persons do not give rise to any negative literals either. If ``hard`` is
+        ``True``, then negatives are sampled from pairs of persons that are in some other one of the given relations,
+        e.g., ``~motherOf(X, Y)`` where ``X`` is actually the grandmother of ``Y``, and only if there are not enough of
+        these, the remaining negatives are sampled uniformly at random from all pairs of persons.
+        
+        Args:
+            persons (iterable[str]): The names of all persons in the sample.
+            literals (iterable): The positive facts and inferences of the sample, which have to provide the attributes
+                ``predicate``, ``terms``, and ``positive``. Negative literals are ignored.
+            relations (list[str]): The relations to sample negative literals for.
+            num_per_positive (int): The number of negative literals to sample per positive one.
+            rng (random.Random): The RNG to use for sampling.
+            hard (bool, optional): Indicates whether to prefer hard negatives.
+        
+        Returns:
+            list[:class:`native_solver.Literal`]: The sampled negative literals.
+        """
+        persons = sorted(persons)
+        positives = cls._collect_positives(literals, relations)
+        related = sorted(set().union(*positives.values())) if hard else []
+        
+        negatives = []
+        for r, pairs in positives.items():
+            num = num_per_positive * len(pairs)
+            
+            # sample hard negatives first, if these are requested
+            sampled = []
+            if hard:
+                candidates = [p for p in related if p not in pairs]
+                sampled = rng.sample(candidates, min(num, len(candidates)))
+            
+            # fill up with random negatives
+            sampled += cls._sample_random_pairs(persons, pairs.union(sampled), num - len(sampled), rng)
+            negatives.extend(native_solver.Literal(r, p, positive=False) for p in sampled)
+        
+        return negatives
@@ -178,13 +178,33 @@ class PersonFactory(object):
             cls.reset()
     
     @classmethod
-    def create_person(cls, tree_level: int, female: bool=None) -> person.Person:
+    def create_name_pool(cls) -> typing.Dict[bool, typing.List[str]]:
+        """Creates a pool of names that may be used for creating persons (see :meth:`sample_name`).
+        
+        Returns:
+            dict[bool, list[str]]: The created pool, which maps ``True`` and ``False`` to lists of female and male
+                names, respectively.
+        """
+        return {True: cls.FEMALE_NAMES[:], False: cls.MALE_NAMES[:]}
+    
+    @classmethod
+    def create_person(
+            cls,
+            tree_level: int,
+            female: bool=None,
+            rng: random.Random=None,
+            name: str=None
+    ) -> person.Person:
         """Constructs a new instance of :class:`person.Person`.
 
         Args:
             tree_level (int): The level in the family tree on which the created person is located.
             female (bool, optional): Indicates whether the created person is female. If not provided, then the gender
                 is sampled randomly.
+            rng (random.Random, optional): The RNG to use for sampling the person's gender and name. If not provided,
+                then the global RNG of the module ``random`` is used.
+            name (str, optional): The name of the created person. If not provided, then a name that has not been used
+                in the current context yet is sampled randomly.
         """
         # sanitize args
         insanity.sanitize_type("tree_level", tree_level, int)
@@ -195,20 +215,53 @@ class PersonFactory(object):
         # fetch current context
         ctx = dc.DataContext.get_context()
         
+        # fall back to the global RNG if none was provided
+        if rng is None:
+            rng = random
+        
         # determine gender
         if female is None:
-            female = random.random() > 0.5
+            female = rng.random() > 0.5
         else:
             female = bool(female)
         
-        # fetching names that may be used
-        if female:
-            remaining_names = ctx[cls._REMAINING_FEMALE_NAMES]
-        else:
-            remaining_names = ctx[cls._REMAINING_MALE_NAMES]
+        # determine name
+        if name is None:
+            name_pool = {True: ctx[cls._REMAINING_FEMALE_NAMES], False: ctx[cls._REMAINING_MALE_NAMES]}
+            name = cls.sample_name(name_pool, female, rng)
+            ctx[cls._REMAINING_FEMALE_NAMES] = name_pool[True]
+            ctx[cls._REMAINING_MALE_NAMES] = name_pool[False]
+        
+        # return new person
+        return individual_factory.IndividualFactory.create_individual(
+                name,
+                target_type=_Person,
+                args=[female, tree_level]
+        )
+    
+    @classmethod
+    def reset(cls) -> None:
+        """Resets the ``PersonFactory`` to its initial state."""
+        ctx = dc.DataContext.get_context()
+        ctx[cls._REMAINING_FEMALE_NAMES] = cls.FEMALE_NAMES[:]
+        ctx[cls._REMAINING_MALE_NAMES] = cls.MALE_NAMES[:]
+    
+    @classmethod
+    def sample_name(cls, name_pool: typing.Dict[bool, typing.List[str]], female: bool, rng: random.Random) -> str:
+        """Samples a name that has not been used yet from the provided pool, and removes it from the same.
+        
+        Args:
+            name_pool (dict[bool, list[str]]): The pool to sample from (see :meth:`create_name_pool`).
+            female (bool): Indicates whether to sample a female name.
+            rng (random.Random): The RNG to use for sampling the name.
+        
+        Returns:
+            str: The sampled name.
+        """
+        remaining_names = name_pool[female]
         
         # determine name
-        name_index = random.randrange(len(remaining_names))
+        name_index = rng.randrange(len(remaining_names))
         name = remaining_names[name_index]
         del remaining_names[name_index]
         
@@ -225,23 +278,11 @@ class PersonFactory(object):
             
             # create new names to use
             if female:
-                ctx[cls._REMAINING_FEMALE_NAMES] = [n + postfix for n in cls.FEMALE_NAMES]
+                name_pool[female] = [n + postfix for n in cls.FEMALE_NAMES]
             else:
-                ctx[cls._REMAINING_MALE_NAMES] = [n + postfix for n in cls.MALE_NAMES]
+                name_pool[female] = [n + postfix for n in cls.MALE_NAMES]
         
-        # return new person
-        return individual_factory.IndividualFactory.create_individual(
-                name,
-                target_type=_Person,
-                args=[female, tree_level]
-        )
-    
-    @classmethod
-    def reset(cls) -> None:
-        """Resets the ``PersonFactory`` to its initial state."""
-        ctx = dc.DataContext.get_context()
-        ctx[cls._REMAINING_FEMALE_NAMES] = cls.FEMALE_NAMES[:]
-        ctx[cls._REMAINING_MALE_NAMES] = cls.MALE_NAMES[:]
+        return name
 
 
 # ==================================================================================================================== #
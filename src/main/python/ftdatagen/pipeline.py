@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import queue
+import threading
+import typing
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class Pipeline(object):
+    """A sequence of processing stages, each of which runs in a thread of its own, that are connected by bounded queues.
+    
+    The first stage of a pipeline is an iterable, which is consumed by a thread of its own, and each of the subsequent
+    stages is a function that maps a single item to a sequence of output items, which are passed on to the next stage
+    one by one. The output items of the last stage are yielded, in order, when the pipeline is iterated over. As the
+    queues between stages are bounded, stages that run ahead block until the subsequent stages have caught up.
+    
+    Because of the global interpreter lock, stages overlap only while they are waiting, e.g., for I/O or for an
+    external process, but CPU-bound stages do not run concurrently.
+    
+    If any of the stages raises an error, then the same is re-raised when the according item would have been yielded.
+    """
+    
+    _DONE = object()
+    """object: A sentinel that marks the end of a stream of items."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            source: typing.Iterable,
+            stages: typing.Sequence[typing.Tuple[str, typing.Callable[[typing.Any], typing.Iterable]]],
+            queue_size: int
+    ):
+        """Creates a new ``Pipeline``.
+        
+        Args:
+            source (iterable): The iterable that provides the input items of the pipeline.
+            stages (list[tuple[str, callable]]): The names and functions of all stages that follow the source.
+            queue_size (int): The maximum number of items in any of the queues between stages.
+        """
+        self._names = [name for name, _ in stages] + ["output"]
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in self._names]
+        self._started = False
+        
+        self._threads = [threading.Thread(target=self._run_source, args=(source, self._queues[0]), daemon=True)]
+        for (_, fn), in_queue, out_queue in zip(stages, self._queues[:-1], self._queues[1:]):
+            self._threads.append(threading.Thread(target=self._run_stage, args=(fn, in_queue, out_queue), daemon=True))
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __iter__(self) -> typing.Iterator:
+        if self._started:
+            raise RuntimeError("A Pipeline can be iterated over only once!")
+        self._started = True
+        
+        for t in self._threads:
+            t.start()
+        
+        while True:
+            item = self._queues[-1].get()
+            if item is self._DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def queue_depths(self) -> typing.Dict[str, int]:
+        """dict[str, int]: The number of items that are waiting to be processed by each of the stages.
+        
+        The key ``'output'`` refers to the items that have been processed by the last stage, but not been yielded yet.
+        A queue that is full most of the time indicates that the according stage is a bottleneck.
+        """
+        return collections.OrderedDict((name, q.qsize()) for name, q in zip(self._names, self._queues))
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _run_source(cls, source: typing.Iterable, out_queue: queue.Queue) -> None:
+        """Feeds all items of the source into the first queue."""
+        try:
+            for item in source:
+                out_queue.put(item)
+        except BaseException as e:
+            out_queue.put(_Failure(e))
+        finally:
+            out_queue.put(cls._DONE)
+    
+    @classmethod
+    def _run_stage(cls, fn: typing.Callable, in_queue: queue.Queue, out_queue: queue.Queue) -> None:
+        """Processes the items of one queue, and feeds the outputs into the next one."""
+        while True:
+            item = in_queue.get()
+            if item is cls._DONE or isinstance(item, _Failure):
+                out_queue.put(item)
+                if item is cls._DONE:
+                    return
+                continue
+            try:
+                for output in fn(item):
+                    out_queue.put(output)
+            except BaseException as e:
+                out_queue.put(_Failure(e))
+
+
+class _Failure(object):
+    """Wraps an error that has been raised by one of the stages of a :class:`Pipeline`."""
+    
+    def __init__(self, error: BaseException):
+        self.error = error
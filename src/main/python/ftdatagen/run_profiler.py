@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+import typing
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RunProfiler(object):
+    """Profiles the CPU time and memory usage of a window of samples of a generation run.
+    
+    Once the specified number of samples has been created, the profiler starts to collect a CPU profile by means of
+    ``cProfile``, and to trace memory allocations by means of ``tracemalloc``. After the samples in the window have
+    been created, both are stopped, and the following artefacts are written to the output directory:
+    
+    - :attr:`CPU_PROFILE_FILE_NAME`: the raw CPU profile, which can be loaded by means of ``pstats``,
+    - :attr:`SUMMARY_FILE_NAME`: the time spent on each stage of the generator, i.e., ``sampling``, ``dedup``,
+      ``inference``, and ``writing``, for the samples in the window, followed by the functions that took the most
+      time, and
+    - :attr:`MEMORY_FILE_NAME`: the peak memory usage during the window, followed by the lines of code that allocated
+      the most memory that was still in use at the end of the window.
+    
+    Only the process that the profiler is created in is profiled, whereas the stage timings include work that has been
+    done by worker processes as well.
+    """
+    
+    CPU_PROFILE_FILE_NAME = "profile.prof"
+    """str: The name of the file that the raw CPU profile is written to."""
+    
+    MEMORY_FILE_NAME = "profile-memory.txt"
+    """str: The name of the file that the memory profile is written to."""
+    
+    NUM_FUNCTIONS = 50
+    """int: The number of functions that are listed in the summary of the CPU profile."""
+    
+    NUM_MEMORY_SITES = 50
+    """int: The number of lines of code that are listed in the memory profile."""
+    
+    SUMMARY_FILE_NAME = "profile.txt"
+    """str: The name of the file that the summary of the CPU profile is written to."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, output_dir: str, start: int, num_samples: int):
+        """Creates a new ``RunProfiler``, which starts profiling right away, if ``start`` is ``0``.
+        
+        Args:
+            output_dir (str): The directory that the profiles are written to.
+            start (int): The number of samples that are created before profiling starts.
+            num_samples (int): The number of samples to profile.
+        """
+        self._num_created = 0
+        self._num_profiled = 0
+        self._num_samples = num_samples
+        self._output_dir = output_dir
+        self._profile = None
+        self._stage_times = collections.OrderedDict()
+        self._start = start
+        
+        if start == 0:
+            self._start_profiling()
+    
+    #  METHODS  ########################################################################################################
+    
+    def _start_profiling(self) -> None:
+        """Starts to collect both profiles."""
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+    
+    def _stop_profiling(self) -> None:
+        """Stops to collect both profiles, and writes all artefacts to the output directory."""
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        # write the raw CPU profile
+        self._profile.dump_stats(os.path.join(self._output_dir, self.CPU_PROFILE_FILE_NAME))
+        
+        # summarize the CPU profile, starting with the time spent on each stage
+        stream = io.StringIO()
+        stream.write("profiled {} samples after the first {}\n\n".format(self._num_profiled, self._start))
+        stream.write("TIME PER STAGE\n\n")
+        total = sum(self._stage_times.values())
+        for stage, duration in self._stage_times.items():
+            stream.write(
+                    "{:10} {:10.3f}s {:6.1%}\n".format(stage, duration, duration / total if total > 0 else 0.0)
+            )
+        stream.write("\nFUNCTIONS\n\n")
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats("cumulative").print_stats(self.NUM_FUNCTIONS)
+        with open(os.path.join(self._output_dir, self.SUMMARY_FILE_NAME), "w") as f:
+            f.write(stream.getvalue())
+        
+        # write the memory profile
+        with open(os.path.join(self._output_dir, self.MEMORY_FILE_NAME), "w") as f:
+            f.write("traced memory: {:.1f} MiB (peak: {:.1f} MiB)\n\n".format(current / 2 ** 20, peak / 2 ** 20))
+            for stat in snapshot.statistics("lineno")[:self.NUM_MEMORY_SITES]:
+                f.write(str(stat) + "\n")
+        
+        self._profile = None
+    
+    def close(self) -> None:
+        """Stops profiling, if the run ended before the window was complete, and writes all artefacts."""
+        if self._profile is not None:
+            self._stop_profiling()
+    
+    def record(self, timings: typing.Dict[str, float]) -> None:
+        """Records a single sample that has been created, and starts or stops profiling as needed.
+        
+        Args:
+            timings (dict[str, float]): The durations (in seconds) of the stages that the sample went through.
+        """
+        self._num_created += 1
+        if self._profile is not None:
+            for stage, duration in timings.items():
+                self._stage_times[stage] = self._stage_times.get(stage, 0.0) + duration
+            self._num_profiled += 1
+            if self._num_profiled == self._num_samples:
+                self._stop_profiling()
+        elif self._num_created == self._start:
+            self._start_profiling()
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+
+import bisect
+import collections
+import json
+import os
+import time
+import typing
+
+from ftdatagen import saturation_monitor
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RunReport(object):
+    """Collects performance metrics of a generation run, and writes them as a machine-readable report.
+    
+    The report is a JSON file in the output directory, which is replaced atomically whenever it is saved, i.e., at
+    regular intervals as well as at the end of a run. Besides the throughput of the run, it specifies the number of
+    sampled candidates that have been rejected as duplicates, the number of bytes that have been written, and a
+    histogram of the durations of each stage, i.e., ``sampling``, ``dedup`` (checking candidates for isomorphism),
+    ``inference``, and ``writing``, which are computed over all samples that have been created in the run.
+    
+    The bucket ``i`` of a histogram counts the samples with durations of at most ``BUCKET_BOUNDS[i]`` seconds that are
+    not counted by any of the previous buckets, and the last bucket counts all samples that exceed all bounds.
+    """
+    
+    BUCKET_BOUNDS = [
+            0.0001, 0.00025, 0.0005,
+            0.001, 0.0025, 0.005,
+            0.01, 0.025, 0.05,
+            0.1, 0.25, 0.5,
+            1.0, 2.5, 5.0,
+            10.0, 25.0, 50.0
+    ]
+    """list[float]: The upper bounds (in seconds) of the buckets of the duration histograms."""
+    
+    FILE_NAME = "run-report.json"
+    """str: The name of the file that the report is written to."""
+    
+    STAGES = ["sampling", "dedup", "inference", "writing"]
+    """list[str]: The stages that the durations are recorded for."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, output_dir: str, first_sample: int, monitor: saturation_monitor.SaturationMonitor):
+        """Creates a new ``RunReport``.
+        
+        Args:
+            output_dir (str): The output directory of the run, which the report is written to.
+            first_sample (int): The index of the first sample that is created in the run.
+            monitor (:class:`saturation_monitor.SaturationMonitor`): The monitor that keeps track of rejected family
+                trees in the run, which may have been restored from a checkpoint already.
+        """
+        self._first_sample = first_sample
+        self._monitor = monitor
+        self._monitor_attempts = monitor.num_attempts  # the number of candidates that were sampled in previous runs
+        self._monitor_rejections = monitor.num_rejections  # the number of those that were rejected
+        self._num_bytes = 0
+        self._num_samples = 0
+        self._output_dir = output_dir
+        self._stages = collections.OrderedDict(
+                (
+                        stage,
+                        {
+                                "count": 0,
+                                "total": 0.0,
+                                "min": None,
+                                "max": None,
+                                "buckets": [0] * (len(self.BUCKET_BOUNDS) + 1)
+                        }
+                )
+                for stage in self.STAGES
+        )
+        self._start_time = time.time()
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def num_bytes(self) -> int:
+        """int: The total number of bytes that have been written for the samples of the run."""
+        return self._num_bytes
+    
+    @property
+    def num_samples(self) -> int:
+        """int: The number of samples that have been created in the run."""
+        return self._num_samples
+    
+    @property
+    def path(self) -> str:
+        """str: The path of the file that the report is written to."""
+        return os.path.join(self._output_dir, self.FILE_NAME)
+    
+    #  METHODS  ########################################################################################################
+    
+    def record(self, timings: typing.Dict[str, float], num_bytes: int) -> None:
+        """Records a single sample that has been created.
+        
+        Args:
+            timings (dict[str, float]): The durations (in seconds) of the stages that the sample went through. Stages
+                that are not listed in :attr:`STAGES` are ignored.
+            num_bytes (int): The number of bytes that have been written for the sample.
+        """
+        self._num_bytes += num_bytes
+        self._num_samples += 1
+        for stage, duration in timings.items():
+            stats = self._stages.get(stage)
+            if stats is None:
+                continue
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["min"] = duration if stats["min"] is None else min(stats["min"], duration)
+            stats["max"] = duration if stats["max"] is None else max(stats["max"], duration)
+            stats["buckets"][bisect.bisect_left(self.BUCKET_BOUNDS, duration)] += 1
+    
+    def save(self, finished: bool=False) -> None:
+        """Writes the current state of the report to the output directory.
+        
+        Args:
+            finished (bool, optional): Indicates whether the run has been completed.
+        """
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(finished=finished), f, indent=4)
+        os.replace(tmp_path, self.path)
+    
+    def to_dict(self, finished: bool=False) -> typing.Dict[str, typing.Any]:
+        """Creates a JSON-serializable representation of the report.
+        
+        Args:
+            finished (bool, optional): Indicates whether the run has been completed.
+        
+        Returns:
+            dict: The created representation.
+        """
+        elapsed = time.time() - self._start_time
+        
+        # summarize the durations of all stages
+        stages = collections.OrderedDict()
+        for stage, stats in self._stages.items():
+            stages[stage] = collections.OrderedDict(
+                    [
+                            ("count", stats["count"]),
+                            ("total", stats["total"]),
+                            ("mean", stats["total"] / stats["count"] if stats["count"] > 0 else None),
+                            ("min", stats["min"]),
+                            ("max", stats["max"]),
+                            ("buckets", stats["buckets"])
+                    ]
+            )
+        
+        return collections.OrderedDict(
+                [
+                        ("finished", finished),
+                        ("start_time", self._start_time),
+                        ("elapsed", elapsed),
+                        ("first_sample", self._first_sample),
+                        ("num_samples", self._num_samples),
+                        ("samples_per_sec", self._num_samples / elapsed if elapsed > 0 else 0.0),
+                        ("num_bytes", self._num_bytes),
+                        ("bytes_per_sec", self._num_bytes / elapsed if elapsed > 0 else 0.0),
+                        ("num_candidates", self._monitor.num_attempts - self._monitor_attempts),
+                        ("num_rejections", self._monitor.num_rejections - self._monitor_rejections),
+                        ("rejection_rate", self._monitor.rejection_rate),
+                        ("bucket_bounds", self.BUCKET_BOUNDS),
+                        ("stages", stages)
+                ]
+        )
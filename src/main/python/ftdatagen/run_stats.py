@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import typing
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RunStats(object):
+    """The statistics of the samples that have been created in a generation run.
+    
+    All counters are sparse, i.e., they store only values that have actually been observed, which means that their size
+    does not depend on the constraints of the family trees. Furthermore, the statistics are additive, such that the
+    statistics of separate parts of a dataset, e.g., the samples created by different workers or stored in different
+    shards, can be combined by means of :meth:`merge`.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, relations: typing.Sequence[str]):
+        """Creates a new ``RunStats`` object that does not contain any samples yet.
+        
+        Args:
+            relations (list[str]): The relations that the numbers of inferences are counted for.
+        """
+        self._neg_relation_counts = collections.OrderedDict((r, 0) for r in relations)
+        self._pos_relation_counts = collections.OrderedDict((r, 0) for r in relations)
+        self._total_relations_counts = collections.Counter()
+        self._tree_size_counts = collections.Counter()
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def neg_relation_counts(self) -> typing.Dict[str, int]:
+        """dict[str, int]: The total number of negative inferences for every relation."""
+        return self._neg_relation_counts
+    
+    @property
+    def num_samples(self) -> int:
+        """int: The number of samples that the statistics refer to."""
+        return sum(self._tree_size_counts.values())
+    
+    @property
+    def pos_relation_counts(self) -> typing.Dict[str, int]:
+        """dict[str, int]: The total number of positive inferences for every relation."""
+        return self._pos_relation_counts
+    
+    @property
+    def total_relations_counts(self) -> typing.Dict[int, int]:
+        """dict[int, int]: Maps numbers of parentOf relations to the number of samples that contain as many."""
+        return self._total_relations_counts
+    
+    @property
+    def tree_size_counts(self) -> typing.Dict[int, int]:
+        """dict[int, int]: Maps tree sizes to the number of samples that have family trees of the same."""
+        return self._tree_size_counts
+    
+    #  METHODS  ########################################################################################################
+    
+    def add(self, stats: typing.Dict[str, typing.Any]) -> None:
+        """Adds a single sample to the statistics.
+        
+        Args:
+            stats (dict): The statistics of the sample, i.e., its ``tree_size``, its ``num_relations``, and its
+                ``pos_relation_counts`` as well as ``neg_relation_counts``.
+        """
+        self._tree_size_counts[stats["tree_size"]] += 1
+        self._total_relations_counts[stats["num_relations"]] += 1
+        for r, count in stats["pos_relation_counts"].items():
+            self._pos_relation_counts[r] += count
+        for r, count in stats["neg_relation_counts"].items():
+            self._neg_relation_counts[r] += count
+    
+    @classmethod
+    def from_dict(cls, relations: typing.Sequence[str], state: typing.Dict[str, typing.Any]) -> "RunStats":
+        """Restores statistics from their JSON-serializable representation (see :meth:`to_dict`).
+        
+        Args:
+            relations (list[str]): The relations that the numbers of inferences are counted for.
+            state (dict): The representation of the statistics.
+        
+        Returns:
+            :class:`RunStats`: The restored statistics.
+        """
+        stats = cls(relations)
+        for key, counter in [
+                ("tree_size_counts", stats._tree_size_counts),
+                ("total_relations_counts", stats._total_relations_counts)
+        ]:
+            counter.update({int(value): count for value, count in state[key].items()})
+        stats._pos_relation_counts.update(state["inferences_pos_relation_counts"])
+        stats._neg_relation_counts.update(state["inferences_neg_relation_counts"])
+        
+        return stats
+    
+    def merge(self, other: "RunStats") -> None:
+        """Adds all samples of other statistics to these ones.
+        
+        Args:
+            other (:class:`RunStats`): The statistics to add.
+        """
+        self._tree_size_counts.update(other._tree_size_counts)
+        self._total_relations_counts.update(other._total_relations_counts)
+        for r, count in other._pos_relation_counts.items():
+            self._pos_relation_counts[r] = self._pos_relation_counts.get(r, 0) + count
+        for r, count in other._neg_relation_counts.items():
+            self._neg_relation_counts[r] = self._neg_relation_counts.get(r, 0) + count
+    
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Creates a JSON-serializable representation of the statistics.
+        
+        Returns:
+            dict: The created representation.
+        """
+        return {
+                "tree_size_counts": {str(v): c for v, c in sorted(self._tree_size_counts.items())},
+                "total_relations_counts": {str(v): c for v, c in sorted(self._total_relations_counts.items())},
+                "inferences_pos_relation_counts": dict(self._pos_relation_counts),
+                "inferences_neg_relation_counts": dict(self._neg_relation_counts)
+        }
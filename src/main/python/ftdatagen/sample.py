@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+from reldata.data import knowledge_graph
+
+from ftdatagen import family_tree as ft
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class Sample(object):
+    """A single sample of a family tree dataset that is kept in memory.
+    
+    A ``Sample`` provides the family tree that it was created from, all facts and inferences about the same, which are
+    objects that provide the attributes ``predicate``, ``terms``, and ``positive``, and the knowledge graph that is
+    written to the disk when a dataset is generated.
+    """
+    
+    def __init__(
+            self,
+            index: int,
+            name: str,
+            family_tree: ft.FamilyTree,
+            facts: typing.List[typing.Any],
+            inferences: typing.List[typing.Any],
+            kg: knowledge_graph.KnowledgeGraph
+    ):
+        """Creates a new ``Sample``.
+        
+        Args:
+            index (int): The index of the sample in the dataset.
+            name (str): The name of the sample, which is used as base name for the files created for it.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the sample was created from.
+            facts (list): All facts that are included in the sample.
+            inferences (list): All inferences that are included in the sample.
+            kg (knowledge_graph.KnowledgeGraph): The knowledge graph that describes the sample.
+        """
+        self._facts = facts
+        self._family_tree = family_tree
+        self._index = index
+        self._inferences = inferences
+        self._kg = kg
+        self._name = name
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def facts(self) -> typing.List[typing.Any]:
+        """list: All facts that are included in the sample, sorted in the order that they are written to the disk."""
+        return self._facts
+    
+    @property
+    def family_tree(self) -> ft.FamilyTree:
+        """:class:`family_tree.FamilyTree`: The family tree that the sample was created from."""
+        return self._family_tree
+    
+    @property
+    def index(self) -> int:
+        """int: The index of the sample in the dataset."""
+        return self._index
+    
+    @property
+    def inferences(self) -> typing.List[typing.Any]:
+        """list: All inferences that are included in the sample, sorted in the order that they are written to the disk.
+        """
+        return self._inferences
+    
+    @property
+    def kg(self) -> knowledge_graph.KnowledgeGraph:
+        """knowledge_graph.KnowledgeGraph: The knowledge graph that describes the sample."""
+        return self._kg
+    
+    @property
+    def name(self) -> str:
+        """str: The name of the sample, which is used as base name for the files created for it."""
+        return self._name
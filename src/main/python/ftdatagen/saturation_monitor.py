@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import typing
+
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SaturationMonitor(object):
+    """Keeps track of how many sampled family trees are rejected for being isomorphic to samples created before.
+    
+    Once most of the family trees that comply with the constraints have been created, almost every candidate is
+    rejected, and sampling degrades to an (almost) endless loop. To detect this, the monitor computes the rejection
+    rate over a sliding window of the most recent candidates.
+    
+    Furthermore, the monitor estimates the total number of different family trees that the sampling procedure can
+    create by means of the bias-corrected Chao1 estimator, which only depends on the number of family trees that have
+    been sampled exactly once and exactly twice, respectively.
+    """
+    
+    WINDOW_SIZE = 1000
+    """int: The default number of most recent candidates that the rejection rate is computed for."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, window_size: int=WINDOW_SIZE, journal: bool=False):
+        """Creates a new ``SaturationMonitor``.
+        
+        Args:
+            window_size (int, optional): The number of most recent candidates that the rejection rate is computed for.
+            journal (bool, optional): Indicates whether to keep the rejected candidates until they are retrieved by
+                means of :meth:`pop_rejections`, which is required for saving checkpoints. As the rejected candidates
+                may outnumber the accepted ones by far, this should only be enabled if they are popped regularly.
+        """
+        self._counts = {}  # maps fingerprints of canonical forms to the number of times they were sampled, capped at 3
+        self._journal = collections.deque() if journal else None  # rejections per accepted candidate not yet popped
+        self._num_attempts = 0
+        self._num_once = 0  # the number of family trees that have been sampled exactly once
+        self._num_rejections = 0
+        self._num_twice = 0  # the number of family trees that have been sampled exactly twice
+        self._rejected = []  # the fingerprints of the candidates that have been rejected since the last accepted one
+        self._window = collections.deque(maxlen=window_size)
+        self._window_rejections = 0
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def num_attempts(self) -> int:
+        """int: The total number of candidates that have been sampled."""
+        return self._num_attempts
+    
+    @property
+    def num_rejections(self) -> int:
+        """int: The total number of candidates that have been rejected."""
+        return self._num_rejections
+    
+    @property
+    def num_trees(self) -> int:
+        """int: The number of different family trees that have been sampled."""
+        return len(self._counts)
+    
+    @property
+    def rejection_rate(self) -> float:
+        """float: The fraction of rejected candidates among the most recent ones."""
+        return self._window_rejections / len(self._window) if self._window else 0.0
+    
+    #  METHODS  ########################################################################################################
+    
+    def _update(self, fingerprint: bytes, accepted: bool) -> None:
+        """Updates all statistics with a single sampled candidate.
+        
+        Args:
+            fingerprint (bytes): The fingerprint of the canonical form of the sampled family tree.
+            accepted (bool): Indicates whether the candidate has been accepted.
+        """
+        self._num_attempts += 1
+        self._num_rejections += not accepted
+        
+        # update the sliding window
+        if len(self._window) == self._window.maxlen:
+            self._window_rejections -= self._window[0]
+        self._window.append(not accepted)
+        self._window_rejections += not accepted
+        
+        # update the frequencies of the sampled family trees
+        count = self._counts.get(fingerprint, 0)
+        if count < 3:
+            self._counts[fingerprint] = count + 1
+            if count == 0:
+                self._num_once += 1
+            elif count == 1:
+                self._num_once -= 1
+                self._num_twice += 1
+            else:
+                self._num_twice -= 1
+    
+    def estimate_num_trees(self) -> float:
+        """Estimates the total number of different family trees that can be sampled.
+        
+        Returns:
+            float: The estimated number of family trees, which is at least :attr:`num_trees`.
+        """
+        return self.num_trees + self._num_once * (self._num_once - 1) / (2 * (self._num_twice + 1))
+    
+    def is_saturated(self, max_rejection_rate: float) -> bool:
+        """Determines whether the rejection rate exceeds the given threshold.
+        
+        The rejection rate is only considered once the sliding window is complete, such that a few rejected candidates
+        at the beginning of a run do not suffice.
+        
+        Args:
+            max_rejection_rate (float): The maximum rejection rate that is considered acceptable.
+        
+        Returns:
+            bool: ``True``, if the rejection rate exceeds ``max_rejection_rate``.
+        """
+        return len(self._window) == self._window.maxlen and self.rejection_rate > max_rejection_rate
+    
+    def pop_rejections(self, num_trees: int) -> typing.List[typing.List[bytes]]:
+        """Retrieves and forgets the candidates that have been rejected before each of the oldest accepted ones.
+        
+        Together with the canonical forms of the accepted candidates, this suffices for recreating the state of the
+        monitor by means of :meth:`restore`. The rejected candidates are kept until they are popped, which allows for
+        checkpoints that are saved while candidates for upcoming samples have been recorded already.
+        
+        Args:
+            num_trees (int): The number of accepted candidates to retrieve the rejected ones for.
+        
+        Returns:
+            list[list[bytes]]: The fingerprints of the candidates that have been rejected before each of the
+                ``num_trees`` oldest accepted candidates that have not been popped yet, in the order they were recorded.
+        
+        Raises:
+            ValueError: If the monitor does not keep a journal of rejected candidates.
+        """
+        if self._journal is None:
+            raise ValueError("The monitor does not keep a journal of rejected candidates!")
+        
+        return [self._journal.popleft() for _ in range(num_trees)]
+    
+    def record(self, canonical_form: str, accepted: bool) -> None:
+        """Records a single sampled candidate.
+        
+        Args:
+            canonical_form (str): The canonical form of the sampled family tree.
+            accepted (bool): Indicates whether the candidate has been accepted.
+        """
+        fingerprint = tree_index.TreeIndex.fingerprint(canonical_form)
+        self._update(fingerprint, accepted)
+        if self._journal is None:
+            return
+        if accepted:
+            self._journal.append(self._rejected)
+            self._rejected = []
+        else:
+            self._rejected.append(fingerprint)
+    
+    def restore(self, canonical_form: str, rejections: typing.List[bytes]) -> None:
+        """Recreates the records of an accepted candidate and the ones that have been rejected before, e.g., when an
+        interrupted run is resumed.
+        
+        Restored candidates are counted just like recorded ones, but cannot be popped by :meth:`pop_rejections`.
+        
+        Args:
+            canonical_form (str): The canonical form of the accepted family tree.
+            rejections (list[bytes]): The fingerprints of the candidates that have been rejected before the accepted
+                one, as provided by :meth:`pop_rejections`.
+        """
+        for fingerprint in rejections:
+            self._update(fingerprint, False)
+        self._update(tree_index.TreeIndex.fingerprint(canonical_form), True)
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import glob
+import io
+import json
+import os
+import re
+import tarfile
+import typing
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  S H A R D  W R I T E R                                                                                       #
+# ==================================================================================================================== #
+
+
+class ShardWriter(object):
+    """Writes the samples of a dataset to tar archives, so-called shards, each of which contains a fixed number of them.
+    
+    Every sample is stored as exactly the same files, in the rel-data format, that would be written to the output
+    directory otherwise. Every shard comes with a manifest, which specifies the offset and size of every file of every
+    sample in the archive, and thus allows for random access by sample name (see :class:`ShardReader`). The manifest is
+    stored both as a separate JSON file next to the shard and as the last member of the shard itself, once this is
+    complete. The manifest of the shard that is currently being written is updated whenever a checkpoint is saved.
+    """
+    
+    ARCHIVE_FILE_PATTERN = "shard-{:05d}.tar"
+    """str: The pattern of the file names of all shards."""
+    
+    MANIFEST_FILE_PATTERN = "shard-{:05d}.json"
+    """str: The pattern of the file names of the manifests of all shards."""
+    
+    MANIFEST_MEMBER_NAME = "manifest.json"
+    """str: The name of the manifest inside of a shard."""
+    
+    _SHARD_FILE = re.compile(r"^shard-(\d+)\.(json|tar)$")
+    """Pattern: A regex that matches the names of all files that belong to shards."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, output_dir: str, shard_size: int, num_samples: int=0):
+        """Creates a new ``ShardWriter``.
+        
+        Args:
+            output_dir (str): The directory to write the shards to.
+            shard_size (int): The number of samples per shard.
+            num_samples (int, optional): The number of samples that have been written to the ``output_dir`` before
+                and are to be kept, e.g., if an interrupted run is resumed. Any additional samples are discarded.
+        
+        Raises:
+            ValueError: If the ``output_dir`` contains less than ``num_samples`` samples.
+        """
+        self._archive = None
+        self._file = None
+        self._manifest = []
+        self._num_samples = num_samples
+        self._output_dir = output_dir
+        self._shard_size = shard_size
+        
+        # delete all shards that do not contain any of the samples to keep
+        shard_idx = num_samples // shard_size
+        num_kept = num_samples % shard_size  # the number of samples to keep in the shard of the next sample
+        for file_name in os.listdir(output_dir):
+            match = self._SHARD_FILE.match(file_name)
+            if match and int(match.group(1)) >= shard_idx + (num_kept > 0):
+                os.remove(os.path.join(output_dir, file_name))
+        
+        # continue the last shard, if it is incomplete
+        if num_kept > 0:
+            manifest = ShardReader.load_manifest(os.path.join(output_dir, self.MANIFEST_FILE_PATTERN.format(shard_idx)))
+            if len(manifest) < num_kept:
+                raise ValueError(
+                        "<output_dir> '{}' contains {} samples only, but {} are required!".format(
+                                output_dir, shard_idx * shard_size + len(manifest), num_samples
+                        )
+                )
+            self._manifest = manifest[:num_kept]
+            offset, size = list(self._manifest[-1]["files"].values())[-1]
+            self._open_shard(offset + self._pad(size))
+    
+    #  METHODS  ########################################################################################################
+    
+    def _add_member(self, name: str, data: bytes) -> typing.List[int]:
+        """Adds a single file to the current shard.
+        
+        Args:
+            name (str): The name of the file.
+            data (bytes): The content of the file.
+        
+        Returns:
+            list[int]: The offset of the file's content in the shard and its size.
+        """
+        info = tarfile.TarInfo(name)  # -> all other attributes are fixed, which makes shards reproducible
+        info.size = len(data)
+        self._archive.addfile(info, io.BytesIO(data))
+        
+        return [self._archive.offset - self._pad(len(data)), len(data)]
+    
+    def _close_shard(self) -> None:
+        """Adds the manifest to the current shard, and closes the same."""
+        self._add_member(self.MANIFEST_MEMBER_NAME, json.dumps(self._manifest).encode())
+        self._archive.close()
+        self.flush()
+        self._file.close()
+        self._archive = None
+        self._file = None
+        self._manifest = []
+    
+    def _open_shard(self, offset: int=0) -> None:
+        """Opens the shard that the next sample belongs to.
+        
+        Args:
+            offset (int, optional): The number of bytes at the beginning of the shard to keep.
+        """
+        path = os.path.join(self._output_dir, self.ARCHIVE_FILE_PATTERN.format(self._num_samples // self._shard_size))
+        self._file = open(path, "r+b" if offset > 0 else "wb")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+        self._archive = tarfile.open(fileobj=self._file, mode="w")
+    
+    @staticmethod
+    def _pad(size: int) -> int:
+        """Computes the number of bytes that a file of the given size occupies in a tar archive."""
+        return -(-size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+    
+    def close(self) -> None:
+        """Completes the current shard, even if it contains less than ``shard_size`` samples.
+        
+        An incomplete shard may still be continued by a new ``ShardWriter`` later on, e.g., if the dataset is extended.
+        """
+        if self._archive is not None:
+            self._close_shard()
+    
+    @classmethod
+    def encode(cls, directory: str, base_name: str) -> typing.Tuple[str, typing.Dict[str, bytes]]:
+        """Reads all files of a single sample that has been written to the specified directory.
+        
+        This does not depend on the state of a writer, and may thus take place in a worker process.
+        
+        Args:
+            directory (str): The directory that the sample has been written to.
+            base_name (str): The base name of the files of the sample.
+        
+        Returns:
+            tuple[str, dict[str, bytes]]: The name of the sample and the contents of all of its files, indexed by their
+                names.
+        """
+        files = collections.OrderedDict()
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.startswith(base_name):
+                with open(os.path.join(directory, file_name), "rb") as f:
+                    files[file_name] = f.read()
+        
+        return base_name, files
+    
+    def flush(self) -> None:
+        """Makes sure that all samples that have been written so far are persisted, and updates the current manifest."""
+        if self._file is None:
+            return
+        
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        
+        # atomically replace the manifest of the current shard
+        shard_idx = (self._num_samples - 1) // self._shard_size
+        path = os.path.join(self._output_dir, self.MANIFEST_FILE_PATTERN.format(shard_idx))
+        with open(path + ".tmp", "w") as f:
+            json.dump(self._manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+    
+    def write(self, sample: typing.Tuple[str, typing.Dict[str, bytes]]) -> None:
+        """Appends a single sample to the current shard.
+        
+        Args:
+            sample (tuple[str, dict[str, bytes]]): The sample as created by :meth:`encode`.
+        """
+        if self._archive is None:
+            self._open_shard()
+        
+        name, files = sample
+        self._manifest.append(
+                {
+                        "name": name,
+                        "files": collections.OrderedDict((n, self._add_member(n, d)) for n, d in files.items())
+                }
+        )
+        self._num_samples += 1
+        
+        if len(self._manifest) == self._shard_size:
+            self._close_shard()
+
+
+# ==================================================================================================================== #
+#  CLASS  S H A R D  R E A D E R                                                                                       #
+# ==================================================================================================================== #
+
+
+class ShardReader(object):
+    """Provides random access to the samples of a dataset that has been written by a :class:`ShardWriter`."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, path: str):
+        """Creates a new ``ShardReader``.
+        
+        Args:
+            path (str): The directory that contains the shards.
+        """
+        self._samples = collections.OrderedDict()  # maps sample names to shard paths and file locations
+        pattern = ShardWriter.MANIFEST_FILE_PATTERN.replace("{:05d}", "[0-9]*")
+        for manifest_path in sorted(glob.glob(os.path.join(path, pattern))):
+            archive_path = manifest_path[:-len(".json")] + ".tar"
+            for entry in self.load_manifest(manifest_path):
+                self._samples[entry["name"]] = (archive_path, entry["files"])
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, name: str) -> typing.Dict[str, bytes]:
+        """Retrieves the contents of all files of the sample with the given name, indexed by the files' names."""
+        archive_path, files = self._samples[name]
+        contents = collections.OrderedDict()
+        with open(archive_path, "rb") as f:
+            for file_name, (offset, size) in files.items():
+                f.seek(offset)
+                contents[file_name] = f.read(size)
+        
+        return contents
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def names(self) -> typing.List[str]:
+        """list[str]: The names of all samples in the order that they have been written in."""
+        return list(self._samples.keys())
+    
+    #  METHODS  ########################################################################################################
+    
+    def extract(self, name: str, target_dir: str) -> None:
+        """Writes the files of the sample with the given name to the specified directory.
+        
+        Args:
+            name (str): The name of the sample to extract.
+            target_dir (str): The directory to write the files to.
+        """
+        for file_name, data in self[name].items():
+            with open(os.path.join(target_dir, file_name), "wb") as f:
+                f.write(data)
+    
+    @staticmethod
+    def load_manifest(path: str) -> typing.List[typing.Dict[str, typing.Any]]:
+        """Loads the manifest of a single shard.
+        
+        Args:
+            path (str): The path of the manifest file.
+        
+        Returns:
+            list[dict]: One entry per sample, which specifies its ``name`` and the offsets and sizes of its ``files``.
+        """
+        if not os.path.isfile(path):
+            return []
+        with open(path, "r") as f:
+            return json.load(f, object_pairs_hook=collections.OrderedDict)
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+
+import json
+import os
+import typing
+
+import numpy as np
+
+from ftdatagen import family_tree as ft
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+# ==================================================================================================================== #
+#  CLASS  T E N S O R  W R I T E R                                                                                     #
+# ==================================================================================================================== #
+
+
+class TensorWriter(object):
+    """Writes an entire family tree dataset as a few contiguous binary arrays, which may be memory-mapped.
+    
+    The samples of a dataset are encoded as follows, where individuals are identified by their positions in the family
+    tree, and classes as well as relations by their indices in the lists that are provided when the writer is created:
+    
+    - ``genders``: an ``int8`` vector that contains the index of the class of every individual, or ``-1``,
+    - ``facts``: an ``int32`` matrix that contains one row ``(subject, relation, object, polarity)`` per fact, and
+    - ``inferences``: an ``int32`` matrix of the same form that contains one row per inference,
+    
+    where ``polarity`` is ``1`` for positive and ``0`` for negative literals. The arrays of all samples are appended to
+    one file each, and an ``int64`` matrix of offsets stores a row ``(individuals_start, num_individuals, facts_start,
+    num_facts, inferences_start, num_inferences)`` for every sample, which allows for slicing out any sample without
+    parsing (see :class:`TensorReader`). All files are append-only, and are flushed whenever a checkpoint is saved.
+    """
+    
+    ARRAY_FILES = [
+            ("genders", "tensors-genders.bin", np.int8, ()),
+            ("facts", "tensors-facts.bin", np.int32, (4,)),
+            ("inferences", "tensors-inferences.bin", np.int32, (4,))
+    ]
+    """list[tuple]: The name, file name, data type, and shape of a single row of every array that samples consist of."""
+    
+    META_FILE_NAME = "tensors.json"
+    """str: The name of the file that describes the vocabulary of the dataset."""
+    
+    OFFSETS_FILE_NAME = "tensors-offsets.bin"
+    """str: The name of the file that stores the offsets of all samples."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            output_dir: str,
+            classes: typing.Sequence[str],
+            relations: typing.Sequence[str],
+            num_samples: int=0
+    ):
+        """Creates a new ``TensorWriter``.
+        
+        Args:
+            output_dir (str): The directory to write the dataset to.
+            classes (list[str]): The classes that individuals may belong to, in index order.
+            relations (list[str]): The relations that may appear in facts and inferences, in index order.
+            num_samples (int, optional): The number of samples that have been written to the ``output_dir`` before
+                and are to be kept, e.g., if an interrupted run is resumed. Any additional samples are discarded.
+        
+        Raises:
+            ValueError: If the ``output_dir`` contains less than ``num_samples`` samples.
+        """
+        # write the vocabulary
+        with open(os.path.join(output_dir, self.META_FILE_NAME), "w") as f:
+            json.dump({"classes": list(classes), "relations": list(relations)}, f, indent=4)
+        
+        # restore the offsets of the samples to keep
+        offsets_path = os.path.join(output_dir, self.OFFSETS_FILE_NAME)
+        if num_samples > 0:
+            offsets = TensorReader.load_offsets(offsets_path)
+            if len(offsets) < num_samples:
+                raise ValueError(
+                        "<output_dir> '{}' contains {} samples only, but {} are required!".format(
+                                output_dir, len(offsets), num_samples
+                        )
+                )
+            ends = offsets[num_samples - 1, 0::2] + offsets[num_samples - 1, 1::2]
+        else:
+            ends = np.zeros(len(self.ARRAY_FILES), dtype=np.int64)
+        self._ends = [int(e) for e in ends]  # the number of rows of each array
+        
+        # open all files for appending, and discard anything beyond the samples to keep
+        self._offsets_file = open(offsets_path, "ab")
+        self._offsets_file.truncate(num_samples * TensorReader.OFFSETS_WIDTH * np.dtype(np.int64).itemsize)
+        self._files = []
+        for (_, file_name, dtype, shape), end in zip(self.ARRAY_FILES, self._ends):
+            f = open(os.path.join(output_dir, file_name), "ab")
+            f.truncate(end * np.dtype(dtype).itemsize * int(np.prod(shape)))
+            self._files.append(f)
+    
+    #  METHODS  ########################################################################################################
+    
+    def close(self) -> None:
+        """Flushes and closes all files."""
+        self.flush()
+        for f in [self._offsets_file] + self._files:
+            f.close()
+    
+    @classmethod
+    def encode(
+            cls,
+            family_tree: ft.FamilyTree,
+            facts: typing.Iterable,
+            inferences: typing.Iterable,
+            classes: typing.Sequence[str],
+            relations: typing.Sequence[str]
+    ) -> typing.Dict[str, np.ndarray]:
+        """Encodes a single sample as arrays.
+        
+        Encoding does not depend on the state of a writer, and may thus take place in a worker process. Unary literals
+        that do not specify a class membership as well as any literals of relations that are not part of the vocabulary
+        are ignored.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree that the sample is created from.
+            facts (iterable): The facts included in the sample.
+            inferences (iterable): The inferences included in the sample.
+            classes (list[str]): The classes that individuals may belong to, in index order.
+            relations (list[str]): The relations that may appear in facts and inferences, in index order.
+        
+        Returns:
+            dict[str, np.ndarray]: The ``genders``, ``facts``, and ``inferences`` of the sample.
+        """
+        index = {name: i for i, name in enumerate(family_tree.names)}
+        classes = {c: i for i, c in enumerate(classes)}
+        relations = {r: i for i, r in enumerate(relations)}
+        
+        genders = np.full(len(family_tree), -1, dtype=np.int8)
+        for f in facts:
+            if f.positive and len(f.terms) == 1 and f.predicate in classes:
+                genders[index[f.terms[0]]] = classes[f.predicate]
+        
+        def encode_triples(literals: typing.Iterable) -> np.ndarray:
+            return np.array(
+                    [
+                            (index[lit.terms[0]], relations[lit.predicate], index[lit.terms[1]], lit.positive)
+                            for lit in literals
+                            if len(lit.terms) == 2 and lit.predicate in relations
+                    ],
+                    dtype=np.int32
+            ).reshape(-1, 4)
+        
+        return {"genders": genders, "facts": encode_triples(facts), "inferences": encode_triples(inferences)}
+    
+    def flush(self) -> None:
+        """Makes sure that all samples that have been written so far are persisted."""
+        for f in [self._offsets_file] + self._files:
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def write(self, arrays: typing.Dict[str, np.ndarray]) -> None:
+        """Appends a single sample to the dataset.
+        
+        Args:
+            arrays (dict[str, np.ndarray]): The sample as created by :meth:`encode`.
+        """
+        offsets = []
+        for i, (name, _, dtype, _) in enumerate(self.ARRAY_FILES):
+            values = np.ascontiguousarray(arrays[name], dtype=dtype)
+            self._files[i].write(values.tobytes())
+            offsets += [self._ends[i], len(values)]
+            self._ends[i] += len(values)
+        
+        # the offsets are written last, such that they never refer to incomplete data
+        self._offsets_file.write(np.array(offsets, dtype=np.int64).tobytes())
+
+
+# ==================================================================================================================== #
+#  CLASS  T E N S O R  R E A D E R                                                                                     #
+# ==================================================================================================================== #
+
+
+class TensorReader(object):
+    """Provides random access to the samples of a dataset that has been written by a :class:`TensorWriter`.
+    
+    All arrays are memory-mapped, i.e., accessing a sample only reads the according slices from the disk.
+    """
+    
+    OFFSETS_WIDTH = 6
+    """int: The number of offsets that are stored for every sample."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, path: str):
+        """Creates a new ``TensorReader``.
+        
+        Args:
+            path (str): The directory that contains the dataset.
+        """
+        with open(os.path.join(path, TensorWriter.META_FILE_NAME), "r") as f:
+            meta = json.load(f)
+        self._classes = meta["classes"]
+        self._relations = meta["relations"]
+        
+        self._offsets = self.load_offsets(os.path.join(path, TensorWriter.OFFSETS_FILE_NAME))
+        self._arrays = {}
+        for name, file_name, dtype, shape in TensorWriter.ARRAY_FILES:
+            file_path = os.path.join(path, file_name)
+            if os.path.getsize(file_path) == 0:  # -> empty files cannot be mapped
+                self._arrays[name] = np.zeros((0,) + shape, dtype=dtype)
+            else:
+                self._arrays[name] = np.memmap(file_path, dtype=dtype, mode="r").reshape((-1,) + shape)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index: int) -> typing.Dict[str, np.ndarray]:
+        """Retrieves a single sample as a dictionary that contains its ``genders``, ``facts``, and ``inferences``."""
+        offsets = self._offsets[index]
+        return {
+                name: self._arrays[name][offsets[2 * i]:offsets[2 * i] + offsets[2 * i + 1]]
+                for i, (name, _, _, _) in enumerate(TensorWriter.ARRAY_FILES)
+        }
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def classes(self) -> typing.List[str]:
+        """list[str]: The classes that individuals may belong to, in index order."""
+        return self._classes
+    
+    @property
+    def offsets(self) -> np.ndarray:
+        """np.ndarray: The offsets of all samples (see :class:`TensorWriter`)."""
+        return self._offsets
+    
+    @property
+    def relations(self) -> typing.List[str]:
+        """list[str]: The relations that appear in facts and inferences, in index order."""
+        return self._relations
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def load_offsets(cls, path: str) -> np.ndarray:
+        """Loads the offsets of all samples, ignoring an incomplete row at the end of the file.
+        
+        Args:
+            path (str): The path of the offsets file.
+        
+        Returns:
+            np.ndarray: An ``int64`` matrix that contains one row of offsets per sample.
+        """
+        offsets = np.fromfile(path, dtype=np.int64) if os.path.isfile(path) else np.zeros(0, dtype=np.int64)
+        return offsets[:len(offsets) - len(offsets) % cls.OFFSETS_WIDTH].reshape(-1, cls.OFFSETS_WIDTH)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+
+import hashlib
+import heapq
+import random
+import typing
+
+from ftdatagen import batch_sampler
+from ftdatagen import config
+from ftdatagen import family_tree as ft
+from ftdatagen import person_factory as pf
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TreeEnumerator(object):
+    """Systematically enumerates all family trees that are not isomorphic to each other.
+    
+    The enumerated family trees are exactly the ones that may be sampled by :class:`batch_sampler.BatchSampler`. To
+    that end, the same rules are applied: starting from a single person, either a child is added to a person that has
+    less than ``max_branching_factor`` children, together with a spouse, if the person is unmarried, or a couple of
+    parents is added to a person that has none. Children and new spouses are located one level below the person they
+    are added to, and parents one level above it. Once the levels of a family tree span ``max_tree_depth``, children
+    cannot be added to persons on the lowest level anymore, and parents cannot be added to persons on the highest one.
+    Family trees are extended as long as they contain less than ``max_tree_size`` persons, which means that they may end
+    up with one more than that (see :meth:`batch_sampler.BatchSampler.max_size`). Notice, however, that smaller family
+    trees are enumerated as well, starting from the smallest one possible, which is a single couple with one child.
+    
+    As the levels of the persons in a family tree depend on the order that they have been added in, and determine how
+    the same may be extended, the enumeration explores the structures of family trees together with the levels of
+    their persons. To that end, it keeps track of all of these states that have been explored already, as well as the
+    canonical forms of all family trees that have been enumerated.
+    """
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _augment(cls, conf: config.Config, family_tree: ft.FamilyTree) -> typing.Iterator[ft.FamilyTree]:
+        """Creates all family trees that result from adding a child, a spouse with a child, or parents to a person.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to augment.
+        
+        Yields:
+            :class:`family_tree.FamilyTree`: The augmented family trees.
+        """
+        size = len(family_tree)
+        if size >= conf.max_tree_size:
+            return
+        
+        levels = family_tree.level.tolist()
+        min_level = max(levels) - conf.max_tree_depth  # the minimum level that any person may be located on
+        max_level = min(levels) + conf.max_tree_depth  # the maximum level that any person may be located on
+        
+        for person in range(size):
+            level = levels[person]
+            spouse = int(family_tree.spouse[person])
+            female = bool(family_tree.female[person])
+            
+            # add a child to a person -> if the person is married, then the child is located below this spouse, which
+            # is chosen as the one that the child is added to
+            if family_tree.num_children[person] < conf.max_branching_factor and level < max_level:
+                tree = family_tree.copy()
+                if spouse == ft.FamilyTree.NO_PERSON:
+                    spouse = tree.add_person("", not female, level + 1)
+                    tree.marry(*((person, spouse) if female else (spouse, person)))
+                child = tree.add_person("", False, level + 1)
+                tree.add_child(child, *((person, spouse) if female else (spouse, person)))
+                yield tree
+            
+            # add parents to a person
+            if family_tree.mother[person] == ft.FamilyTree.NO_PERSON and level > min_level:
+                tree = family_tree.copy()
+                mom = tree.add_person("", True, level - 1)
+                dad = tree.add_person("", False, level - 1)
+                tree.marry(mom, dad)
+                tree.add_child(person, mom, dad)
+                yield tree
+    
+    @classmethod
+    def _canonize(cls, family_tree: ft.FamilyTree, levels: bool) -> typing.Tuple[str, typing.Tuple[int, ...]]:
+        """Computes the canonical form of a family tree together with the levels of its persons.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to canonize.
+            levels (bool): Indicates whether the levels are taken into account. If not, then these are omitted.
+        
+        Returns:
+            tuple[str, tuple[int, ...]]: The canonical form of the family tree and the levels of its persons in
+                canonical order, relative to the lowest one, which together describe the state of the family tree.
+        """
+        if not levels:
+            return tree_index.TreeIndex.canonical_form(family_tree), ()
+        
+        form, order = tree_index.TreeIndex.canonical_labeling(family_tree)
+        person_levels = family_tree.level.tolist()
+        min_level = min(person_levels)
+        
+        return form, tuple(person_levels[person] - min_level for person in order)
+    
+    @classmethod
+    def _parse_canonical_form(
+            cls,
+            canonical_form: str
+    ) -> typing.Tuple[typing.List[str], typing.List[typing.Tuple[int, int, str]]]:
+        """Parses the canonical form of a family tree.
+        
+        Args:
+            canonical_form (str): The canonical form to parse (see :meth:`tree_index.TreeIndex.canonical_form`).
+        
+        Returns:
+            tuple[list[str], list[tuple[int, int, str]]]: The labels of all nodes as well as all edges, specified as
+                triples of the parent node, the child node, and the label of the edge.
+        """
+        labels = [canonical_form[0]]
+        edges = []
+        stack = [0]
+        pos = 2  # -> skip the label of the root and the opening parenthesis
+        while stack:
+            if canonical_form[pos] == ")":
+                stack.pop()
+                pos += 1
+            else:
+                node = len(labels)
+                labels.append(canonical_form[pos + 1])
+                edges.append((stack[-1], node, canonical_form[pos]))
+                stack.append(node)
+                pos += 3  # -> skip the label of the edge, the label of the node, and the opening parenthesis
+        
+        return labels, edges
+    
+    @classmethod
+    def _sort_key(cls, conf: config.Config, canonical_form: str) -> int:
+        """Computes a pseudorandom key of a family tree, which defines the order that family trees are selected in."""
+        data = "{}:{}".format(conf.seed, canonical_form).encode()
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+    
+    @classmethod
+    def create_family_tree(cls, canonical_form: str, rng: random.Random) -> ft.FamilyTree:
+        """Creates a family tree that has the structure that is described by the given canonical form.
+        
+        The genders of the persons, i.e., which of two spouses is the mother and which one the father, as well as their
+        names are chosen at random.
+        
+        Args:
+            canonical_form (str): The canonical form of the structure of the family tree to create, as computed by
+                :meth:`tree_index.TreeIndex.canonical_form`.
+            rng (random.Random): The RNG to use.
+        
+        Returns:
+            :class:`family_tree.FamilyTree`: The created family tree.
+        """
+        labels, edges = cls._parse_canonical_form(canonical_form)
+        
+        # determine the spouses and children of all marriages
+        spouses = {node: [] for node, label in enumerate(labels) if label == tree_index.TreeIndex.MARRIAGE_LABEL}
+        children = {node: [] for node in spouses}
+        for parent, child, edge in edges:
+            marriage, person = (parent, child) if parent in spouses else (child, parent)
+            (spouses if edge == tree_index.TreeIndex.SPOUSE_EDGE else children)[marriage].append(person)
+        
+        # determine the levels of all nodes, where marriages are located on the same level as their spouses
+        level = {0: 0}
+        neighbors = {node: [] for node in range(len(labels))}
+        for parent, child, edge in edges:
+            offset = 1 if edge == tree_index.TreeIndex.CHILD_EDGE else 0  # -> from a marriage to the person
+            neighbors[parent].append((child, offset if parent in spouses else -offset))
+            neighbors[child].append((parent, -offset if parent in spouses else offset))
+        queue = [0]
+        for node in queue:
+            for neighbor, offset in neighbors[node]:
+                if neighbor not in level:
+                    level[neighbor] = level[node] + offset
+                    queue.append(neighbor)
+        min_level = min(level.values())
+        
+        # choose the genders of all persons -> the first spouse of every marriage is female with probability 0.5
+        female = {}
+        for person, label in enumerate(labels):
+            if label != tree_index.TreeIndex.MARRIAGE_LABEL:
+                female[person] = rng.random() > 0.5
+        for couple in spouses.values():
+            female[couple[1]] = not female[couple[0]]
+        
+        # create the family tree
+        family_tree = ft.FamilyTree(capacity=len(female))
+        name_pool = pf.PersonFactory.create_name_pool()
+        index = {}
+        for person in sorted(female):
+            name = pf.PersonFactory.sample_name(name_pool, female[person], rng)
+            index[person] = family_tree.add_person(name, female[person], level[person] - min_level)
+        for marriage, (first, second) in spouses.items():
+            mom, dad = (index[first], index[second]) if female[first] else (index[second], index[first])
+            family_tree.marry(mom, dad)
+            for child in children[marriage]:
+                family_tree.add_child(index[child], mom, dad)
+        
+        return family_tree
+    
+    @classmethod
+    def enumerate_canonical_forms(cls, conf: config.Config) -> typing.Iterator[str]:
+        """Enumerates the canonical forms of all family trees that comply with the provided configuration.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+        
+        Yields:
+            str: The canonical forms of all family trees, which are pairwise not isomorphic.
+        """
+        if conf.max_tree_size < 3 or conf.max_tree_depth < 1 or conf.max_branching_factor < 1:
+            return
+        
+        # start from a single person, just like the sampler
+        max_size = batch_sampler.BatchSampler.max_size(conf)
+        root = ft.FamilyTree(capacity=max_size)
+        root.add_person("", False, 0)
+        
+        # the levels of a family tree span fewer levels than it contains persons, which means that they are irrelevant
+        # if the depth limit cannot be reached
+        levels = conf.max_tree_depth < max_size - 1
+        
+        # explore all states of family trees depth-first, and enumerate the structures of all but the initial one
+        stack = [root]
+        explored = {cls._canonize(root, levels)}
+        enumerated = set()
+        while stack:
+            family_tree = stack.pop()
+            for tree in cls._augment(conf, family_tree):
+                state = cls._canonize(tree, levels)
+                if state in explored:
+                    continue
+                explored.add(state)
+                stack.append(tree)
+                
+                form = state[0]
+                if form not in enumerated:
+                    enumerated.add(form)
+                    yield form
+    
+    @classmethod
+    def select(cls, conf: config.Config, num_samples: int) -> typing.List[str]:
+        """Selects family trees uniformly at random from all the ones that comply with the provided configuration.
+        
+        Every family tree is assigned a pseudorandom key, which is derived from the seed and its canonical form, and the
+        family trees with the smallest keys are selected. Therefore, the selected family trees for a certain number of
+        samples always start with the ones that are selected for any smaller number, regardless of the order that family
+        trees are enumerated in.
+        
+        Args:
+            conf (:class:`config.Config`): The configuration that specifies the constraints of all family trees.
+            num_samples (int): The number of family trees to select. If there are less than this, then all of them are
+                selected.
+        
+        Returns:
+            list[str]: The canonical forms of the selected family trees, ordered by their keys.
+        """
+        heap = []  # a max-heap of the selected family trees w.r.t. their keys
+        for form in cls.enumerate_canonical_forms(conf):
+            key = cls._sort_key(conf, form)
+            if len(heap) < num_samples:
+                heapq.heappush(heap, (-key, form))
+            elif key < -heap[0][0]:
+                heapq.heapreplace(heap, (-key, form))
+        
+        return [form for _, form in sorted(heap, reverse=True)]
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+
+import hashlib
+import typing
+
+from ftdatagen import family_tree as ft
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TreeIndex(object):
+    """An index of the structures of family trees, which allows for checking isomorphism in (almost) constant time.
+    
+    To that end, every family tree is reduced to a canonical form, i.e., a string that is identical for two family trees
+    if and only if the same are isomorphic. This makes use of the fact that a family tree may be viewed as a bipartite
+    graph of persons and marriages, in which every person is connected to the marriage that it is part of as well as the
+    one that it descends from. As every person has at most one of each, this graph is indeed a tree, and can thus be
+    canonized by means of the AHU algorithm after rooting it in its center.
+    
+    The index maps short fingerprints, i.e., hashes, of canonical forms to the canonical forms themselves. Therefore,
+    the exact isomorphism check, which is a comparison of canonical forms, is only performed for colliding fingerprints.
+    Furthermore, a ``TreeIndex`` can be indexed like a list, which provides the canonical forms of all family trees in
+    the order they have been added.
+    """
+    
+    CHILD_EDGE = "c"
+    """str: The label of edges that connect a person with the marriage that the same descends from."""
+    
+    FEMALE_LABEL = "f"
+    """str: The label of nodes that represent female persons, if genders are taken into account."""
+    
+    FINGERPRINT_SIZE = 16
+    """int: The size of the fingerprints of canonical forms in bytes."""
+    
+    MALE_LABEL = "m"
+    """str: The label of nodes that represent male persons, if genders are taken into account."""
+    
+    MARKED_LABEL = "x"
+    """str: The label of nodes that represent marked persons."""
+    
+    MARRIAGE_LABEL = "u"
+    """str: The label of nodes that represent marriages."""
+    
+    PERSON_LABEL = "p"
+    """str: The label of nodes that represent persons, if genders are not taken into account."""
+    
+    SPOUSE_EDGE = "s"
+    """str: The label of edges that connect a person with the marriage that the same is part of."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self):
+        """Creates a new empty ``TreeIndex``."""
+        self._forms = []  # all canonical forms in the order they have been added
+        self._index = {}  # maps fingerprints to lists of canonical forms
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __contains__(self, family_tree: ft.FamilyTree) -> bool:
+        canonical_form = self.canonical_form(family_tree)
+        return canonical_form in self._index.get(self.fingerprint(canonical_form), [])
+    
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[str, typing.List[str]]:
+        return self._forms[index]
+    
+    def __len__(self) -> int:
+        return len(self._forms)
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _find_centers(cls, adjacency: typing.List[typing.List[typing.Tuple[int, str]]]) -> typing.List[int]:
+        """Determines the center(s) of a tree by repeatedly removing all of its leaves.
+        
+        Args:
+            adjacency (list[list[tuple]]): The adjacency lists of the considered tree.
+        
+        Returns:
+            list[int]: The one or two nodes that are the centers of the tree.
+        """
+        degrees = [len(neighbors) for neighbors in adjacency]
+        leaves = [node for node, degree in enumerate(degrees) if degree <= 1]
+        remaining = len(adjacency)
+        while remaining > 2:
+            remaining -= len(leaves)
+            new_leaves = []
+            for leaf in leaves:
+                for neighbor, _ in adjacency[leaf]:
+                    degrees[neighbor] -= 1
+                    if degrees[neighbor] == 1:
+                        new_leaves.append(neighbor)
+            leaves = new_leaves
+        
+        return leaves
+    
+    @classmethod
+    def _create_graph(
+            cls,
+            family_tree: ft.FamilyTree,
+            genders: bool,
+            marked: typing.Collection[int]
+    ) -> typing.Tuple[typing.List[typing.List[typing.Tuple[int, str]]], typing.List[str]]:
+        """Creates the bipartite graph of persons and marriages that represents a family tree.
+        
+        The first nodes of the graph represent the persons in the family tree, in the same order, and are followed by
+        the nodes that represent marriages.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to represent.
+            genders (bool): Indicates whether the genders of the persons are part of the labels.
+            marked (collection[int]): The indices of persons that are labeled as marked.
+        
+        Returns:
+            tuple[list[list[tuple]], list[str]]: The adjacency lists and the labels of all nodes in the graph.
+        """
+        # create one node for every person in the family tree
+        if genders:
+            labels = [cls.FEMALE_LABEL if f else cls.MALE_LABEL for f in family_tree.female.tolist()]
+        else:
+            labels = [cls.PERSON_LABEL] * len(family_tree)
+        for node in marked:
+            labels[node] = cls.MARKED_LABEL
+        adjacency = [[] for _ in range(len(family_tree))]
+        
+        # create one node for every marriage, and connect it with the spouses as well as their children
+        marriages = {}
+        spouses = family_tree.spouse.tolist()
+        parents = list(zip(family_tree.mother.tolist(), family_tree.father.tolist()))
+        for node in range(len(family_tree)):
+            for edge, couple in ((cls.SPOUSE_EDGE, (node, spouses[node])), (cls.CHILD_EDGE, parents[node])):
+                if couple[-1] == ft.FamilyTree.NO_PERSON:
+                    continue
+                key = frozenset(couple)
+                if key not in marriages:
+                    marriages[key] = len(labels)
+                    labels.append(cls.MARRIAGE_LABEL)
+                    adjacency.append([])
+                marriage = marriages[key]
+                adjacency[node].append((marriage, edge))
+                adjacency[marriage].append((node, edge))
+        
+        return adjacency, labels
+    
+    @classmethod
+    def _encode(
+            cls,
+            adjacency: typing.List[typing.List[typing.Tuple[int, str]]],
+            labels: typing.List[str],
+            root: int
+    ) -> typing.Dict[int, str]:
+        """Computes the AHU encodings of all subtrees of a tree that is rooted in the specified node.
+        
+        Args:
+            adjacency (list[list[tuple]]): The adjacency lists of the considered tree.
+            labels (list[str]): The labels of all nodes in the tree.
+            root (int): The node to use as root of the tree.
+        
+        Returns:
+            dict[int, str]: The encodings of the subtrees rooted in each of the nodes, which means that the encoding of
+                the entire tree is the one of the ``root``.
+        """
+        # determine a top-down order of all nodes as well as their parents w.r.t. the chosen root
+        parent = {root: None}
+        order = [root]
+        for node in order:
+            for neighbor, _ in adjacency[node]:
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    order.append(neighbor)
+        
+        # encode all subtrees bottom-up
+        codes = {}
+        for node in reversed(order):
+            child_codes = sorted(
+                    edge + codes[neighbor]
+                    for neighbor, edge in adjacency[node]
+                    if neighbor != parent[node]
+            )
+            codes[node] = labels[node] + "(" + "".join(child_codes) + ")"
+        
+        return codes
+    
+    def add(self, family_tree: ft.FamilyTree) -> bool:
+        """Adds the provided family tree to the index, unless it is isomorphic to one that has been added before.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to add.
+        
+        Returns:
+            bool: ``True``, if the family tree has been added, and ``False``, if the index contained an isomorphic one.
+        """
+        return self.add_canonical_form(self.canonical_form(family_tree))
+    
+    def add_canonical_form(self, canonical_form: str) -> bool:
+        """Adds a family tree, which is specified in terms of its canonical form, to the index.
+        
+        Args:
+            canonical_form (str): The canonical form of the family tree to add, as computed by :meth:`canonical_form`.
+        
+        Returns:
+            bool: ``True``, if the family tree has been added, and ``False``, if the index contained an isomorphic one.
+        """
+        bucket = self._index.setdefault(self.fingerprint(canonical_form), [])
+        if canonical_form in bucket:
+            return False
+        
+        bucket.append(canonical_form)
+        self._forms.append(canonical_form)
+        
+        return True
+    
+    @classmethod
+    def canonical_form(
+            cls,
+            family_tree: ft.FamilyTree,
+            genders: bool=False,
+            marked: typing.Collection[int]=()
+    ) -> str:
+        """Computes the canonical form of the structure of a family tree.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to canonize.
+            genders (bool, optional): Indicates whether the genders of the persons are part of the structure. By
+                default, two family trees are isomorphic if they only differ in the genders of the people involved.
+            marked (collection[int], optional): The indices of persons that are distinguished from all others. Two
+                family trees with marked persons are isomorphic only if there is an isomorphism that maps the marked
+                persons of one onto the marked persons of the other.
+        
+        Returns:
+            str: The canonical form of the family tree.
+        """
+        adjacency, labels = cls._create_graph(family_tree, genders, marked)
+        
+        # encode the tree rooted in its center -> if there are two centers, then we use the smaller encoding
+        return min(cls._encode(adjacency, labels, c)[c] for c in cls._find_centers(adjacency))
+    
+    @classmethod
+    def canonical_labeling(cls, family_tree: ft.FamilyTree, genders: bool=False) -> typing.Tuple[str, typing.List[int]]:
+        """Computes the canonical form of the structure of a family tree together with a canonical order of its persons.
+        
+        For any two family trees with the same canonical form, mapping the persons of one onto the persons of the other
+        at the same positions in their canonical orders is an isomorphism.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to canonize.
+            genders (bool, optional): Indicates whether the genders of the persons are part of the structure (see
+                :meth:`canonical_form`).
+        
+        Returns:
+            tuple[str, list[int]]: The canonical form of the family tree and the indices of all persons in canonical
+                order.
+        """
+        adjacency, labels = cls._create_graph(family_tree, genders, ())
+        codes, root = min(
+                ((cls._encode(adjacency, labels, c), c) for c in cls._find_centers(adjacency)),
+                key=lambda x: x[0][x[1]]
+        )
+        
+        # traverse the tree in the same order as its canonical form lists the nodes
+        order = []
+        stack = [(root, None)]
+        while stack:
+            node, parent = stack.pop()
+            if node < len(family_tree):
+                order.append(node)
+            children = sorted(
+                    ((edge + codes[neighbor], neighbor) for neighbor, edge in adjacency[node] if neighbor != parent),
+                    reverse=True
+            )
+            stack.extend((neighbor, node) for _, neighbor in children)
+        
+        return codes[root], order
+    
+    @classmethod
+    def fingerprint(cls, canonical_form: str) -> bytes:
+        """Computes the fingerprint of a canonical form.
+        
+        Args:
+            canonical_form (str): The canonical form of a family tree, as computed by :meth:`canonical_form`.
+        
+        Returns:
+            bytes: The fingerprint of the given canonical form.
+        """
+        return hashlib.blake2b(canonical_form.encode(), digest_size=cls.FINGERPRINT_SIZE).digest()
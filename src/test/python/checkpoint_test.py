@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+
+import contextlib
+import filecmp
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from ftdatagen import batch_sampler
+from ftdatagen import checkpoint
+from ftdatagen import config
+from ftdatagen import generator
+from ftdatagen import saturation_monitor
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class CheckpointTest(unittest.TestCase):
+    """Tests saving and loading checkpoints as well as resuming interrupted runs."""
+    
+    RUN_FILES = [
+            "out.log",
+            "run-report.json",
+            checkpoint.Checkpoint.INDEX_FILE_NAME,
+            checkpoint.Checkpoint.STATE_FILE_NAME
+    ]
+    """list[str]: The files in the output directory that are not part of the dataset."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _create_config(cls, output_dir: str) -> config.Config:
+        """Creates the configuration of a small dataset in the specified directory."""
+        conf = config.Config()
+        conf.checkpoint_interval = 4
+        conf.max_tree_size = 8
+        conf.num_samples = 12
+        conf.output_dir = output_dir
+        conf.seed = 0
+        conf.stop_prob = 0.2
+        os.makedirs(output_dir, exist_ok=True)
+        
+        return conf
+    
+    @classmethod
+    def _generate(cls, conf: config.Config) -> None:
+        """Runs the generator for the provided configuration without printing anything."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.Generator.generate(conf)
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_resume(self):
+        # create a dataset in a single run
+        expected_dir = os.path.join(self.tmp_dir.name, "expected")
+        self._generate(self._create_config(expected_dir))
+        
+        # create the same dataset in a run that is interrupted after 6 samples, and resumed after that
+        actual_dir = os.path.join(self.tmp_dir.name, "actual")
+        process_sample = generator.Generator._process_sample
+        
+        def interrupt(conf, sample_idx, *args, **kwargs):
+            if sample_idx == 6:
+                raise KeyboardInterrupt()
+            return process_sample(conf, sample_idx, *args, **kwargs)
+        
+        with mock.patch.object(generator.Generator, "_process_sample", side_effect=interrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self._generate(self._create_config(actual_dir))
+        conf = self._create_config(actual_dir)
+        conf.num_samples = 1  # -> the number of samples is restored from the checkpoint
+        conf.resume = True
+        conf.seed = 1  # -> so is the seed
+        self._generate(conf)
+        self.assertEqual(12, conf.num_samples)
+        
+        # both datasets are identical
+        expected_files = sorted(set(os.listdir(expected_dir)) - set(self.RUN_FILES))
+        self.assertEqual(expected_files, sorted(set(os.listdir(actual_dir)) - set(self.RUN_FILES)))
+        _, mismatch, errors = filecmp.cmpfiles(expected_dir, actual_dir, expected_files, shallow=False)
+        self.assertEqual([], mismatch + errors)
+        
+        # so are the checkpoints that are saved after the last sample
+        _, mismatch, errors = filecmp.cmpfiles(expected_dir, actual_dir, self.RUN_FILES[2:], shallow=False)
+        self.assertEqual([], mismatch + errors)
+    
+    def test_save_and_load(self):
+        conf = self._create_config(self.tmp_dir.name)
+        conf.max_tree_size = 6  # -> many candidates are rejected
+        sample_index = tree_index.TreeIndex()
+        monitor = saturation_monitor.SaturationMonitor(window_size=4, journal=True)
+        expected_monitor = saturation_monitor.SaturationMonitor(window_size=4)  # records the first 6 samples only
+        for family_tree in batch_sampler.BatchSampler.sample(conf, range(40)):
+            canonical_form = tree_index.TreeIndex.canonical_form(family_tree)
+            accepted = sample_index.add_canonical_form(canonical_form)
+            monitor.record(canonical_form, accepted)
+            if len(sample_index) < 6 or (len(sample_index) == 6 and accepted):
+                expected_monitor.record(canonical_form, accepted)
+        self.assertGreater(len(sample_index), 6)
+        self.assertGreater(expected_monitor.num_rejections, 0)
+        stats = {"tree_size_counts": {"5": 3}}
+        
+        # a checkpoint cannot be saved for a monitor that does not keep a journal of rejected candidates
+        with self.assertRaises(ValueError):
+            checkpoint.Checkpoint(conf, sample_index, saturation_monitor.SaturationMonitor()).save(2, {})
+        
+        ckpt = checkpoint.Checkpoint(conf, sample_index, monitor)
+        self.assertFalse(ckpt.exists)
+        ckpt.save(2, {})
+        ckpt.save(6, stats)
+        self.assertTrue(ckpt.exists)
+        
+        # canonical forms that are written after the checkpoint has been saved are discarded
+        with open(os.path.join(self.tmp_dir.name, checkpoint.Checkpoint.INDEX_FILE_NAME), "a") as f:
+            f.write(sample_index[6] + "\n")
+        
+        # loading the checkpoint restores the sample index, the monitor, the seed, and the number of samples
+        loaded_conf = self._create_config(self.tmp_dir.name)
+        loaded_conf.max_tree_size = 6
+        loaded_conf.num_samples = 1
+        loaded_conf.seed = 1
+        loaded_index = tree_index.TreeIndex()
+        loaded_monitor = saturation_monitor.SaturationMonitor(window_size=4)
+        next_sample, loaded_stats = checkpoint.Checkpoint(loaded_conf, loaded_index, loaded_monitor).load()
+        self.assertEqual(6, next_sample)
+        self.assertEqual(stats, loaded_stats)
+        self.assertEqual(sample_index[:6], loaded_index[:])
+        self.assertEqual(conf.num_samples, loaded_conf.num_samples)
+        self.assertEqual(conf.seed, loaded_conf.seed)
+        for attribute in ["num_attempts", "num_rejections", "num_trees", "rejection_rate"]:
+            self.assertEqual(getattr(expected_monitor, attribute), getattr(loaded_monitor, attribute))
+        self.assertEqual(expected_monitor.estimate_num_trees(), loaded_monitor.estimate_num_trees())
+        
+        # an incomplete run cannot be extended
+        with self.assertRaises(ValueError):
+            checkpoint.Checkpoint(
+                    loaded_conf, tree_index.TreeIndex(), saturation_monitor.SaturationMonitor()
+            ).load(extend=True)
+        
+        # a checkpoint cannot be loaded for different options
+        other_conf = self._create_config(self.tmp_dir.name)
+        with self.assertRaises(ValueError):
+            checkpoint.Checkpoint(other_conf, tree_index.TreeIndex(), saturation_monitor.SaturationMonitor()).load()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from ftdatagen import config
+from ftdatagen import generator
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ConfigTest(unittest.TestCase):
+    """Tests the defaults of :class:`config.Config` and how they are checked by the generator."""
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_negative_facts(self):
+        conf = config.Config()
+        conf.negative_facts = True
+        generator.Generator._check_config(conf)
+        
+        # negative facts are taken from the included negatives, and thus require some
+        for negatives in ["hard", "random"]:
+            conf.negatives = negatives
+            generator.Generator._check_config(conf)
+        conf.negatives = "none"
+        with self.assertRaises(ValueError):
+            generator.Generator._check_config(conf)
+    
+    def test_profile(self):
+        conf = config.Config()
+        conf.profile = True
+        generator.Generator._check_config(conf)
+        
+        # a pipeline cannot be profiled, unless it is ignored as several workers are used
+        conf.pipeline = True
+        with self.assertRaises(ValueError):
+            generator.Generator._check_config(conf)
+        conf.workers = 2
+        generator.Generator._check_config(conf)
+    
+    def test_reasoner(self):
+        conf = config.Config()
+        self.assertEqual(config.Config.DEFAULT_REASONER, conf.reasoner)
+        generator.Generator._check_config(conf)
+        
+        # specifying the path of DLV selects the same as reasoner
+        conf.dlv = __file__
+        self.assertEqual("dlv", conf.reasoner)
+        generator.Generator._check_config(conf)
+        
+        # any other reasoner conflicts with the path of DLV
+        for reasoner in ["matrix", "native"]:
+            conf.reasoner = reasoner
+            with self.assertRaises(ValueError):
+                generator.Generator._check_config(conf)
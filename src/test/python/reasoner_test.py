@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import tempfile
+import typing
+import unittest
+
+import aspwrapper
+
+from ftdatagen import batch_sampler
+from ftdatagen import config
+from ftdatagen import generator
+from ftdatagen import matrix_solver
+from ftdatagen import native_solver
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ReasonerTest(unittest.TestCase):
+    """Tests that the reasoners compute the same inferences for sampled family trees."""
+    
+    CONFIGS = [(8, 2, 2), (12, 3, 3), (20, 4, 5)]
+    """list[tuple[int, int, int]]: The maximum tree size, tree depth, and branching factor of each configuration that
+    family trees are sampled for.
+    """
+    
+    DLV = os.environ.get("DLV")
+    """str: The path of the DLV executable, or ``None``, if the tests that require DLV are supposed to be skipped."""
+    
+    NUM_TREES = 60
+    """int: The number of family trees that are sampled for each of the :attr:`CONFIGS`."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _sample_facts(cls) -> typing.Iterator[typing.List[aspwrapper.Literal]]:
+        """Samples :attr:`NUM_TREES` family trees for each of the :attr:`CONFIGS`.
+        
+        Yields:
+            list[aspwrapper.Literal]: The facts that describe each of the sampled family trees.
+        """
+        for max_tree_size, max_tree_depth, max_branching_factor in cls.CONFIGS:
+            conf = config.Config()
+            conf.max_branching_factor = max_branching_factor
+            conf.max_tree_depth = max_tree_depth
+            conf.max_tree_size = max_tree_size
+            conf.seed = 0
+            conf.stop_prob = 0.1
+            family_trees = batch_sampler.BatchSampler.sample(conf, range(cls.NUM_TREES))
+            for sample_idx, family_tree in enumerate(family_trees):
+                generator.Generator._name_family_tree(conf, family_tree, sample_idx, 0)
+                yield generator.Generator._create_facts(family_tree)
+    
+    @classmethod
+    def _to_tuples(cls, literals: typing.Iterable) -> typing.Set[typing.Tuple[str, typing.Tuple[str, ...], bool]]:
+        """Converts literals of any type into tuples of predicate, terms, and polarity, which can be compared."""
+        return {(lit.predicate, tuple(lit.terms), lit.positive) for lit in literals}
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_matrix_solver_agrees_with_native_solver(self):
+        matrix = matrix_solver.MatrixSolver()
+        native = native_solver.NativeSolver()
+        for facts in self._sample_facts():
+            for negative_relations in [True, False]:
+                expected = native.run(generator.Generator.ONTOLOGY_PATH, facts, negative_relations=negative_relations)
+                actual = matrix.run(facts, negative_relations=negative_relations)
+                self.assertEqual(self._to_tuples(expected[0].inferences), self._to_tuples(actual[0].inferences))
+    
+    @unittest.skipIf(DLV is None, "the path of the DLV executable is not specified")
+    def test_native_solver_agrees_with_dlv(self):
+        dlv = aspwrapper.DlvSolver(self.DLV)
+        native = native_solver.NativeSolver()
+        for facts in self._sample_facts():
+            expected = dlv.run(generator.Generator.ONTOLOGY_PATH, facts)[0]
+            actual = native.run(generator.Generator.ONTOLOGY_PATH, facts)[0]
+            self.assertEqual(self._to_tuples(expected.inferences), self._to_tuples(actual.inferences))
+    
+    def test_native_solver_raises_errors(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "unstratified.asp")
+            with open(path, "w") as f:
+                f.write("p(X) :- r(X), not q(X).\nq(X) :- r(X), not p(X).\n")
+            with self.assertRaises(ValueError):
+                native_solver.NativeSolver().run(path, [aspwrapper.Literal("r", ["a"])])
+    
+    def test_native_solver_reports_missing_answer_sets(self):
+        facts = [aspwrapper.Literal("female", ["a"]), aspwrapper.Literal("male", ["a"])]
+        self.assertEqual([], native_solver.NativeSolver().run(generator.Generator.ONTOLOGY_PATH, facts))
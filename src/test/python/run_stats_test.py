@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+
+import json
+import typing
+import unittest
+
+from ftdatagen import run_stats as rs
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class RunStatsTest(unittest.TestCase):
+    """Tests accumulating, merging, and serializing the statistics of generation runs."""
+    
+    RELATIONS = ["parentOf", "sisterOf"]
+    """list[str]: The relations that the numbers of inferences are counted for."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _create_sample_stats(cls, tree_size: int, num_relations: int, seed: int) -> typing.Dict[str, typing.Any]:
+        """Creates the statistics of a single sample, as computed by the generator."""
+        return {
+                "tree_size": tree_size,
+                "num_relations": num_relations,
+                "pos_relation_counts": {r: seed + i for i, r in enumerate(cls.RELATIONS)},
+                "neg_relation_counts": {r: 2 * seed + i for i, r in enumerate(cls.RELATIONS)}
+        }
+    
+    def setUp(self):
+        self.samples = [
+                self._create_sample_stats(3, 2, 1),
+                self._create_sample_stats(5, 4, 2),
+                self._create_sample_stats(3, 2, 3),
+                self._create_sample_stats(9, 8, 4)
+        ]
+    
+    def assert_stats_equal(self, expected: rs.RunStats, actual: rs.RunStats) -> None:
+        """Asserts that two ``RunStats`` objects contain the same statistics."""
+        self.assertEqual(expected.num_samples, actual.num_samples)
+        self.assertEqual(dict(expected.tree_size_counts), dict(actual.tree_size_counts))
+        self.assertEqual(dict(expected.total_relations_counts), dict(actual.total_relations_counts))
+        self.assertEqual(dict(expected.pos_relation_counts), dict(actual.pos_relation_counts))
+        self.assertEqual(dict(expected.neg_relation_counts), dict(actual.neg_relation_counts))
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_add(self):
+        stats = rs.RunStats(self.RELATIONS)
+        self.assertEqual(0, stats.num_samples)
+        for sample_stats in self.samples:
+            stats.add(sample_stats)
+        
+        # the counters store observed values only
+        self.assertEqual(4, stats.num_samples)
+        self.assertEqual({3: 2, 5: 1, 9: 1}, dict(stats.tree_size_counts))
+        self.assertEqual({2: 2, 4: 1, 8: 1}, dict(stats.total_relations_counts))
+        self.assertEqual({"parentOf": 10, "sisterOf": 14}, dict(stats.pos_relation_counts))
+        self.assertEqual({"parentOf": 20, "sisterOf": 24}, dict(stats.neg_relation_counts))
+    
+    def test_merge(self):
+        expected = rs.RunStats(self.RELATIONS)
+        for sample_stats in self.samples:
+            expected.add(sample_stats)
+        
+        # the statistics of separate parts of a dataset add up to the ones of the entire dataset
+        parts = [rs.RunStats(self.RELATIONS) for _ in range(3)]
+        for part, sample_stats in zip([0, 1, 0, 1], self.samples):
+            parts[part].add(sample_stats)
+        actual = rs.RunStats(self.RELATIONS)
+        for part in parts:  # -> the last part is empty
+            actual.merge(part)
+        self.assert_stats_equal(expected, actual)
+    
+    def test_to_dict_and_from_dict(self):
+        stats = rs.RunStats(self.RELATIONS)
+        for sample_stats in self.samples:
+            stats.add(sample_stats)
+        
+        # the representation survives a round trip through JSON, which turns all keys into strings
+        state = json.loads(json.dumps(stats.to_dict()))
+        restored = rs.RunStats.from_dict(self.RELATIONS, state)
+        self.assert_stats_equal(stats, restored)
+        self.assertEqual(state, restored.to_dict())
+        
+        # restored statistics can be extended just like the original ones
+        stats.add(self.samples[0])
+        restored.add(self.samples[0])
+        self.assert_stats_equal(stats, restored)
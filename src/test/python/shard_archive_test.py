@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import os
+import tarfile
+import tempfile
+import typing
+import unittest
+
+from ftdatagen import shard_archive
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ShardArchiveTest(unittest.TestCase):
+    """Tests writing datasets with a :class:`shard_archive.ShardWriter` and reading them with a
+    :class:`shard_archive.ShardReader`.
+    """
+    
+    SHARD_SIZE = 4
+    """int: The number of samples per shard that is used for the tests."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _create_sample(cls, sample_idx: int, tag: str="") -> typing.Tuple[str, typing.Dict[str, bytes]]:
+        """Creates a sample that consists of files of different sizes, which includes empty files and files that are
+        larger than a single block of a tar archive.
+        """
+        name = "sample-{:03d}".format(sample_idx)
+        files = collections.OrderedDict()
+        files[name + ".data"] = (tag + name).encode() * (sample_idx * 97)
+        files[name + ".meta"] = tag.encode()
+        
+        return name, files
+    
+    def _write(self, samples: typing.List[typing.Tuple[str, typing.Dict[str, bytes]]], num_samples: int=0) -> None:
+        """Appends the provided samples to the dataset in the temporary directory."""
+        writer = shard_archive.ShardWriter(self.tmp_dir.name, self.SHARD_SIZE, num_samples=num_samples)
+        for sample in samples:
+            writer.write(sample)
+        writer.close()
+    
+    def assert_samples_equal(self, expected: typing.List[typing.Tuple[str, typing.Dict[str, bytes]]]) -> None:
+        """Asserts that the dataset in the temporary directory contains exactly the ``expected`` samples."""
+        reader = shard_archive.ShardReader(self.tmp_dir.name)
+        self.assertEqual(len(expected), len(reader))
+        self.assertEqual([name for name, _ in expected], reader.names)
+        for name, files in expected:
+            self.assertEqual(files, reader[name])
+        
+        # every shard is a valid tar archive that contains the files of all of its samples as well as the manifest
+        for shard_idx in range(0, len(expected), self.SHARD_SIZE):
+            path = os.path.join(
+                    self.tmp_dir.name,
+                    shard_archive.ShardWriter.ARCHIVE_FILE_PATTERN.format(shard_idx // self.SHARD_SIZE)
+            )
+            with tarfile.open(path) as archive:
+                members = archive.getnames()
+                self.assertEqual(shard_archive.ShardWriter.MANIFEST_MEMBER_NAME, members[-1])
+                for _, files in expected[shard_idx:shard_idx + self.SHARD_SIZE]:
+                    for file_name, data in files.items():
+                        self.assertEqual(data, archive.extractfile(file_name).read())
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_encode_and_extract(self):
+        name, files = self._create_sample(7, tag="x")
+        for file_name, data in files.items():
+            with open(os.path.join(self.tmp_dir.name, file_name), "wb") as f:
+                f.write(data)
+        self.assertEqual((name, files), shard_archive.ShardWriter.encode(self.tmp_dir.name, name))
+        
+        self._write([(name, files)])
+        with tempfile.TemporaryDirectory() as target_dir:
+            shard_archive.ShardReader(self.tmp_dir.name).extract(name, target_dir)
+            self.assertEqual((name, files), shard_archive.ShardWriter.encode(target_dir, name))
+    
+    def test_resume(self):
+        samples = [self._create_sample(i) for i in range(10)]
+        self._write(samples)
+        
+        # additional samples are discarded, if a run is resumed, both within the last shard to keep and after it
+        for num_samples in [6, 4]:
+            replacements = [self._create_sample(i, tag="new") for i in range(num_samples, num_samples + 3)]
+            self._write(replacements, num_samples=num_samples)
+            self.assert_samples_equal(samples[:num_samples] + replacements)
+        
+        # a dataset cannot be resumed from more samples than it contains
+        with self.assertRaises(ValueError):
+            shard_archive.ShardWriter(self.tmp_dir.name, self.SHARD_SIZE, num_samples=10)
+    
+    def test_round_trip(self):
+        samples = [self._create_sample(i) for i in range(10)]
+        self._write(samples)
+        self.assert_samples_equal(samples)
+        self.assertEqual(
+                sorted(
+                        [shard_archive.ShardWriter.ARCHIVE_FILE_PATTERN.format(i) for i in range(3)] +
+                        [shard_archive.ShardWriter.MANIFEST_FILE_PATTERN.format(i) for i in range(3)]
+                ),
+                sorted(os.listdir(self.tmp_dir.name))
+        )
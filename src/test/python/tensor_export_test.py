@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+
+import tempfile
+import typing
+import unittest
+
+import numpy as np
+
+from ftdatagen import batch_sampler
+from ftdatagen import config
+from ftdatagen import generator
+from ftdatagen import tensor_export
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TensorExportTest(unittest.TestCase):
+    """Tests writing datasets with a :class:`tensor_export.TensorWriter` and reading them with a
+    :class:`tensor_export.TensorReader`.
+    """
+    
+    CLASSES = ["female", "male"]
+    """list[str]: The classes that are used for the tests."""
+    
+    RELATIONS = ["parentOf", "siblingOf", "marriedTo"]
+    """list[str]: The relations that are used for the tests."""
+    
+    #  METHODS  ########################################################################################################
+    
+    def _create_sample(self, num_individuals: int, num_facts: int, num_inferences: int) -> typing.Dict[str, np.ndarray]:
+        """Creates a random sample of the specified size."""
+        def create_triples(num_triples: int) -> np.ndarray:
+            return np.stack(
+                    [
+                            self.rng.randint(num_individuals, size=num_triples),
+                            self.rng.randint(len(self.RELATIONS), size=num_triples),
+                            self.rng.randint(num_individuals, size=num_triples),
+                            self.rng.randint(2, size=num_triples)
+                    ],
+                    axis=1
+            ).astype(np.int32)
+        
+        return {
+                "genders": self.rng.randint(-1, len(self.CLASSES), size=num_individuals).astype(np.int8),
+                "facts": create_triples(num_facts),
+                "inferences": create_triples(num_inferences)
+        }
+    
+    def _write(self, samples: typing.List[typing.Dict[str, np.ndarray]], num_samples: int=0) -> None:
+        """Appends the provided samples to the dataset in the temporary directory."""
+        writer = tensor_export.TensorWriter(self.tmp_dir.name, self.CLASSES, self.RELATIONS, num_samples=num_samples)
+        for sample in samples:
+            writer.write(sample)
+        writer.close()
+    
+    def assert_samples_equal(self, expected: typing.List[typing.Dict[str, np.ndarray]]) -> None:
+        """Asserts that the dataset in the temporary directory contains exactly the ``expected`` samples."""
+        reader = tensor_export.TensorReader(self.tmp_dir.name)
+        self.assertEqual(len(expected), len(reader))
+        for expected_sample, actual_sample in zip(expected, (reader[i] for i in range(len(reader)))):
+            self.assertEqual(sorted(expected_sample.keys()), sorted(actual_sample.keys()))
+            for name, values in expected_sample.items():
+                self.assertEqual(values.dtype, actual_sample[name].dtype)
+                np.testing.assert_array_equal(values, actual_sample[name])
+    
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_encode(self):
+        conf = config.Config()
+        conf.max_tree_size = 12
+        conf.seed = 0
+        conf.stop_prob = 0.1
+        for sample_idx, family_tree in enumerate(batch_sampler.BatchSampler.sample(conf, range(20))):
+            generator.Generator._name_family_tree(conf, family_tree, sample_idx, 0)
+            facts = generator.Generator._create_facts(family_tree)
+            arrays = tensor_export.TensorWriter.encode(
+                    family_tree, facts, [], generator.Generator.CLASSES, generator.Generator.RELATIONS
+            )
+            
+            # every individual belongs to a class
+            self.assertEqual(len(family_tree), len(arrays["genders"]))
+            self.assertTrue(np.all(arrays["genders"] >= 0))
+            self.assertEqual((0, 4), arrays["inferences"].shape)
+            
+            # decoding the facts restores all literals of relations
+            names = family_tree.names
+            decoded = {
+                    (generator.Generator.RELATIONS[r], (names[s], names[o]), bool(p))
+                    for s, r, o, p in arrays["facts"].tolist()
+            }
+            expected = {(f.predicate, tuple(f.terms), f.positive) for f in facts if len(f.terms) == 2}
+            self.assertEqual(expected, decoded)
+            self.assertEqual(len(expected), len(arrays["facts"]))
+    
+    def test_resume(self):
+        samples = [self._create_sample(i + 2, 2 * i, 3 * i) for i in range(6)]
+        self._write(samples)
+        
+        # additional samples are discarded, if a run is resumed
+        replacements = [self._create_sample(4, 5, 6) for _ in range(2)]
+        self._write(replacements, num_samples=3)
+        self.assert_samples_equal(samples[:3] + replacements)
+        
+        # a dataset cannot be resumed from more samples than it contains
+        with self.assertRaises(ValueError):
+            tensor_export.TensorWriter(self.tmp_dir.name, self.CLASSES, self.RELATIONS, num_samples=6)
+    
+    def test_round_trip(self):
+        # samples may be empty
+        samples = [self._create_sample(0, 0, 0)] + [self._create_sample(i + 1, 2 * i, 3 * i + 1) for i in range(10)]
+        self._write(samples)
+        self.assert_samples_equal(samples)
+        
+        reader = tensor_export.TensorReader(self.tmp_dir.name)
+        self.assertEqual(self.CLASSES, reader.classes)
+        self.assertEqual(self.RELATIONS, reader.relations)
+        self.assertEqual((len(samples), tensor_export.TensorReader.OFFSETS_WIDTH), reader.offsets.shape)
+        
+        # an empty dataset may be read as well
+        self._write([], num_samples=0)
+        self.assert_samples_equal([])
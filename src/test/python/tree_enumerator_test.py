@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from ftdatagen import batch_sampler
+from ftdatagen import config
+from ftdatagen import tree_enumerator
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TreeEnumeratorTest(unittest.TestCase):
+    """Tests that :class:`tree_enumerator.TreeEnumerator` enumerates the same family trees that may be sampled."""
+    
+    CONFIGS = [(5, 2, 5), (6, 2, 6), (7, 3, 7), (7, 3, 1), (8, 2, 2)]
+    """list[tuple[int, int, int]]: The maximum tree size, branching factor, and tree depth of each configuration that
+    family trees are enumerated for, where the depth limit only applies to the last ones.
+    """
+    
+    NUM_TREES = 20000
+    """int: The number of family trees that are sampled for each of the :attr:`CONFIGS`."""
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_enumerate_canonical_forms(self):
+        for max_tree_size, max_branching_factor, max_tree_depth in self.CONFIGS:
+            conf = config.Config()
+            conf.max_branching_factor = max_branching_factor
+            conf.max_tree_depth = max_tree_depth
+            conf.max_tree_size = max_tree_size
+            conf.stop_prob = 0.1
+            enumerated = list(tree_enumerator.TreeEnumerator.enumerate_canonical_forms(conf))
+            family_trees = batch_sampler.BatchSampler.sample(conf, range(self.NUM_TREES))
+            
+            # every family tree is enumerated exactly once
+            self.assertEqual(len(enumerated), len(set(enumerated)))
+            
+            # the enumerated family trees are exactly the ones that are sampled, which includes the ones that exceed
+            # max_tree_size by one, unless the depth limit prevents this
+            self.assertEqual(set(tree_index.TreeIndex.canonical_form(t) for t in family_trees), set(enumerated))
+            if max_tree_depth >= max_tree_size:
+                self.assertEqual(batch_sampler.BatchSampler.max_size(conf), max(len(t) for t in family_trees))
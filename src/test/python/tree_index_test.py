@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+
+import random
+import typing
+import unittest
+
+import numpy as np
+
+from ftdatagen import batch_sampler
+from ftdatagen import config
+from ftdatagen import family_tree as ft
+from ftdatagen import tree_index
+
+
+__author__ = "ftdatagen contributors"
+__copyright__ = (
+        "Copyright (c) 2026, ftdatagen contributors\n"
+        "All rights reserved.\n"
+        "\n"
+        "Redistribution and use in source and binary forms, with or without\n"
+        "modification, are permitted provided that the following conditions are met:\n"
+        "\n"
+        "1. Redistributions of source code must retain the above copyright notice, this\n"
+        "   list of conditions and the following disclaimer.\n"
+        "2. Redistributions in binary form must reproduce the above copyright notice,\n"
+        "   this list of conditions and the following disclaimer in the documentation\n"
+        "   and/or other materials provided with the distribution.\n"
+        "\n"
+        "THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS \"AS IS\" AND\n"
+        "ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED\n"
+        "WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE\n"
+        "DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR\n"
+        "ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES\n"
+        "(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;\n"
+        "LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND\n"
+        "ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n"
+        "(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS\n"
+        "SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE."
+)
+__license__ = "BSD-2-Clause"
+__version__ = "2026.1"
+__date__ = "Oct 17, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class TreeIndexTest(unittest.TestCase):
+    """Tests :class:`tree_index.TreeIndex` against a brute-force isomorphism check."""
+    
+    NUM_TREES = 300
+    """int: The number of family trees that are sampled for the tests."""
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _find_isomorphism(cls, first: ft.FamilyTree, second: ft.FamilyTree) -> typing.Optional[typing.List[int]]:
+        """Searches for an isomorphism between two family trees by means of backtracking.
+        
+        An isomorphism maps every person of ``first`` onto a person of ``second`` such that spouses are mapped onto
+        spouses and parents onto parents of the same child. The genders of the persons are not taken into account.
+        
+        Args:
+            first (:class:`family_tree.FamilyTree`): The first family tree.
+            second (:class:`family_tree.FamilyTree`): The second family tree.
+        
+        Returns:
+            list[int]: The person of ``second`` that every person of ``first`` is mapped onto, or ``None``, if the
+                family trees are not isomorphic.
+        """
+        if len(first) != len(second):
+            return None
+        
+        def relatives(tree: ft.FamilyTree) -> typing.List[typing.Tuple[int, typing.FrozenSet[int]]]:
+            return [
+                    (s, frozenset([m, f]) - {ft.FamilyTree.NO_PERSON})
+                    for s, m, f in zip(tree.spouse.tolist(), tree.mother.tolist(), tree.father.tolist())
+            ]
+        
+        first_relatives = relatives(first)
+        second_relatives = relatives(second)
+        mapping = []
+        used = set()
+        
+        def is_consistent(person: int) -> bool:
+            image = mapping[person]
+            spouse, parents = first_relatives[person]
+            image_spouse, image_parents = second_relatives[image]
+            if (spouse == ft.FamilyTree.NO_PERSON) != (image_spouse == ft.FamilyTree.NO_PERSON):
+                return False
+            if len(parents) != len(image_parents):
+                return False
+            for other in range(person):
+                other_spouse, other_parents = first_relatives[other]
+                other_image_spouse, other_image_parents = second_relatives[mapping[other]]
+                if (spouse == other) != (image_spouse == mapping[other]):
+                    return False
+                if (other in parents) != (mapping[other] in image_parents):
+                    return False
+                if (person in other_parents) != (image in other_image_parents):
+                    return False
+            return True
+        
+        def extend() -> bool:
+            if len(mapping) == len(first):
+                return True
+            for image in range(len(second)):
+                if image in used:
+                    continue
+                mapping.append(image)
+                used.add(image)
+                if is_consistent(len(mapping) - 1) and extend():
+                    return True
+                mapping.pop()
+                used.remove(image)
+            return False
+        
+        return mapping if extend() else None
+    
+    @classmethod
+    def _permute(cls, family_tree: ft.FamilyTree, order: typing.List[int]) -> ft.FamilyTree:
+        """Reorders the persons in a family tree.
+        
+        Args:
+            family_tree (:class:`family_tree.FamilyTree`): The family tree to reorder.
+            order (list[int]): The index of the person that is moved to each position.
+        
+        Returns:
+            :class:`family_tree.FamilyTree`: The reordered family tree.
+        """
+        order = np.array(order)
+        position = np.argsort(order)
+        
+        def relabel(relatives: np.ndarray) -> np.ndarray:
+            relatives = relatives[order]
+            return np.where(relatives == ft.FamilyTree.NO_PERSON, relatives, position[relatives])
+        
+        return ft.FamilyTree.from_arrays(
+                family_tree.female[order],
+                family_tree.level[order],
+                relabel(family_tree.mother),
+                relabel(family_tree.father),
+                relabel(family_tree.spouse),
+                family_tree.num_children[order]
+        )
+    
+    def setUp(self):
+        conf = config.Config()
+        conf.max_branching_factor = 3
+        conf.max_tree_depth = 3
+        conf.max_tree_size = 9
+        conf.stop_prob = 0.2
+        self.family_trees = batch_sampler.BatchSampler.sample(conf, range(self.NUM_TREES))
+        self.rng = random.Random(0)
+    
+    #  TEST CASES  #####################################################################################################
+    
+    def test_add(self):
+        index = tree_index.TreeIndex()
+        forms = set()
+        for family_tree in self.family_trees:
+            canonical_form = index.canonical_form(family_tree)
+            self.assertEqual(canonical_form not in forms, index.add(family_tree))
+            forms.add(canonical_form)
+            order = list(range(len(family_tree)))
+            self.rng.shuffle(order)
+            self.assertIn(self._permute(family_tree, order), index)
+            self.assertFalse(index.add(self._permute(family_tree, order)))
+        self.assertEqual(len(forms), len(index))
+    
+    def test_canonical_form(self):
+        forms = [tree_index.TreeIndex.canonical_form(t) for t in self.family_trees]
+        
+        # canonical forms are equal if and only if the family trees are isomorphic
+        for i, first in enumerate(self.family_trees):
+            for j in range(i + 1, len(self.family_trees)):
+                isomorphic = self._find_isomorphism(first, self.family_trees[j]) is not None
+                self.assertEqual(isomorphic, forms[i] == forms[j])
+        
+        # canonical forms do not depend on the order of the persons
+        for family_tree, canonical_form in zip(self.family_trees, forms):
+            order = list(range(len(family_tree)))
+            self.rng.shuffle(order)
+            permuted = self._permute(family_tree, order)
+            self.assertEqual(canonical_form, tree_index.TreeIndex.canonical_form(permuted))
+            self.assertEqual(
+                    tree_index.TreeIndex.canonical_form(family_tree, genders=True),
+                    tree_index.TreeIndex.canonical_form(permuted, genders=True)
+            )
+    
+    def test_canonical_labeling(self):
+        for family_tree in self.family_trees:
+            order = list(range(len(family_tree)))
+            self.rng.shuffle(order)
+            permuted = self._permute(family_tree, order)
+            first_form, first_order = tree_index.TreeIndex.canonical_labeling(family_tree, genders=True)
+            second_form, second_order = tree_index.TreeIndex.canonical_labeling(permuted, genders=True)
+            self.assertEqual(first_form, second_form)
+            
+            # mapping persons at the same canonical positions onto each other preserves relatives and genders
+            mapping = dict(zip(first_order, second_order))
+            for person, image in mapping.items():
+                self.assertEqual(family_tree.female[person], permuted.female[image])
+                for relatives in ["mother", "father", "spouse"]:
+                    relative = getattr(family_tree, relatives)[person]
+                    image_relative = getattr(permuted, relatives)[image]
+                    self.assertEqual(relative == ft.FamilyTree.NO_PERSON, image_relative == ft.FamilyTree.NO_PERSON)
+                    if relative != ft.FamilyTree.NO_PERSON:
+                        self.assertEqual(mapping[relative], image_relative)